@@ -0,0 +1,463 @@
+#!/usr/bin/env python3
+"""
+Benchmark do seedServices contra um Postgres local: laço sequencial x lotes
+
+Reproduz, em Python, as consultas que cada modelo de index.ts gerado pelo
+`digiurban-tools extract` faz no banco:
+
+  sequential  (--seed-mode sequential, padrão) para cada serviço um
+              SELECT por (name, departmentId) e um INSERT ou UPDATE, cada
+              um na sua própria transação (autocommit), um serviço por vez
+  batched     (--seed-mode batched) secretarias em paralelo, no máximo
+              --concurrency conexões; por secretaria um SELECT dos serviços
+              existentes e um BEGIN/COMMIT a cada --chunk-size escritas
+
+Cada modo roda três cenários sobre as mesmas tabelas:
+
+  inicial     tabela vazia: todos os serviços são criados
+  reseed      mesmo catálogo de novo: tudo é pulado pelo contentFingerprint
+  alterado    ALTERED_FRACTION dos serviços com descrição nova: updates
+
+As tabelas ficam em um schema temporário (seed_bench_<pid>) criado e
+removido pelo próprio script, com departments e services_simplified no
+formato do schema.prisma (com o @@unique([name, departmentId])); nenhuma tabela
+real é lida ou escrita. O tempo não inclui o overhead do Prisma Client
+(serialização, query engine), só as idas ao banco e o trabalho delas;
+serve para comparar os padrões de consulta, não para prever o tempo do
+`npm run db:seed`.
+
+Requer psycopg (3) ou psycopg2 instalado.
+
+Exemplos:
+  python benchmark-seed-db.py --database-url postgresql://postgres@localhost/digiurban_dev
+  python benchmark-seed-db.py --database-url $DATABASE_URL --size 500 --departments 13 --concurrency 8
+  python benchmark-seed-db.py --database-url $DATABASE_URL --catalog --modes batched --chunk-size 100
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+# Drivers opcionais: o psycopg 3 tem preferência; sem nenhum o script só mostra o --help
+try:
+    import psycopg
+except ImportError:
+    psycopg = None
+try:
+    import psycopg2
+except ImportError:
+    psycopg2 = None
+
+from digiurban_tools import synthetic
+from digiurban_tools.arguments import positive_int
+from digiurban_tools.commands.extract import DEFAULT_SEED_CHUNK_SIZE, DEFAULT_SEED_CONCURRENCY
+from digiurban_tools.fingerprint import service_fingerprint
+from digiurban_tools.paths import CACHE_DIR, REPO_ROOT, SERVICES_SEEDS_DIR
+
+RESULTS_VERSION = 1
+DEFAULT_RESULTS = os.path.join(CACHE_DIR, 'benchmark-seed-db-results.json')
+MODES = ('sequential', 'batched')
+SCENARIOS = ('inicial', 'reseed', 'alterado')
+
+# Fração dos serviços com descrição nova no cenário `alterado`
+ALTERED_FRACTION = 0.2
+
+# Colunas que o seedServices escreve, fora name/departmentId
+DATA_COLUMNS = ('description', 'serviceType', 'moduleType', 'formSchema', 'requiresDocuments',
+                'requiredDocuments', 'estimatedDays', 'priority', 'category', 'icon', 'color',
+                'isActive', 'contentFingerprint')
+_JSON_COLUMNS = {'formSchema', 'requiredDocuments'}
+
+# ---------------------------------------------------------------------------
+# Banco
+# ---------------------------------------------------------------------------
+
+def connect(url, schema):
+    """Conexão em autocommit com o search_path no schema do benchmark"""
+    if psycopg is not None:
+        conn = psycopg.connect(url, autocommit=True)
+    else:
+        conn = psycopg2.connect(url)
+        conn.autocommit = True
+    with conn.cursor() as cur:
+        cur.execute(f'SET search_path TO "{schema}"')
+    return conn
+
+
+def create_schema(conn, schema, department_codes):
+    with conn.cursor() as cur:
+        cur.execute(f'DROP SCHEMA IF EXISTS "{schema}" CASCADE')
+        cur.execute(f'CREATE SCHEMA "{schema}"')
+        cur.execute(f'SET search_path TO "{schema}"')
+        cur.execute('''
+            CREATE TYPE "ServiceType" AS ENUM ('COM_DADOS', 'SEM_DADOS');
+            CREATE TABLE "departments" (
+                "id" text PRIMARY KEY,
+                "code" text UNIQUE NOT NULL
+            );
+            CREATE TABLE "services_simplified" (
+                "id" text PRIMARY KEY,
+                "name" text NOT NULL,
+                "description" text,
+                "departmentId" text NOT NULL REFERENCES "departments"("id"),
+                "serviceType" "ServiceType" NOT NULL,
+                "moduleType" text,
+                "formSchema" jsonb,
+                "isActive" boolean NOT NULL DEFAULT true,
+                "requiresDocuments" boolean NOT NULL DEFAULT false,
+                "requiredDocuments" jsonb,
+                "estimatedDays" integer,
+                "priority" integer NOT NULL DEFAULT 3,
+                "category" text,
+                "icon" text,
+                "color" text,
+                "contentFingerprint" text,
+                "createdAt" timestamp(3) NOT NULL DEFAULT now(),
+                "updatedAt" timestamp(3) NOT NULL
+            );
+            CREATE UNIQUE INDEX "services_simplified_name_departmentId_key"
+                ON "services_simplified" ("name", "departmentId");
+        ''')
+        for code in department_codes:
+            cur.execute('INSERT INTO "departments" ("id", "code") VALUES (%s, %s)', (str(uuid.uuid4()), code))
+
+
+def drop_schema(conn, schema):
+    with conn.cursor() as cur:
+        cur.execute(f'DROP SCHEMA IF EXISTS "{schema}" CASCADE')
+
+
+def department_ids(conn):
+    with conn.cursor() as cur:
+        cur.execute('SELECT "code", "id" FROM "departments"')
+        return dict(cur.fetchall())
+
+
+def truncate_services(conn):
+    with conn.cursor() as cur:
+        cur.execute('TRUNCATE "services_simplified"')
+
+# ---------------------------------------------------------------------------
+# Consultas do seedServices
+# ---------------------------------------------------------------------------
+
+def service_values(definition):
+    """Valores das DATA_COLUMNS como o seedServices grava (undefined vira NULL na criação)"""
+    values = []
+    for column in DATA_COLUMNS:
+        if column == 'isActive':
+            value = True
+        elif column == 'contentFingerprint':
+            value = definition['contentFingerprint']
+        else:
+            value = definition.get(column)
+        if column in _JSON_COLUMNS:
+            value = json.dumps(value, ensure_ascii=False) if value else None
+        values.append(value)
+    return values
+
+
+def _placeholder(column):
+    if column in _JSON_COLUMNS:
+        return '%s::jsonb'
+    if column == 'serviceType':
+        return '%s::"ServiceType"'
+    return '%s'
+
+
+def _assignment(column):
+    if column in _JSON_COLUMNS:
+        # `valor || undefined`: vazio não sobrescreve o que já está gravado
+        return f'"{column}" = COALESCE({_placeholder(column)}, "{column}")'
+    return f'"{column}" = {_placeholder(column)}'
+
+
+INSERT_SQL = (
+    'INSERT INTO "services_simplified" ("id", "name", "departmentId", '
+    + ''.join(f'"{column}", ' for column in DATA_COLUMNS)
+    + '"updatedAt") VALUES (%s, %s, %s, '
+    + ''.join(f'{_placeholder(column)}, ' for column in DATA_COLUMNS)
+    + 'now())'
+)
+UPDATE_SQL = (
+    'UPDATE "services_simplified" SET '
+    + ''.join(f'{_assignment(column)}, ' for column in DATA_COLUMNS)
+    + '"updatedAt" = now() WHERE "id" = %s'
+)
+
+
+def _is_unchanged(existing, definition):
+    _id, is_active, fingerprint = existing
+    return fingerprint is not None and fingerprint == definition['contentFingerprint'] and is_active
+
+
+def _write(cur, existing, definition, department_id):
+    """INSERT ou UPDATE de um serviço; retorna 'created' ou 'updated'"""
+    if existing:
+        cur.execute(UPDATE_SQL, service_values(definition) + [existing[0]])
+        return 'updated'
+    cur.execute(INSERT_SQL, [str(uuid.uuid4()), definition['name'], department_id] + service_values(definition))
+    return 'created'
+
+
+def seed_sequential(conn, services, departments):
+    """Laço do modelo sequencial: findFirst + create/update por serviço, em autocommit"""
+    counts = {'created': 0, 'updated': 0, 'unchanged': 0}
+    with conn.cursor() as cur:
+        for definition in services:
+            department_id = departments.get(definition['departmentCode'])
+            if department_id is None:
+                continue
+            cur.execute('SELECT "id", "isActive", "contentFingerprint" FROM "services_simplified" '
+                        'WHERE "name" = %s AND "departmentId" = %s LIMIT 1',
+                        (definition['name'], department_id))
+            existing = cur.fetchone()
+            if existing and _is_unchanged(existing, definition):
+                counts['unchanged'] += 1
+                continue
+            counts[_write(cur, existing, definition, department_id)] += 1
+    return counts, {}
+
+
+def _seed_department(url, schema, code, services, department_id, chunk_size):
+    """seedDepartment do modelo em lotes, na sua própria conexão; retorna (contagens, ms)"""
+    start = time.perf_counter()
+    counts = {'created': 0, 'updated': 0, 'unchanged': 0}
+
+    unique = list({definition['name']: definition for definition in services}.values())
+    conn = connect(url, schema)
+    try:
+        with conn.cursor() as cur:
+            cur.execute('SELECT "name", "id", "isActive", "contentFingerprint" FROM "services_simplified" '
+                        'WHERE "departmentId" = %s AND "name" = ANY(%s)',
+                        (department_id, [definition['name'] for definition in unique]))
+            existing_by_name = {row[0]: row[1:] for row in cur.fetchall()}
+
+            for first in range(0, len(unique), chunk_size):
+                pending = []
+                for definition in unique[first:first + chunk_size]:
+                    existing = existing_by_name.get(definition['name'])
+                    if existing and _is_unchanged(existing, definition):
+                        counts['unchanged'] += 1
+                    else:
+                        pending.append((existing, definition))
+                if not pending:
+                    continue
+                cur.execute('BEGIN')
+                for existing, definition in pending:
+                    counts[_write(cur, existing, definition, department_id)] += 1
+                cur.execute('COMMIT')
+    finally:
+        conn.close()
+    return counts, (time.perf_counter() - start) * 1000
+
+
+def seed_batched(url, schema, services, departments, concurrency, chunk_size):
+    """Modelo em lotes: uma tarefa por secretaria, no máximo `concurrency` ao mesmo tempo"""
+    groups = {}
+    for definition in services:
+        if definition['departmentCode'] in departments:
+            groups.setdefault(definition['departmentCode'], []).append(definition)
+
+    counts = {'created': 0, 'updated': 0, 'unchanged': 0}
+    department_ms = {}
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        futures = {
+            code: pool.submit(_seed_department, url, schema, code, group, departments[code], chunk_size)
+            for code, group in groups.items()
+        }
+        for code, future in futures.items():
+            department_counts, ms = future.result()
+            for key, value in department_counts.items():
+                counts[key] += value
+            department_ms[code] = round(ms, 1)
+    return counts, department_ms
+
+# ---------------------------------------------------------------------------
+# Dados
+# ---------------------------------------------------------------------------
+
+def synthetic_services(department_count, size, seed):
+    services = []
+    for department in synthetic.select_departments(department_count):
+        rng = random.Random(f'{seed}:{department.code}')
+        services += [synthetic.service_definition(department, n, rng) for n in range(1, size + 1)]
+    return services
+
+
+def catalog_services(seeds_dir):
+    from digiurban_tools.catalog import build_catalog
+
+    services, _issues, _sources = build_catalog(seeds_dir)
+    return services
+
+
+def with_fingerprints(services):
+    return [dict(definition, contentFingerprint=service_fingerprint(definition)) for definition in services]
+
+
+def altered(services, seed):
+    """Cópia com ALTERED_FRACTION das descrições trocadas (e fingerprints recalculados)"""
+    rng = random.Random(f'{seed}:alterado')
+    result = []
+    for definition in services:
+        if rng.random() < ALTERED_FRACTION:
+            definition = dict(definition, description=f"{definition.get('description') or ''} (revisado)")
+            definition['contentFingerprint'] = service_fingerprint(
+                {k: v for k, v in definition.items() if k != 'contentFingerprint'})
+        result.append(definition)
+    return result
+
+# ---------------------------------------------------------------------------
+# Resultados
+# ---------------------------------------------------------------------------
+
+def _git_commit():
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT,
+                                capture_output=True, text=True)
+    except OSError:
+        return None
+    return result.stdout.strip() or None
+
+def load_results(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {'version': RESULTS_VERSION, 'runs': []}
+    if data.get('version') != RESULTS_VERSION:
+        return {'version': RESULTS_VERSION, 'runs': []}
+    return data
+
+def save_results(data, path):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+    os.replace(tmp_path, path)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--database-url', default=os.environ.get('DATABASE_URL'),
+                        help='Postgres local (padrao: $DATABASE_URL); so o schema temporario e alterado')
+    parser.add_argument('--size', type=int, default=200,
+                        help='servicos sinteticos por departamento (padrao: 200)')
+    parser.add_argument('--departments', type=int, default=13,
+                        help='quantos departamentos gerar, 1 a 13 (padrao: 13)')
+    parser.add_argument('--catalog', action='store_true',
+                        help='usa o catalogo real dos seeds em vez de dados sinteticos')
+    parser.add_argument('--seeds-dir', default=SERVICES_SEEDS_DIR,
+                        help='seeds do --catalog (padrao: prisma/seeds/services)')
+    parser.add_argument('--modes', default=','.join(MODES),
+                        help='modos a medir (padrao: sequential,batched)')
+    parser.add_argument('--concurrency', type=positive_int, default=DEFAULT_SEED_CONCURRENCY,
+                        help=f'batched: secretarias em paralelo (padrao: {DEFAULT_SEED_CONCURRENCY})')
+    parser.add_argument('--chunk-size', type=positive_int, default=DEFAULT_SEED_CHUNK_SIZE,
+                        help=f'batched: escritas por transacao (padrao: {DEFAULT_SEED_CHUNK_SIZE})')
+    parser.add_argument('--seed', type=int, default=0, help='semente dos dados sinteticos')
+    parser.add_argument('--results', default=DEFAULT_RESULTS,
+                        help='arquivo JSON de resultados (acrescenta uma execucao)')
+    args = parser.parse_args()
+
+    if psycopg is None and psycopg2 is None:
+        print("ERRO: instale o driver do Postgres: pip install 'psycopg[binary]' (ou psycopg2-binary)")
+        return 1
+    if not args.database_url:
+        parser.error('informe --database-url (ou defina DATABASE_URL)')
+    if not 1 <= args.departments <= 13:
+        parser.error('--departments deve estar entre 1 e 13')
+    modes = [m.strip() for m in args.modes.split(',') if m.strip()]
+    unknown = [m for m in modes if m not in MODES]
+    if unknown:
+        parser.error(f"modos desconhecidos: {', '.join(unknown)}")
+
+    if args.catalog:
+        services = with_fingerprints(catalog_services(args.seeds_dir))
+    else:
+        services = with_fingerprints(synthetic_services(args.departments, args.size, args.seed))
+    scenarios = {'inicial': services, 'reseed': services, 'alterado': altered(services, args.seed)}
+    codes = sorted({definition['departmentCode'] for definition in services})
+
+    schema = f'seed_bench_{os.getpid()}'
+    data = load_results(args.results)
+    run = {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'driver': 'psycopg' if psycopg is not None else 'psycopg2',
+        'source': 'catalog' if args.catalog else f'synthetic:{args.departments}x{args.size}',
+        'services': len(services),
+        'concurrency': args.concurrency,
+        'chunk_size': args.chunk_size,
+        'results': [],
+    }
+
+    print(f"{len(services)} servicos em {len(codes)} secretarias, schema temporario {schema}\n")
+    print(f"{'modo':11} {'cenario':9} {'tempo (s)':>10} {'criados':>8} {'atualiz.':>8} {'iguais':>8} "
+          f"{'servicos/s':>11}  secretaria mais lenta")
+    print('-' * 90)
+
+    admin = connect(args.database_url, 'public')
+    try:
+        create_schema(admin, schema, codes)
+        departments = department_ids(admin)
+        sequential_conn = connect(args.database_url, schema)
+        try:
+            for mode in modes:
+                truncate_services(admin)
+                for scenario in SCENARIOS:
+                    start = time.perf_counter()
+                    if mode == 'sequential':
+                        counts, department_ms = seed_sequential(sequential_conn, scenarios[scenario], departments)
+                    else:
+                        counts, department_ms = seed_batched(args.database_url, schema, scenarios[scenario],
+                                                             departments, args.concurrency, args.chunk_size)
+                    wall_s = time.perf_counter() - start
+
+                    row = {
+                        'mode': mode,
+                        'scenario': scenario,
+                        'wall_s': round(wall_s, 6),
+                        **counts,
+                        'services_per_s': round(len(services) / wall_s, 1) if wall_s else None,
+                        'department_ms': department_ms,
+                    }
+                    run['results'].append(row)
+
+                    slowest = ''
+                    if department_ms:
+                        code = max(department_ms, key=department_ms.get)
+                        slowest = f"{code} ({department_ms[code]:.0f} ms)"
+                    print(f"{mode:11} {scenario:9} {wall_s:>10.3f} {counts['created']:>8} {counts['updated']:>8} "
+                          f"{counts['unchanged']:>8} {row['services_per_s'] or 0:>11.0f}  {slowest}")
+        finally:
+            sequential_conn.close()
+    finally:
+        drop_schema(admin, schema)
+        admin.close()
+
+    if set(modes) == set(MODES):
+        print()
+        for scenario in SCENARIOS:
+            times = {row['mode']: row['wall_s'] for row in run['results'] if row['scenario'] == scenario}
+            if times['batched']:
+                print(f"{scenario}: sequential / batched = {times['sequential'] / times['batched']:.1f}x")
+
+    data['runs'].append(run)
+    save_results(data, args.results)
+    print(f"\nResultados gravados em {args.results}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Benchmark das ferramentas de seeds com catálogos sintéticos
+
+Gera arquivos no formato de services-simplified-complete.ts e dos
+*.seed.ts (formSchema aninhado, citizenFields, fields com patterns) com
+N serviços por departamento e mede, para cada tamanho:
+
+  extract     digiurban-tools extract: fonte -> seeds modulares + index.ts
+  analyze     digiurban-tools analyze: contagem e diff fonte x seeds
+  dedupe      digiurban-tools dedupe: nomes repetidos por arquivo
+  merge       digiurban-tools merge: adiciona os ~10% faltantes
+  total       extract + `merge dedupe analyze` encadeados, no mesmo processo
+
+Cada medição roda em um processo separado para que o pico de memória
+(RSS) seja o da fase. Os resultados (tempo, pico de RSS, serviços/s) são
+acrescentados a um arquivo JSON, comparando com a execução anterior.
+
+Exemplos:
+  python benchmark-seed-tools.py
+  python benchmark-seed-tools.py --sizes 100,1000,10000,50000 --departments 13
+  python benchmark-seed-tools.py --phases merge --repeat 3
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+try:
+    import resource
+except ImportError:  # Windows: sem ru_maxrss, o pico de RSS fica como null
+    resource = None
+
+from digiurban_tools import synthetic
+from digiurban_tools.paths import CACHE_DIR, REPO_ROOT
+
+RESULTS_VERSION = 1
+DEFAULT_RESULTS = os.path.join(CACHE_DIR, 'benchmark-results.json')
+DEFAULT_SIZES = '100,1000,10000,50000'
+PHASES = ('extract', 'analyze', 'dedupe', 'merge')
+
+# Fração dos serviços presente nos seeds antes do merge
+MERGE_PRESENT = 0.9
+
+SOURCE_NAME = 'services-simplified-complete.ts'
+
+# ---------------------------------------------------------------------------
+# Dados sintéticos
+# ---------------------------------------------------------------------------
+
+def prepare(workdir, departments, size, seed):
+    """Gera fonte e seeds desatualizados (MERGE_PRESENT dos serviços)"""
+    os.makedirs(workdir, exist_ok=True)
+    stale_dir = os.path.join(workdir, 'stale')
+    os.makedirs(stale_dir, exist_ok=True)
+
+    sections = []
+    for department in departments:
+        services = synthetic.department_services(department, size, seed)
+        sections.append((department, services))
+        present = services[:max(1, int(size * MERGE_PRESENT))]
+        with open(os.path.join(stale_dir, department.file), 'w', encoding='utf-8', newline='\n') as f:
+            f.write(synthetic.seed_text(department, present))
+
+    with open(os.path.join(workdir, SOURCE_NAME), 'w', encoding='utf-8', newline='\n') as f:
+        f.write(synthetic.source_text(sections))
+
+def _reset_dir(src, dst):
+    shutil.rmtree(dst, ignore_errors=True)
+    shutil.copytree(src, dst)
+
+# ---------------------------------------------------------------------------
+# Fases (executadas no processo filho, pelo digiurban-tools)
+# ---------------------------------------------------------------------------
+
+def phase_commands(ctx, phase):
+    """[(diretório dos seeds, argumentos do CLI)] de uma fase"""
+    commands = {
+        'extract': [(ctx['extract_dir'], ['extract'])],
+        'analyze': [(ctx['seeds_dir'], ['analyze'])],
+        'dedupe': [(ctx['seeds_dir'], ['dedupe'])],
+        'merge': [(ctx['merge_dir'], ['merge', '--no-manifest'])],
+        # Uma chamada encadeada reaproveita o catálogo parseado entre os comandos
+        'total': [(ctx['extract_dir'], ['extract']),
+                  (ctx['merge_dir'], ['merge', '--no-manifest', 'dedupe', 'analyze'])],
+    }
+    return [
+        ['--source', ctx['source'], '--seeds-dir', seeds_dir, '--jobs', str(ctx['jobs'])] + argv
+        for seeds_dir, argv in commands[phase]
+    ]
+
+def phase_services(ctx, phase):
+    """Serviços processados por uma fase (para serviços/s)"""
+    source_total = ctx['size'] * ctx['departments']
+    stale_total = max(1, int(ctx['size'] * MERGE_PRESENT)) * ctx['departments']
+    per_phase = {'extract': source_total, 'analyze': source_total, 'dedupe': stale_total, 'merge': source_total}
+    if phase == 'total':
+        # extract + merge + dedupe + analyze, todos sobre o catálogo inteiro
+        return source_total * 4
+    return per_phase[phase]
+
+def _peak_rss_kb():
+    if resource is None:
+        return None
+    peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+               resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    # ru_maxrss é em bytes no macOS e em KB no Linux
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+def run_child(args):
+    """Executa uma fase (ou 'total') e imprime o resultado em JSON"""
+    from digiurban_tools import cli
+
+    ctx = {
+        'source': os.path.join(args.child_workdir, SOURCE_NAME),
+        'extract_dir': os.path.join(args.child_workdir, 'extracted'),
+        'seeds_dir': os.path.join(args.child_workdir, 'stale'),
+        'merge_dir': os.path.join(args.child_workdir, 'merge'),
+        'size': args.child_size,
+        'departments': args.departments,
+        'jobs': args.jobs,
+    }
+    invocations = phase_commands(ctx, args.child_phase)
+
+    # Importação dos comandos fora do tempo medido
+    for argv in invocations:
+        for name in cli.split_commands(argv)[1]:
+            cli.load_command(name[0])
+
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        for argv in invocations:
+            code = cli.main(argv)
+            if code:
+                raise SystemExit(f"digiurban-tools {' '.join(argv)}: saida {code}")
+        wall = time.perf_counter() - start
+
+    print(json.dumps({
+        'services': phase_services(ctx, args.child_phase),
+        'wall_s': wall,
+        'peak_rss_kb': _peak_rss_kb(),
+    }))
+    return 0
+
+# ---------------------------------------------------------------------------
+# Processo principal
+# ---------------------------------------------------------------------------
+
+def measure(workdir, size, phase, args, cache_dir):
+    if phase in ('merge', 'total'):
+        _reset_dir(os.path.join(workdir, 'stale'), os.path.join(workdir, 'merge'))
+
+    env = dict(os.environ)
+    if args.warm_cache:
+        env['DIGIURBAN_TOOLS_CACHE'] = cache_dir
+        env.pop('DIGIURBAN_NO_CACHE', None)
+    else:
+        env['DIGIURBAN_NO_CACHE'] = '1'
+
+    command = [sys.executable, os.path.abspath(__file__),
+               '--child-phase', phase, '--child-workdir', workdir, '--child-size', str(size),
+               '--departments', str(args.departments), '--jobs', str(args.jobs)]
+    result = subprocess.run(command, env=env, cwd=REPO_ROOT, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"fase {phase} falhou:\n{result.stderr}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def _git_commit():
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT,
+                                capture_output=True, text=True)
+    except OSError:
+        return None
+    return result.stdout.strip() or None
+
+def load_results(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {'version': RESULTS_VERSION, 'runs': []}
+    if data.get('version') != RESULTS_VERSION:
+        return {'version': RESULTS_VERSION, 'runs': []}
+    return data
+
+def save_results(data, path):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+    os.replace(tmp_path, path)
+
+def _previous(runs, size, phase, departments):
+    for run in reversed(runs):
+        if run['departments'] != departments:
+            continue
+        for row in run['results']:
+            if row['size'] == size and row['phase'] == phase:
+                return row
+    return None
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default=DEFAULT_SIZES,
+                        help=f'servicos por departamento, separados por virgula (padrao: {DEFAULT_SIZES})')
+    parser.add_argument('--departments', type=int, default=3,
+                        help='quantos departamentos gerar, 1 a 13 (padrao: 3)')
+    parser.add_argument('--phases', default=','.join(PHASES + ('total',)),
+                        help='fases a medir (padrao: todas + total)')
+    parser.add_argument('--repeat', type=int, default=1,
+                        help='repeticoes por medicao; registra a de menor tempo (padrao: 1)')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='--jobs repassado ao digiurban-tools (padrao: 1)')
+    parser.add_argument('--warm-cache', action='store_true',
+                        help='mede com o cache de parse aquecido (padrao: sem cache)')
+    parser.add_argument('--seed', type=int, default=0, help='semente dos dados sinteticos')
+    parser.add_argument('--results', default=DEFAULT_RESULTS,
+                        help='arquivo JSON de resultados (acrescenta uma execucao)')
+    parser.add_argument('--workdir', default=None,
+                        help='diretorio dos dados gerados (padrao: temporario, removido ao final)')
+    parser.add_argument('--child-phase', help=argparse.SUPPRESS)
+    parser.add_argument('--child-workdir', help=argparse.SUPPRESS)
+    parser.add_argument('--child-size', type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child_phase:
+        return run_child(args)
+
+    if not 1 <= args.departments <= 13:
+        parser.error('--departments deve estar entre 1 e 13')
+    sizes = [int(s) for s in args.sizes.split(',') if s.strip()]
+    phases = [p.strip() for p in args.phases.split(',') if p.strip()]
+    unknown = [p for p in phases if p not in PHASES + ('total',)]
+    if unknown:
+        parser.error(f"fases desconhecidas: {', '.join(unknown)}")
+
+    departments = synthetic.select_departments(args.departments)
+    base_dir = args.workdir or tempfile.mkdtemp(prefix='digiurban-bench-')
+    data = load_results(args.results)
+    run = {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'departments': args.departments,
+        'jobs': args.jobs,
+        'warm_cache': args.warm_cache,
+        'results': [],
+    }
+
+    print(f"{'tamanho':>8} {'fase':12} {'servicos':>9} {'tempo (s)':>10} {'RSS (MB)':>9} {'servicos/s':>11}  vs anterior")
+    print('-' * 80)
+    try:
+        for size in sizes:
+            workdir = os.path.join(base_dir, f'n{size}')
+            prepare(workdir, departments, size, args.seed)
+            cache_dir = os.path.join(workdir, '.cache')
+
+            for phase in phases:
+                if args.warm_cache:
+                    measure(workdir, size, phase, args, cache_dir)
+                best = min((measure(workdir, size, phase, args, cache_dir) for _ in range(max(1, args.repeat))),
+                           key=lambda r: r['wall_s'])
+                row = {
+                    'size': size,
+                    'phase': phase,
+                    'services': best['services'],
+                    'wall_s': round(best['wall_s'], 6),
+                    'peak_rss_kb': best['peak_rss_kb'],
+                    'services_per_s': round(best['services'] / best['wall_s'], 1) if best['wall_s'] else None,
+                }
+                run['results'].append(row)
+
+                previous = _previous(data['runs'], size, phase, args.departments)
+                delta = ''
+                if previous and previous['wall_s']:
+                    delta = f"{(row['wall_s'] / previous['wall_s'] - 1) * 100:+.1f}%"
+                rss = f"{row['peak_rss_kb'] / 1024:.1f}" if row['peak_rss_kb'] is not None else '-'
+                print(f"{size:>8} {phase:12} {row['services']:>9} {row['wall_s']:>10.3f} {rss:>9} "
+                      f"{row['services_per_s'] or 0:>11.0f}  {delta}")
+    finally:
+        if args.workdir is None:
+            shutil.rmtree(base_dir, ignore_errors=True)
+
+    data['runs'].append(run)
+    save_results(data, args.results)
+    print(f"\nResultados gravados em {args.results}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+"""
+Compila os seeds modulares de serviços em um catálogo JSON/NDJSON validado
+
+Mantido por compatibilidade; equivale a `python -m digiurban_tools compile-catalog`.
+"""
+
+import sys
+
+from digiurban_tools.cli import main
+
+if __name__ == '__main__':
+    sys.exit(main(['compile-catalog'] + sys.argv[1:]))
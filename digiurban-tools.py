@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+"""
+digiurban-tools: extract, analyze, dedupe, merge, fix-api-urls,
+fix-dynamic-routes e prune-models em um único ponto de entrada
+
+Equivale a `python -m digiurban_tools`; veja --help.
+"""
+
+import sys
+
+from digiurban_tools.cli import main
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,2 @@
+-- AlterTable
+ALTER TABLE "services_simplified" ADD COLUMN "contentFingerprint" TEXT;
@@ -0,0 +1,25 @@
+-- AlterTable: constraint UNIQUE em (name, departmentId)
+-- Usada pelo ON CONFLICT do upsert em lote (generate-services-upsert.py)
+
+-- PASSO 1: Resolver duplicatas existentes
+-- Mantém a linha ativa mais antiga de cada (name, departmentId); as demais
+-- ganham um sufixo no nome e são desativadas (protocolos continuam ligados a elas)
+WITH duplicates AS (
+  SELECT
+    id,
+    name,
+    ROW_NUMBER() OVER (
+      PARTITION BY name, "departmentId"
+      ORDER BY "isActive" DESC, "createdAt" ASC, id ASC
+    ) as rn
+  FROM "services_simplified"
+)
+UPDATE "services_simplified" ss
+SET name = d.name || ' (duplicado ' || d.rn || ')',
+    "isActive" = false
+FROM duplicates d
+WHERE ss.id = d.id
+  AND d.rn > 1;
+
+-- PASSO 2: Criar índice único (agora que não há duplicatas)
+CREATE UNIQUE INDEX "services_simplified_name_departmentId_key" ON "services_simplified"("name", "departmentId");
@@ -0,0 +1,322 @@
+/**
+ * FINGERPRINTS DE CONTEÚDO DOS SERVIÇOS
+ * Gerado por `digiurban-tools fingerprints` (e pelo extract/merge): sha1 do
+ * JSON canônico de cada ServiceDefinition, sem o name. Não editar à mão.
+ *
+ * O seed calcula serviceFingerprint() de cada serviço; serviceFingerprints
+ * só serve para avisar quando este arquivo está desatualizado.
+ */
+
+import { createHash } from 'crypto';
+import { ServiceDefinition } from './types';
+
+export const FINGERPRINT_VERSION = 1;
+
+export function fingerprintKey(departmentCode: string, name: string): string {
+  return `${departmentCode}:${name}`;
+}
+
+function canonical(value: unknown): unknown {
+  if (Array.isArray(value)) {
+    return value.map(canonical);
+  }
+  if (value !== null && typeof value === 'object') {
+    const sorted: Record<string, unknown> = {};
+    for (const key of Object.keys(value).sort()) {
+      sorted[key] = canonical((value as Record<string, unknown>)[key]);
+    }
+    return sorted;
+  }
+  return value;
+}
+
+/**
+ * sha1 do JSON canônico do serviço, sem o name (igual a
+ * digiurban_tools.fingerprint.service_fingerprint)
+ */
+export function serviceFingerprint(serviceDef: ServiceDefinition): string {
+  const { name: _name, ...body } = serviceDef;
+  return createHash('sha1')
+    .update(`${FINGERPRINT_VERSION}:${JSON.stringify(canonical(body))}`, 'utf8')
+    .digest('hex');
+}
+
+/**
+ * Avisa quando o conteúdo atual difere do fingerprint gerado (seed editado
+ * depois do último `digiurban-tools fingerprints`). Só informativo: o seed
+ * grava sempre o fingerprint calculado
+ */
+export function warnStaleFingerprints(services: ServiceDefinition[]): void {
+  // A última ocorrência de cada chave é a que o seed grava
+  const last = new Map(services.map(serviceDef => [fingerprintKey(serviceDef.departmentCode, serviceDef.name), serviceDef]));
+  const stale = [...last].filter(([key, serviceDef]) =>
+    key in serviceFingerprints && serviceFingerprints[key] !== serviceFingerprint(serviceDef));
+  if (stale.length > 0) {
+    console.warn(`   ⚠️  fingerprints.ts desatualizado para ${stale.length} serviços (rode digiurban-tools fingerprints)`);
+  }
+}
+
+export const serviceFingerprints: Record<string, string> = {
+  "SAUDE:Atendimentos - Saúde": "34bc3f0365a99f9628e1761b2a3599f72a6ad5e1",
+  "SAUDE:Agendamento de Consulta Médica": "842d450399e9b360c676a3d721129dec8aee8280",
+  "SAUDE:Controle de Medicamentos": "498691907cac06e93ae0a7627f85ffad5da25087",
+  "SAUDE:Campanhas de Vacinação": "2e17786239f7067da6062bd90a36c5580afc0fef",
+  "SAUDE:Programas de Saúde": "8537b05bc84de2e8308ffecda05c17d23a4f441a",
+  "SAUDE:Encaminhamento TFD (Tratamento Fora do Domicílio)": "483ebeaa547154badad243e4180f807e85c15d98",
+  "SAUDE:Solicitação de Exames": "09ad778e7f3adcaa74484f6f5b5f9d0fdb991c0c",
+  "SAUDE:Transporte de Pacientes": "fd7b2eff40b09ba8c7a1fd84164cace4fe1d190b",
+  "SAUDE:Cartão Nacional de Saúde (Cartão SUS)": "b2c3ff02aca7de8ad63024f5672655262f9896f5",
+  "SAUDE:Registro de Vacinação": "0deede0535354d8714d1b53def042102ba156783",
+  "SAUDE:Gestão de Agentes Comunitários de Saúde (ACS)": "9fb7d7ccdcda3b58e8876ce35db9900c82d7a149",
+  "SAUDE:Certidão de Atendimento": "a6d1de95f83beb1fbd97857b6a5c895ef60b6af1",
+  "SAUDE:Declaração de Vacinação": "59fe494065d7f0c0067acd96040b7743e90c7d5a",
+  "SAUDE:Atestado de Acompanhamento em Programa": "711014d81e809d1a9c178de2a949d4c3351516c0",
+  "SAUDE:Segunda Via de Cartão SUS": "a7bdb234d8c380a2ebfb9e50613110be453ba368",
+  "SAUDE:Consulta de Histórico de Atendimentos": "6a4f79470fe0c534d7e11b2c5bb4ad3f86c0574d",
+  "SAUDE:Declaração de Participação em Programa de Saúde": "19bea5aa6e96837ff17b9444dfa09f0ad90d863d",
+  "EDUCACAO:Matrícula Escolar": "339c60c59c6b06e82236972981f7f3fd35bcd8a5",
+  "EDUCACAO:Transferência Escolar": "d0c83b4bd6893b3931a9a61a4b77d2c47cacbc8d",
+  "EDUCACAO:Gestão de Merenda Escolar": "72c28c31c94b410425ce29c2da04c3c6f19d251e",
+  "EDUCACAO:Solicitação de Transporte Escolar": "c923abb775ef5260fadc53075a961681247c7968",
+  "EDUCACAO:Inscrição em Cursos Livres": "82cae88798ed68db60c8fc4587bf6ff4d8ca4bbf",
+  "EDUCACAO:Cadastro de Professores": "6bc9e755b6e3b26b524f9fd45b176924fcd83d7e",
+  "EDUCACAO:Relatórios de Frequência": "5457ebd1ac576f5d1b0e8104700aa8a185254f92",
+  "EDUCACAO:Calendário Escolar": "7a012f487111b66fc59e86bdd6e6a9b96613c84c",
+  "EDUCACAO:Certidão de Conclusão": "a0c4666b8281f760e4ee8e83808f3a2d32b9941e",
+  "EDUCACAO:Declaração de Matrícula": "521da57d8bf11b8472b3aa0b08c73d7c82007643",
+  "EDUCACAO:Atestado de Frequência": "dc8b791dfe5b5cfaa40fa00d8256901bb02b5345",
+  "EDUCACAO:Atendimentos - Educação": "dc99d237164bde2dc2c45995dabaf8d1a775dc65",
+  "EDUCACAO:Matrícula de Aluno": "5ce23accaac01af2605ffaf9ab91744abcb782eb",
+  "EDUCACAO:Transporte Escolar": "fad952a19c91f4adfd414afd9ce86dd060a1961f",
+  "EDUCACAO:Registro de Ocorrência Escolar": "7c2f3603d98c90038666476de82f744cda527581",
+  "EDUCACAO:Solicitação de Documento Escolar": "7dbd912845ee794bd77b65f4a69de72e91cafb59",
+  "EDUCACAO:Consulta de Frequência": "e5fa380bd3e9118e5eee6a3a28286fd718c73e28",
+  "EDUCACAO:Consulta de Notas e Boletim": "2cd60a2d52601fdf2d11edc1a2849e0adc5371ff",
+  "EDUCACAO:Gestão Escolar": "07b6086f93d1a5cf239a6ea6ad4d167c520827f1",
+  "EDUCACAO:Histórico Escolar": "f23fd9c806e980931786dd6392bb8de3de9081ed",
+  "EDUCACAO:Declaração de Conclusão": "6362fc07bc88060d57ae1a97181bc80df77fb860",
+  "EDUCACAO:Segunda Via de Documentos Escolares": "761ebf1bbd71966f58c5ebe08bc6400d6b839ce1",
+  "EDUCACAO:Certidão de Escolaridade": "6bccbb2aeb0dad6a5ff5fa98b9e938046930edc0",
+  "ASSISTENCIA_SOCIAL:Cadastro Único (CadÚnico)": "4313e93a61fb5a618c4ff07244a4d1f952a66226",
+  "ASSISTENCIA_SOCIAL:Bolsa Família": "5e6c0472893654d5380d047ffe7a49705c4c736f",
+  "ASSISTENCIA_SOCIAL:CRAS - Atendimento": "8c0244d5c65c1987d748142059afa2d9c1509741",
+  "ASSISTENCIA_SOCIAL:Cesta Básica": "26e1de8b9fe1069b4b80edc1e98b2b27093ed35b",
+  "ASSISTENCIA_SOCIAL:Gestão de Benefícios Sociais": "bb91e1f439ad3c66d818a696e57c6eae38daeec0",
+  "ASSISTENCIA_SOCIAL:Relatório de Atendimentos": "a5e47938174cfa12af345d15b48240b1f380e8ff",
+  "ASSISTENCIA_SOCIAL:Certidão de CadÚnico": "57478b10291a771dbc5ed474a96c464c6fdfe592",
+  "ASSISTENCIA_SOCIAL:Declaração de Benefício": "130b93c3cb83b6d91f4529f4d3e16ddd42e62705",
+  "ASSISTENCIA_SOCIAL:Laudo Social": "3bee514b0b7f554e0b690c5550b18c75886650d1",
+  "ASSISTENCIA_SOCIAL:Atendimentos - Assistência Social": "7f27d6c5037c22ee97cdb80e6ca58d7844611ca4",
+  "ASSISTENCIA_SOCIAL:Solicitação de Benefício Social": "d07d8c258ca23215990e71a6533d366a5193699e",
+  "ASSISTENCIA_SOCIAL:Entrega Emergencial (Cesta Básica)": "964e521a3b2e62e47700cde43c33ff1a1d9a9a8f",
+  "ASSISTENCIA_SOCIAL:Inscrição em Grupo ou Oficina Social": "f4ab8f7edb0f3c33cacc22bcc466c721c3c17d61",
+  "ASSISTENCIA_SOCIAL:Visitas Domiciliares": "ed1922965cc3188bd9e5b32b25e45d4758d78f14",
+  "ASSISTENCIA_SOCIAL:Inscrição em Programa Social": "aa3ae82ced2513e926fc6288959b5730b8019b08",
+  "ASSISTENCIA_SOCIAL:Agendamento de Atendimento Social": "66a018936797ad343e8a67fe6b31c72ff6516ef9",
+  "ASSISTENCIA_SOCIAL:Gestão CRAS/CREAS": "d77d5cf5a5deda492cb15a3dad318e932a026795",
+  "ASSISTENCIA_SOCIAL:Certidão de Família em Situação de Vulnerabilidade": "bba851cee118b197e095ce4668c6b8b1201e9594",
+  "ASSISTENCIA_SOCIAL:Declaração de Atendimento Social": "6bd3016d2c78477bc6d8b5f83478ecb3e443a3ed",
+  "ASSISTENCIA_SOCIAL:Guia de Encaminhamento para Serviços": "f86cc72dc235b235f5367a85069bf16b3f6e1100",
+  "ASSISTENCIA_SOCIAL:Segunda Via de Documentos Sociais": "73fc233ee1ef8cef44a4159a22d6086463ae692b",
+  "ASSISTENCIA_SOCIAL:Consulta de Situação Cadastral (CadÚnico)": "2b0fdd4ed9a433df8bb7701268ee6c99eaadfaa6",
+  "ASSISTENCIA_SOCIAL:Declaração de Participação em Programa Social": "3316565c32f14870f1584b8ca5b1432c2cae0fc1",
+  "AGRICULTURA:Cadastro de Produtor Rural": "25386b66e98053e14961332a196c5bec6991fa48",
+  "AGRICULTURA:Solicitação de Máquinas": "88121f12b2fa7a6ab301b0736a8e23b59dd02a3a",
+  "AGRICULTURA:Feira do Produtor": "00e86c43f45c665efde0660c2dd93c907c897389",
+  "AGRICULTURA:Programa de Sementes": "1a6c85f7c5ff25e0db3cb46c0f96776bd9dd4b0f",
+  "AGRICULTURA:Certidão de Produtor Rural": "cb5d397bf8aab207e57296c0d5d407ee945dfddb",
+  "AGRICULTURA:Declaração de Atividade Rural": "0bed12b75bb64b9e9594a5e855cfca0babf1967c",
+  "AGRICULTURA:Atendimentos - Agricultura": "8d4e2a0a316b8901a17ad897580f776e1284a8cc",
+  "AGRICULTURA:Assistência Técnica Rural": "392f09620eda87fb2fe18757cc1618fe6d6c0938",
+  "AGRICULTURA:Inscrição em Curso Rural": "7a8199477a60363d9458bf895ca640a0d2d6925f",
+  "AGRICULTURA:Inscrição em Programa Rural": "ee3ff02ee7db1f1e12e82610770d47ac092efe12",
+  "AGRICULTURA:Cadastro de Propriedade Rural": "e0c443ef678d8e7f79d6633149219a326011dbab",
+  "AGRICULTURA:Declaração de Atividade Agrícola": "bb49f5a335056a39551459c5a030da0c717d7a16",
+  "AGRICULTURA:Guia de Transporte Vegetal": "b9af195862aec9c9e35ba28f0ecd40fc29ea40db",
+  "AGRICULTURA:Segunda Via de Cadastro de Produtor": "64d5b16e5ede8109352c42bdd7fb1316f73cc962",
+  "AGRICULTURA:Consulta de Situação Cadastral": "44ae75c1d4e5417598661e2789b56a23073dc7ee",
+  "AGRICULTURA:Atestado de Área Cultivada": "c8fe973a1c393aa88b783684eadc88d2f62ff900",
+  "EDUCACAO:Atestado de Frequência Escolar": "abfc00f34d2ecbe2cb77d4d98477404f963a17a3",
+  "CULTURA:Inscrição em Oficinas Culturais": "840e3e30739ad62a81e7f0e06a79ab254f90ad06",
+  "CULTURA:Cadastro de Artistas Locais": "fbf275cbd1c17ffa59f85d0e424bb0d431462ff0",
+  "CULTURA:Agenda Cultural": "9d9036e6acf5003fffc6bcd6896b5380db2bb532",
+  "CULTURA:Certidão de Participação em Evento": "08a2511de62178206af2b3ebccf9578ce44af028",
+  "CULTURA:Declaração de Apoio Cultural": "729c22e8a40842d269c217be22acc2b7993efb75",
+  "CULTURA:Atestado de Capacitação Cultural": "873e06185a0addd52f5a26e1f4a9732d87571aac",
+  "CULTURA:Laudo de Patrimônio Cultural": "9f2fd785ae7f259668b7aa76561f21f694068469",
+  "CULTURA:Autorização para Evento Cultural": "1f234513824b2450b0652ee44cc5945632abc2fa",
+  "CULTURA:Inscrição em Editais Culturais": "ba2e5216f9628618491379e5495d4427f1f721ff",
+  "CULTURA:Atendimentos - Cultura": "b56e1731e670ac4fd13a28c2994f86976edd9cf0",
+  "CULTURA:Reserva de Espaço Cultural": "9845bcc7504e0cf296138a3ad106caca363daf0d",
+  "CULTURA:Inscrição em Oficina Cultural": "289bb875632decb8b4615050a8a5b2fa337a16da",
+  "CULTURA:Cadastro de Grupo Artístico": "d92e3592ae6b82556e1eaf01c8690eccec536ab4",
+  "CULTURA:Projeto Cultural": "c37ec921797d21704922dc16e430d28eb42ef3d3",
+  "CULTURA:Submissão de Projeto Cultural (Lei de Incentivo)": "e2bd7674b23ca88bdee02d2305274a724bf22f7f",
+  "CULTURA:Cadastro de Evento Cultural": "97fccd72a3fa4f4f1d8db2c3c110588f2c54260d",
+  "CULTURA:Registro de Manifestação Cultural": "96b2a126bac3fa5fd79128dd6a1b244a0101d373",
+  "CULTURA:Agenda de Eventos Culturais": "5ac936c0dbedf17ea8d2c17063d6dcc8b7f29d18",
+  "CULTURA:Certidão de Artista Local": "420db1516f2e276f5ef2507b1583ddb824a0d571",
+  "CULTURA:Declaração de Participação em Evento Cultural": "a7a4a5e6e9cc1613df9135510885d7ceaf699479",
+  "CULTURA:Guia de Utilização de Espaço Cultural": "1364778feb0d4fcccf4346bec58279b03f43adc9",
+  "CULTURA:Atestado de Grupo Artístico": "f586e991987e76be6d9cabe154a5261d7c390172",
+  "CULTURA:Consulta de Agenda Cultural": "84cf94f8651b65264fdc950c90f70373eca0fa80",
+  "CULTURA:Segunda Via de Cadastro Cultural": "a065ad21044cc92000e3bb9991ca1ebf41aec663",
+  "ESPORTES:Inscrição em Modalidades Esportivas": "3bccee4cd4798ea96e152ccc9bf9608e26372238",
+  "ESPORTES:Aluguel de Quadras": "f4b77a4b796343234daa4caffb1335023b053af0",
+  "ESPORTES:Agenda de Eventos Esportivos": "9cb8508033d70e74c2f3da5fdd31f34c55a64f6f",
+  "ESPORTES:Certidão de Participação Esportiva": "7b6897ef3b18a0a2e2a8224eed30e8a6597a1eb2",
+  "ESPORTES:Declaração de Atleta": "d3227533f9e32675ef64e024c5ef7a2aa75facc5",
+  "ESPORTES:Atestado de Aptidão Física": "aacb4c8a299e4a8f2096921a71fb037b1707d839",
+  "ESPORTES:Laudo Técnico de Instalação": "e7a7d8c3c2276604b7fa59ad199ff83a87a6a0e6",
+  "ESPORTES:Autorização para Torneio": "e5489ab5d2680a9e40da3bbaeb20147014a4cef6",
+  "ESPORTES:Inscrição em Torneios": "d2fca3a6d3a8b9ec94dfb8c6ac19b512f9d872ee",
+  "ESPORTES:Atendimentos - Esportes": "8355dc6a41136b5eee67b6b1077d4ab39b5c439e",
+  "ESPORTES:Inscrição em Escolinha Esportiva": "91b201f685335a98d439374d4f6ca2cfec68a95d",
+  "ESPORTES:Cadastro de Atleta": "eb712eeeddfecb7afc34bb60d8751575fdc69dc7",
+  "ESPORTES:Reserva de Espaço Esportivo": "c33f8f55a235924a76861944b1f5bcfe16200eba",
+  "ESPORTES:Inscrição em Competição": "3f313a93f77b45849fa9df9e31cff10becb6b9b9",
+  "ESPORTES:Cadastro de Equipe Esportiva": "50184ec42d434cb150426535f33bfc83dd066d07",
+  "ESPORTES:Inscrição em Torneio": "6def996810ecef1f121501fb6dd3b05a625d8bc3",
+  "ESPORTES:Cadastro de Modalidade Esportiva": "f95dc43fcd2622941c4b232f706327ac36a14e24",
+  "ESPORTES:Certidão de Atleta Municipal": "f2e52ec0977858d99c9baabb491746bb302e6c61",
+  "ESPORTES:Declaração de Participação em Competição": "03cd9ce942d54985d772c93a2403e06fd632f9c9",
+  "ESPORTES:Atestado de Inscrição em Escolinha": "3bcf074ac67b7f7c6db9b0a10b5c9a2e1c4dc4c7",
+  "ESPORTES:Comprovante de Reserva de Quadra": "88dff07289ad9f40c6b5b551f2751790639e7601",
+  "ESPORTES:Segunda Via de Carteira de Atleta": "e23353efc6b9de3537ddb379c0b9106d15041310",
+  "ESPORTES:Consulta de Calendário Esportivo": "ba806b5ad8a47158cb940876235fe3a5741b549c",
+  "HABITACAO:Regularização Fundiária": "e6bc997863643ddcd72ecb90c734ad1eccc9a9f6",
+  "HABITACAO:Programa Minha Casa Minha Vida": "ad2351bbc3ce2fc2af455817f25abd0d77379498",
+  "HABITACAO:Mapa de Lotes": "b596867bbaca3c4f80e0c5d27b0ddef5733fbede",
+  "HABITACAO:Certidão de Regularidade Fundiária": "073b2f016e475507724cec165d2f3ed26fb6b959",
+  "HABITACAO:Declaração de Residência": "06d2d3949a45f93ba47b64986d13613ef513d951",
+  "HABITACAO:Laudo de Vistoria Habitacional": "73707fe7c4ac0ab4a20775d031ca4c77ee4129bc",
+  "HABITACAO:Autorização para Construção": "5cdea0a0531cbfadf3732d69e0e6d7066f797962",
+  "HABITACAO:Atendimentos - Habitação": "d4200dbcca9194a40b02b0bc7f9b81dd3087ecc7",
+  "HABITACAO:Inscrição em Programa Habitacional": "44ea36f06258e200b29c92ddf20ec1bce9202caa",
+  "HABITACAO:Solicitação de Auxílio Aluguel": "9442a46b855c765698537a8538ab2582bd6dee77",
+  "HABITACAO:Cadastro de Unidade Habitacional": "809b4145afa4bd22ac5e2db8ec977859b1da0949",
+  "HABITACAO:Inscrição na Fila de Habitação": "f7063af9572f1a2263580f404b21f11d05593f0c",
+  "HABITACAO:Consulta de Programas Habitacionais": "035b50dd950974df7770f248df0f4beb45823623",
+  "HABITACAO:Certidão de Inscrição Habitacional": "a2bc04ec5c87cace77b03202f968345d600d3a37",
+  "HABITACAO:Declaração de Moradia": "6da1b30a69960bdeeaa7adba4321450bd12f280f",
+  "HABITACAO:Atestado de Regularização Fundiária": "cf1a3ecba29fe1ea66e1479f2ce791426b748bb3",
+  "HABITACAO:Consulta de Situação no Programa": "494841fa968e4e1f7a5db62d26862b0ce09c26e5",
+  "HABITACAO:Segunda Via de Contrato Habitacional": "adee56fdb362af9f87a250e454e2e1bf4bc25037",
+  "HABITACAO:Comprovante de Cadastro Habitacional": "c989ce56fbb4b1fbac838298e8e651a0b6485ce2",
+  "MEIO_AMBIENTE:Licenciamento Ambiental": "8ceb5e26a5a773c9ba70fd0699520a3805e9db78",
+  "MEIO_AMBIENTE:Coleta Seletiva": "d8b36d91b081a7c9e066075a4abb6a99fbacc783",
+  "MEIO_AMBIENTE:Gestão de Resíduos": "f789d1f925a57329943abc54ded542b5d80556c8",
+  "MEIO_AMBIENTE:Certidão Ambiental": "7c02d7c90d500d17959eb585770c67047c310590",
+  "MEIO_AMBIENTE:Declaração de Conformidade Ambiental": "14eeec6151937a3a641d2012164719c4b4f360d8",
+  "MEIO_AMBIENTE:Laudo Técnico Ambiental": "d1d875f8fa8e837652cd16a3915cd4aa4b75c39d",
+  "MEIO_AMBIENTE:Autorização para Poda/Supressão de Árvores": "a0ae3b0f69c734cef4dbe3d0dd9f4383c58ac3da",
+  "MEIO_AMBIENTE:Atendimentos - Meio Ambiente": "ca16ddfc2380ef3710046c68fd4218640c93bb16",
+  "MEIO_AMBIENTE:Licença Ambiental": "ea8e7edbac73d6b6b2bb27146d66ea265f7dedbf",
+  "MEIO_AMBIENTE:Denúncia Ambiental": "94f582ed6a5d6930140775c4dc8c522a422a656d",
+  "MEIO_AMBIENTE:Programa Ambiental": "76aa1d30208227bdab828eb258c9e1c5cc33da38",
+  "MEIO_AMBIENTE:Autorização de Poda ou Corte de Árvore": "f414636af1009ca7f9ba060935b74cd1f41de2f7",
+  "MEIO_AMBIENTE:Vistoria Ambiental": "f19ec3e862f0c38648354b1e3849960b61bc3f30",
+  "MEIO_AMBIENTE:Gestão de Áreas Protegidas": "62eec461b1d96b30acf045f89868ac85b9ccaf8a",
+  "MEIO_AMBIENTE:Certidão de Conformidade Ambiental": "ea505890a058bbad52c18d1c3e8bc66ddcaa70a6",
+  "MEIO_AMBIENTE:Declaração de Área Verde": "88cf563e31f488d5f5efecbb2ba55b30ae13997f",
+  "MEIO_AMBIENTE:Guia de Poda de Árvore": "10eb6df3418c40cbc201d6798cd29996d0b4b180",
+  "MEIO_AMBIENTE:Atestado de Coleta Seletiva": "ccffff0d0efc633dc7855ec6794ee364564989a6",
+  "MEIO_AMBIENTE:Consulta de Licença Ambiental": "54241b2b4c31118efe5e0bcca2f09107b1326492",
+  "MEIO_AMBIENTE:Segunda Via de Autorização Ambiental": "c944d7e7647772e9c9fe376059d934bbf40da962",
+  "OBRAS_PUBLICAS:Aprovação de Projeto de Construção": "114226852978c1de61606552fe0309f704e5fdf8",
+  "OBRAS_PUBLICAS:Alvará de Construção": "743462bb71f7215e6cb3ec80a5b8fce2234bf183",
+  "OBRAS_PUBLICAS:Habite-se": "0d61c04c4bb9e1f167dc57d2bbf4bc24e984634d",
+  "OBRAS_PUBLICAS:Certidão de Numeração Predial": "6ff86f2afce2ec3b948800b12f1f5459224f8974",
+  "OBRAS_PUBLICAS:Laudo de Vistoria Técnica": "40bb4b06eafeb98c53c470082a5c10dd9be52cac",
+  "OBRAS_PUBLICAS:Autorização para Demolição": "09a08d5b286ce7fccf6a22acc0600b7ecf5cc1a2",
+  "OBRAS_PUBLICAS:Plano Diretor": "1113055b4f73c16ab5725f7c49756ce7abad3eb8",
+  "OBRAS_PUBLICAS:Gestão de Obras Públicas": "e58c022a22c899e74d954fdc5a007fc9c4e6411c",
+  "OBRAS_PUBLICAS:Atendimentos - Obras Públicas": "7def02c74fe5e4cdfb3148f8d393814b764cf068",
+  "OBRAS_PUBLICAS:Solicitação de Reparo de Via": "917ddf2bf712e373250e13f37f3858fc2cdbbd13",
+  "OBRAS_PUBLICAS:Vistoria Técnica de Obras": "0b898803f5680fb95a06f9689cbb2914be28660d",
+  "OBRAS_PUBLICAS:Cadastro de Obra Pública": "dfdf4a31f2aa3ae74cf19e6f0f8634c5e641c8a9",
+  "OBRAS_PUBLICAS:Inspeção de Obra": "b2d62407d9c45188e29430ec23d7433a81bab27f",
+  "OBRAS_PUBLICAS:Acompanhamento de Obras": "535e9c4b35b0840f781803dcbdb7e8ee2983d9e4",
+  "OBRAS_PUBLICAS:Mapa de Obras": "616a85ffa0692b7943e1a5e07258e61cb422a9c3",
+  "OBRAS_PUBLICAS:Certidão de Obra Pública": "649a0bb10496b417016c3270906baa03f42cba4f",
+  "OBRAS_PUBLICAS:Declaração de Manutenção Realizada": "e29159161701c741a65038e9156154bfaedd00ae",
+  "OBRAS_PUBLICAS:Atestado de Vistoria de Obras": "8c8911a43b16754bd5906c5a4184c66a43894b1f",
+  "OBRAS_PUBLICAS:Guia de Ocupação de Via": "4b45d153bd27566100410357b0fe4aa9159dbbdf",
+  "OBRAS_PUBLICAS:Consulta de Status de Obra": "46d49c3ad7f666cc5459769e0ad9ca2562f8b08e",
+  "OBRAS_PUBLICAS:Segunda Via de Documentos de Obras": "27bc584d4d00066a69e41e635957bb2f8ad1ae69",
+  "PLANEJAMENTO_URBANO:Plano Diretor": "cfcfe5146a9704c6f4dc981bfece4b656dc78216",
+  "PLANEJAMENTO_URBANO:Zoneamento Urbano": "b9928b5cf8b8bbde355b0838767af5b55694ebcb",
+  "PLANEJAMENTO_URBANO:Certidão de Zoneamento": "38a08d19db198ced605d878552867faf27972653",
+  "PLANEJAMENTO_URBANO:Certidão de Uso do Solo": "51cf1a4756f5fdaf7e832e4fec25e757b827766a",
+  "PLANEJAMENTO_URBANO:Declaração de Conformidade Urbanística": "3192110aa11c5648a1a03da8dc431e4b9a0ba5e3",
+  "PLANEJAMENTO_URBANO:Laudo de Vistoria Urbanística": "75197b0157a12bb162096199e6896d385efc94e1",
+  "PLANEJAMENTO_URBANO:Autorização de Parcelamento do Solo": "80941d4c3db9ec50109bcb6ccb465cb8060019c0",
+  "PLANEJAMENTO_URBANO:Consulta de Viabilidade Urbanística": "090196ed213a7b7574d03958717ca7f67f6389f5",
+  "PLANEJAMENTO_URBANO:Mapa de Zoneamento": "8f6877c724c0827fd270f30efe210a6a41249cd6",
+  "PLANEJAMENTO_URBANO:Atendimentos - Planejamento Urbano": "842f4c8914b62bee4c33bbb744c3087b79e0b056",
+  "PLANEJAMENTO_URBANO:Aprovação de Projeto Arquitetônico": "4d1c0e8295446c63295c9332778b0e578a5ebea2",
+  "PLANEJAMENTO_URBANO:Alvará de Construção": "534725a70ca845d66989e526fa4eb67606d8f1b6",
+  "PLANEJAMENTO_URBANO:Alvará de Funcionamento": "7b8eb120f67ccc98251fe5b59921f573350509b5",
+  "PLANEJAMENTO_URBANO:Solicitação de Certidão Municipal": "4c55452911f7ca2c6bd86da07ea1f7cabbfbd8e3",
+  "PLANEJAMENTO_URBANO:Denúncia de Construção Irregular": "d351cefb3f8d1d89be21f23fea98de98c2db8447",
+  "PLANEJAMENTO_URBANO:Cadastro de Loteamento": "fec5705c350d5132c351409b3aad83395cf072db",
+  "PLANEJAMENTO_URBANO:Consultas Públicas (Plano Diretor)": "a56353ab263f2b90357292a1c2462b4d7ef0b4c1",
+  "PLANEJAMENTO_URBANO:Mapa Urbano (Zoneamento)": "13a1d0edc894e71cd7ae55e1c6a6916f19a84e57",
+  "PLANEJAMENTO_URBANO:Certidão de Viabilidade de Construção": "2d5a9e53391d258ff971df82ed337bd6484cd238",
+  "PLANEJAMENTO_URBANO:Atestado de Regularidade de Obra": "db64d5e988df60e1a32092ba594334b70b3d3569",
+  "PLANEJAMENTO_URBANO:Laudo de Vistoria Técnica": "37a147a9fd0a17e431daf34127bb485dbf74d21a",
+  "SEGURANCA_PUBLICA:Registro de Ocorrência": "e7556986c9d6eb52e3a93c90acac98a5ac97312b",
+  "SEGURANCA_PUBLICA:Solicitação de Patrulhamento": "4316598d90de019970f84226b5c67452296e057d",
+  "SEGURANCA_PUBLICA:Mapa de Criminalidade": "fb40c4ef329e37e09cfcdb3b7bb3b2f385ef2768",
+  "SEGURANCA_PUBLICA:Certidão de Antecedentes": "62c43a78af29c149911ade0761ca35b5bb8f8a6f",
+  "SEGURANCA_PUBLICA:Declaração de Perda de Documentos": "a22412f781e786846a9cbd3c46f3df663d06eae1",
+  "SEGURANCA_PUBLICA:Autorização para Evento com Segurança": "f01a6b66edad63cc46560572d414780151e7db18",
+  "SEGURANCA_PUBLICA:Atendimentos - Segurança Pública": "f588f8d61315ebf10526a25127437d2bb1178184",
+  "SEGURANCA_PUBLICA:Registro de Ocorrência (BO)": "28dc7e5b26598342be91deee3c2def2eb3e8635c",
+  "SEGURANCA_PUBLICA:Solicitação de Ronda Policial": "045baf1e7c1e748576d7a75de183104f5e696be7",
+  "SEGURANCA_PUBLICA:Solicitação de Câmera de Segurança": "642976dff68029afdfe9c09d5d56ae2ae41de032",
+  "SEGURANCA_PUBLICA:Denúncia Anônima (Disque Denúncia)": "27136324e5871528ffbc39e2ee165c0c31064516",
+  "SEGURANCA_PUBLICA:Cadastro de Ponto Crítico": "8c6c8b602824d9f5dac0ad972f86f63041f4a2be",
+  "SEGURANCA_PUBLICA:Alerta de Segurança": "5443bdb4e1b73a64ebe101fab6aa6a447161d068",
+  "SEGURANCA_PUBLICA:Registro de Patrulha": "b2090bb3a46ce0cd10c2e3838add8a89e162abdb",
+  "SEGURANCA_PUBLICA:Gestão da Guarda Municipal": "f56675ecc8b24498c71c9c33b30119e7395b668c",
+  "SEGURANCA_PUBLICA:Gestão de Vigilância (Central de Operações)": "6d66f855dbf578c1def802ac0eb7e05cc9004f57",
+  "SEGURANCA_PUBLICA:Estatísticas de Segurança": "7019b5187cb8b748e8bc2cb4278858527fddedad",
+  "SEGURANCA_PUBLICA:Certidão de Antecedentes Criminais": "2beead57d26b53efc31eb227f7f7fd1d2455fafd",
+  "SEGURANCA_PUBLICA:Certidão de Ocorrência Policial": "bcf28757f91ce9b7503d063d300a2cea582d2bc6",
+  "SEGURANCA_PUBLICA:Declaração de Comparecimento a Delegacia": "2e19f509809887023735645610d5220ae5985209",
+  "SEGURANCA_PUBLICA:Atestado de Bons Antecedentes": "269ba1ce29f16d4e770fb134be8aa677df78e110",
+  "SEGURANCA_PUBLICA:Laudo de Vistoria de Segurança": "213075f29728295db6a2406d735b470068902351",
+  "SEGURANCA_PUBLICA:Autorização para Evento com Aglomeração": "a5144a6360d52c56eb41defb223535a661cd0097",
+  "SERVICOS_PUBLICOS:Desobstrução de Bueiro": "904bc8443e6d0eb5da8a244a8b55f848ce4487d1",
+  "SERVICOS_PUBLICOS:Solicitação de Poda de Árvore": "6793c15969390bf2d9d524fe27a064e7ef1460ac",
+  "SERVICOS_PUBLICOS:Registro de Problema com Foto (Funcionalidade Transversal)": "a29cc921b4c4dc347b60d8253070a4d093fa7c6a",
+  "SERVICOS_PUBLICOS:Gestão de Equipes de Serviços": "ad8cb79030f4dac5df54048cc60394e1bcaefdd6",
+  "SERVICOS_PUBLICOS:Certidão de Execução de Serviço": "25dbb3db6640fc2a1858ddb08b1afc1264932806",
+  "SERVICOS_PUBLICOS:Certidão de Limpeza Urbana": "53a9037b08c419ba9786ba3517dd5a36e60f009d",
+  "SERVICOS_PUBLICOS:Declaração de Manutenção de Via": "420f762595e528d5c1591dd42ca55580ef9fc363",
+  "SERVICOS_PUBLICOS:Atestado de Condições de Infraestrutura": "e35e6bbb62414e12fe4d610dfc750d181c98a290",
+  "SERVICOS_PUBLICOS:Laudo de Vistoria de Iluminação Pública": "52abcfe25aa4066b9e4c123a39f44d5d4be68feb",
+  "SERVICOS_PUBLICOS:Autorização para Intervenção em Via Pública": "4f83973ac77d97915345113290bbfcdf47793b82",
+  "SERVICOS_PUBLICOS:Atendimentos - Serviços Públicos": "94b0691b643373d72ff7a87ab24f3afd3a805235",
+  "SERVICOS_PUBLICOS:Iluminação Pública (Poste Queimado)": "c916d93c14732f4bb34a2604e304eda363e7afe2",
+  "SERVICOS_PUBLICOS:Limpeza Urbana (Coleta de Lixo)": "0c25555d2f25c53af5c5e6650139626d2e7a89fa",
+  "SERVICOS_PUBLICOS:Coleta Especial (Entulho e Móveis)": "32bcfe81f75f1227ba6e0f1a022a8bd39e5835d6",
+  "SERVICOS_PUBLICOS:Solicitação de Capina": "71d33437ccbc6e3358194251b39dac55e35f82b5",
+  "SERVICOS_PUBLICOS:Solicitação de Desobstrução (Bueiro Entupido)": "cece1b2c9d7be274aa9ce945e01030c5c00b532d",
+  "TURISMO:Atendimentos - Turismo": "90037304f09d884990e7fe3873e823d78fc85639",
+  "TURISMO:Cadastro de Estabelecimento Turístico": "d221de88bd45c10c11586fffb01b83d9a544ab48",
+  "TURISMO:Cadastro de Guia Turístico": "12dc1d575b9a8ed152edd109a836ac8f644789c6",
+  "TURISMO:Inscrição em Programa Turístico": "611fdd5e988997406a921cad555b358ba90117f6",
+  "TURISMO:Registro de Atrativo Turístico": "6f66d1a45274d2babbbe96410648ed449d2b5eff",
+  "TURISMO:Cadastro de Roteiro Turístico": "580c1108507bbbca87edb40463e4535bfca2e6fe",
+  "TURISMO:Cadastro de Evento Turístico": "5dcdfb0835f039d57335c90545655e43fd08b0f2",
+  "TURISMO:Mapa Turístico": "1761cd4ff7203029c37fdd19afdfb179632d0c0d",
+  "TURISMO:Guia Turístico da Cidade": "c06362bbdbd245ac3f20d82a576f8461f896a160",
+  "TURISMO:Certidão de Cadastro Turístico": "952f0fecdbfa8f1a2cdd84605ac21b200a50c38a",
+  "TURISMO:Certidão de Regularidade Turística": "ad3c3972c03ad80175b06db583d4cbaf5477387b",
+  "TURISMO:Declaração de Apoio a Evento Turístico": "6ef37436b32b6095c862223e4e8b7c1245a9f939",
+  "TURISMO:Atestado de Participação em Capacitação": "aefbafadc9a0d056b10374898d7f9c614eb09779",
+  "TURISMO:Laudo de Vistoria de Equipamento Turístico": "bd0111129bd71c3a5b913bbb945a55fd5b2a10a0",
+  "TURISMO:Autorização de Uso de Marca Turística": "dc3baf0bc1c79925fa22246205889dc269c0dca5",
+};
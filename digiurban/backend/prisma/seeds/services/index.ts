@@ -5,6 +5,7 @@
 
 import { PrismaClient } from '@prisma/client';
 import { ServiceDefinition } from './types';
+import { fingerprintKey, serviceFingerprint, warnStaleFingerprints } from './fingerprints';
 import { generateDefaultWorkflow } from '../../src/services/workflow-template.service';
 
 import { healthServices } from './health.seed';
@@ -56,8 +57,15 @@ export async function seedServices() {
   );
 
   let totalCreated = 0;
+  let totalUnchanged = 0;
 
-  for (const serviceDef of allServices) {
+  // Mesmo departmentCode:name repetido: só a última definição é gravada
+  const uniqueServices = [
+    ...new Map(allServices.map(serviceDef => [fingerprintKey(serviceDef.departmentCode, serviceDef.name), serviceDef])).values(),
+  ];
+  warnStaleFingerprints(uniqueServices);
+
+  for (const serviceDef of uniqueServices) {
     const departmentId = departmentMap.get(serviceDef.departmentCode);
 
     if (!departmentId) {
@@ -65,6 +73,9 @@ export async function seedServices() {
       continue;
     }
 
+    // Calculado do conteúdo atual: um seed editado à mão nunca é pulado
+    const contentFingerprint = serviceFingerprint(serviceDef);
+
     try {
       // Verificar se serviço já existe
       const existing = await prisma.serviceSimplified.findFirst({
@@ -74,6 +85,12 @@ export async function seedServices() {
         }
       });
 
+      if (existing && existing.contentFingerprint === contentFingerprint && existing.isActive) {
+        // Conteúdo igual ao da última gravação
+        totalUnchanged++;
+        continue;
+      }
+
       if (existing) {
         // Atualizar serviço existente
         await prisma.serviceSimplified.update({
@@ -94,6 +111,7 @@ export async function seedServices() {
             icon: serviceDef.icon,
             color: serviceDef.color,
             isActive: true,
+            contentFingerprint,
           }
         });
         console.log(`   🔄 ${serviceDef.name} (atualizado)`);
@@ -118,6 +136,7 @@ export async function seedServices() {
             icon: serviceDef.icon,
             color: serviceDef.color,
             isActive: true,
+            contentFingerprint,
           }
         });
         totalCreated++;
@@ -128,7 +147,7 @@ export async function seedServices() {
     }
   }
 
-  console.log(`\n✅ Seed de serviços concluído: ${totalCreated} serviços criados`);
+  console.log(`\n✅ Seed de serviços concluído: ${totalCreated} serviços criados, ${totalUnchanged} sem alteração`);
   return totalCreated;
 }
 
@@ -1,43 +1,17 @@
 #!/usr/bin/env python3
 """
 Script para remover models legados do schema.prisma
-"""
-
-import re
-
-# Ler o schema
-with open('prisma/schema.prisma', 'r', encoding='utf-8') as f:
-    content = f.read()
 
-# Models legados a remover
-legacy_models = [
-    'ServiceGeneration',
-    'ProtocolLocation',
-    'ServiceLocation',
-    'ServiceForm',
-    'ServiceFormSubmission',
-    'ServiceScheduling',
-    'ServiceCustomField',
-    'ProtocolCustomFieldValue',
-    'ServiceDocument'
-]
-
-removed_count = 0
+Mantido por compatibilidade; equivale a `python -m digiurban_tools prune-models`.
+"""
 
-for model_name in legacy_models:
-    # Padrão: model ModelName { ... @@map("...") }
-    pattern = rf'model {model_name} \{{[^}}]*\n\n  @@map\("[^"]*"\)\n\}}\n\n'
+import os
+import sys
 
-    if re.search(pattern, content, re.DOTALL):
-        content = re.sub(pattern, '', content, flags=re.DOTALL)
-        removed_count += 1
-        print(f'✅ Removido: model {model_name}')
-    else:
-        print(f'⚠️  Não encontrado: model {model_name}')
+# digiurban_tools fica na raiz do repositório (três níveis acima)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
 
-# Salvar o schema atualizado
-with open('prisma/schema.prisma', 'w', encoding='utf-8') as f:
-    f.write(content)
+from digiurban_tools.cli import main
 
-print(f'\n✅ Total de models removidos: {removed_count}')
-print(f'📝 Schema atualizado: prisma/schema.prisma')
+if __name__ == '__main__':
+    sys.exit(main(['prune-models'] + sys.argv[1:]))
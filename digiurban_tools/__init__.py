@@ -0,0 +1,4 @@
+"""
+Ferramentas compartilhadas pelos scripts de manutenção do DigiUrban
+(seeds de serviços, schema.prisma e rotas do frontend)
+"""
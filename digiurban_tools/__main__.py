@@ -0,0 +1,5 @@
+import sys
+
+from digiurban_tools.cli import main
+
+sys.exit(main())
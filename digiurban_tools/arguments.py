@@ -0,0 +1,68 @@
+"""
+Opções de linha de comando comuns aos scripts e ao digiurban-tools
+
+Só depende de argparse: o CLI monta o --help sem importar o lexer, o
+cache ou o pool de processos.
+"""
+
+import argparse
+
+
+def positive_int(value):
+    """type= do argparse: inteiro >= 1"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f'deve ser >= 1: {value}')
+    return number
+
+
+def non_negative_int(value):
+    """type= do argparse: inteiro >= 0"""
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f'deve ser >= 0: {value}')
+    return number
+
+
+def positive_float(value):
+    """type= do argparse: número > 0"""
+    number = float(value)
+    if not number > 0:
+        raise argparse.ArgumentTypeError(f'deve ser > 0: {value}')
+    return number
+
+
+def fraction(value):
+    """type= do argparse: número em (0, 1]"""
+    number = float(value)
+    if not 0 < number <= 1:
+        raise argparse.ArgumentTypeError(f'deve estar entre 0 (exclusive) e 1: {value}')
+    return number
+
+
+def add_cache_arguments(parser):
+    """Adiciona --no-cache e --clear-cache a um ArgumentParser"""
+    parser.add_argument('--no-cache', action='store_true',
+                        help='ignora o cache de parse em disco (nao le nem grava)')
+    parser.add_argument('--clear-cache', action='store_true',
+                        help='apaga o cache de parse antes de executar')
+
+
+def add_jobs_argument(parser):
+    parser.add_argument('-j', '--jobs', type=int, default=1, metavar='N',
+                        help='processos em paralelo (0 = numero de CPUs, padrao: 1)')
+
+
+def add_profile_arguments(parser):
+    """Adiciona --profile e --profile-cprofile a um ArgumentParser"""
+    parser.add_argument('--profile', nargs='?', const='', default=None, metavar='JSON',
+                        help='mede fases e contadores; grava o resumo em JSON '
+                             '(padrao: .digiurban-cache/profile-<script>.json)')
+    parser.add_argument('--profile-cprofile', default=None, metavar='ARQ',
+                        help='grava tambem um dump do cProfile (ler com python -m pstats)')
+
+
+def add_format_argument(parser):
+    """Adiciona --format text|ndjson|csv (ver digiurban_tools.report)"""
+    parser.add_argument('--format', choices=('text', 'ndjson', 'csv'), default='text',
+                        help='saida: texto, um registro JSON por linha ou CSV com cabecalho (padrao: text)')
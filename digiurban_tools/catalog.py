@@ -0,0 +1,258 @@
+"""
+Catálogo compilado de serviços (ServiceDefinition[] dos 13 seeds)
+
+Avalia cada objeto de serviço dos seeds, valida contra a interface
+ServiceDefinition de prisma/seeds/services/types.ts e o enum ServiceType
+do schema.prisma, normaliza a ordem das chaves e gera:
+
+- services.catalog.json   documento versionado e compacto
+- services.catalog.ndjson um serviço por linha
+
+para que o seed possa carregar o catálogo sem compilar os módulos .ts.
+Cada serviço leva também o fingerprint de conteúdo na chave `fingerprint`
+(ver digiurban_tools.fingerprint).
+"""
+
+import hashlib
+import json
+import os
+import re
+from dataclasses import dataclass
+
+from digiurban_tools import profiling
+from digiurban_tools.catalog_diff import normalize_name
+from digiurban_tools.departments import DEPARTMENTS
+from digiurban_tools.fingerprint import service_fingerprint
+from digiurban_tools.fragments import fragment_constants
+from digiurban_tools.paths import SCHEMA_PRISMA, SERVICE_TYPES_TS
+from digiurban_tools.seed_cache import load_derived
+from digiurban_tools.ts_literal import LiteralError, evaluate
+
+CATALOG_VERSION = 2
+
+# Sobe quando o formato retornado por _evaluate_services mudar
+DEFINITIONS_VERSION = 1
+
+CATALOG_JSON = 'services.catalog.json'
+CATALOG_NDJSON = 'services.catalog.ndjson'
+
+_FIELD_RE = re.compile(r'^\s*(\w+)(\?)?\s*:\s*([^;]+);', re.M)
+
+
+@dataclass
+class CatalogIssue:
+    severity: str
+    file: str
+    line: int
+    service: str
+    message: str
+
+    def __str__(self):
+        label = 'ERRO' if self.severity == 'error' else 'AVISO'
+        where = f"{self.file}:{self.line}" if self.line else self.file
+        service = f" [{self.service}]" if self.service else ''
+        return f"{label} {where}{service}: {self.message}"
+
+
+def _evaluate_services(index, constants=None):
+    result = []
+    for service in index.services():
+        entry = {'section': service.section, 'line': service.line, 'name': service.name}
+        try:
+            with profiling.phase('evaluate'):
+                entry['definition'] = evaluate(index.service_text(service), service.line, constants)
+        except LiteralError as e:
+            entry['error'] = str(e)
+        result.append(entry)
+    return result
+
+
+def load_definitions(filepath):
+    """
+    Serviços de um seed como dicts (ou erro de avaliação), via cache em disco.
+    Referências aos fragmentos do shared-fragments.ts do mesmo diretório são
+    resolvidas; o sha1 desse arquivo entra na versão do valor em cache.
+    """
+    constants, fragments_digest = fragment_constants(os.path.dirname(os.path.abspath(filepath)))
+    return load_derived(filepath, 'definitions', lambda index: _evaluate_services(index, constants),
+                        (DEFINITIONS_VERSION, fragments_digest))
+
+
+def read_interface_fields(interface, types_ts=SERVICE_TYPES_TS):
+    """[(campo, tipo, obrigatório)] de uma interface exportada de um .ts, em ordem"""
+    with open(types_ts, 'r', encoding='utf-8') as f:
+        match = re.search(rf'export interface {interface}\s*\{{(.*?)\n\}}', f.read(), re.S)
+    if match is None:
+        raise ValueError(f'interface {interface} nao encontrada em {types_ts}')
+    return [
+        (name, type_text.strip(), optional != '?')
+        for name, optional, type_text in _FIELD_RE.findall(match.group(1))
+    ]
+
+
+def read_service_definition_fields(types_ts=SERVICE_TYPES_TS):
+    """[(campo, tipo, obrigatório)] da interface ServiceDefinition, em ordem"""
+    return read_interface_fields('ServiceDefinition', types_ts)
+
+
+def read_enum_values(enum_name, schema_path=SCHEMA_PRISMA):
+    with open(schema_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    match = re.search(rf'^enum {enum_name}\s*\{{(.*?)^\}}', content, re.S | re.M)
+    if match is None:
+        raise ValueError(f'enum {enum_name} nao encontrado em {schema_path}')
+    values = []
+    for line in match.group(1).splitlines():
+        line = line.split('//', 1)[0].strip()
+        if line and not line.startswith('@@'):
+            values.append(line.split()[0])
+    return values
+
+
+def _type_checker(type_text, enums):
+    checks = []
+    for alternative in (t.strip() for t in type_text.split('|')):
+        if alternative == 'string':
+            checks.append(lambda v: isinstance(v, str))
+        elif alternative == 'number':
+            checks.append(lambda v: isinstance(v, (int, float)) and not isinstance(v, bool))
+        elif alternative == 'boolean':
+            checks.append(lambda v: isinstance(v, bool))
+        elif alternative == 'null':
+            checks.append(lambda v: v is None)
+        elif alternative == 'any':
+            checks.append(lambda v: True)
+        elif alternative[:1] in ('"', "'"):
+            literal = alternative[1:-1]
+            checks.append(lambda v, literal=literal: v == literal)
+        elif alternative.endswith('[]'):
+            checks.append(lambda v: isinstance(v, list))
+        elif alternative in enums:
+            allowed = frozenset(enums[alternative])
+            checks.append(lambda v, allowed=allowed: v in allowed)
+        else:
+            # Outra interface (ex.: LinkedCitizenConfig)
+            checks.append(lambda v: isinstance(v, dict))
+    return lambda value: any(check(value) for check in checks)
+
+
+class DefinitionSchema:
+    """Campos e tipos de ServiceDefinition, prontos para validar"""
+
+    def __init__(self, fields, enums):
+        self.fields = fields
+        self.order = [name for name, _type, _required in fields]
+        self.known = set(self.order)
+        self.required = [name for name, _type, required in fields if required]
+        self.types = {name: type_text for name, type_text, _required in fields}
+        self.checkers = {name: _type_checker(type_text, enums) for name, type_text, _required in fields}
+
+    @classmethod
+    def load(cls, types_ts=SERVICE_TYPES_TS, schema_path=SCHEMA_PRISMA):
+        return cls(read_service_definition_fields(types_ts), {'ServiceType': read_enum_values('ServiceType', schema_path)})
+
+    def validate(self, definition):
+        """[(severidade, mensagem)] de uma definição"""
+        problems = []
+        for name in self.required:
+            if name not in definition:
+                problems.append(('error', f"campo obrigatorio '{name}' ausente"))
+        for name, value in definition.items():
+            if name not in self.known:
+                problems.append(('warning', f"campo '{name}' nao existe em ServiceDefinition"))
+            elif not self.checkers[name](value):
+                problems.append(('error', f"'{name}' = {value!r} nao e do tipo {self.types[name]}"))
+        if isinstance(definition.get('name'), str) and not definition['name'].strip():
+            problems.append(('error', 'name vazio'))
+        return problems
+
+    def normalize(self, definition):
+        """Mesmo conteúdo, chaves na ordem da interface (extras ao final, ordenadas)"""
+        ordered = {name: definition[name] for name in self.order if name in definition}
+        for name in sorted(definition):
+            if name not in ordered:
+                ordered[name] = definition[name]
+        return ordered
+
+
+def build_catalog(seeds_dir, schema=None):
+    """
+    (serviços normalizados, problemas, {arquivo: sha1}) dos seeds da
+    tabela de departamentos, na ordem do allServices.
+    """
+    schema = schema or DefinitionSchema.load()
+    services = []
+    issues = []
+    sources = {}
+    seen_names = {}
+    seen_modules = {}
+
+    for department in DEPARTMENTS:
+        filepath = os.path.join(seeds_dir, department.file)
+        if not os.path.exists(filepath):
+            issues.append(CatalogIssue('error', department.file, 0, '', 'arquivo de seed nao encontrado'))
+            continue
+
+        with open(filepath, 'rb') as f:
+            sources[department.file] = hashlib.sha1(f.read()).hexdigest()
+
+        for entry in load_definitions(filepath):
+            line = entry['line']
+            label = entry['name'] or ''
+            if 'error' in entry:
+                issues.append(CatalogIssue('error', department.file, line, label, entry['error']))
+                continue
+
+            definition = entry['definition']
+            for severity, message in schema.validate(definition):
+                issues.append(CatalogIssue(severity, department.file, line, label, message))
+
+            code = definition.get('departmentCode')
+            if code != department.code:
+                issues.append(CatalogIssue('warning', department.file, line, label,
+                                           f"departmentCode '{code}' em arquivo de {department.code}"))
+
+            # seedServices identifica o serviço por (name, departamento)
+            key = (normalize_name(str(definition.get('name', ''))), code)
+            if key in seen_names:
+                issues.append(CatalogIssue('warning', department.file, line, label,
+                                           f"nome duplicado (primeira ocorrencia em {seen_names[key]})"))
+            else:
+                seen_names[key] = f"{department.file}:{line}"
+
+            # moduleType é @unique em services_simplified: o segundo create falha no seed
+            module_type = definition.get('moduleType')
+            if module_type:
+                if module_type in seen_modules:
+                    issues.append(CatalogIssue('warning', department.file, line, label,
+                                               f"moduleType '{module_type}' repetido (primeira ocorrencia em {seen_modules[module_type]})"))
+                else:
+                    seen_modules[module_type] = f"{department.file}:{line}"
+
+            services.append(schema.normalize(definition))
+
+    return services, issues, sources
+
+
+def with_fingerprint(definition):
+    return {**definition, 'fingerprint': service_fingerprint(definition)}
+
+
+def catalog_document(services, sources):
+    return {
+        'version': CATALOG_VERSION,
+        'count': len(services),
+        'sources': sources,
+        'services': [with_fingerprint(s) for s in services],
+    }
+
+
+def _dumps(value):
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def write_catalog(services, sources, out_dir, writer, ndjson=True):
+    """Registra os arquivos do catálogo no writer (gravados no flush)"""
+    writer.write(os.path.join(out_dir, CATALOG_JSON), _dumps(catalog_document(services, sources)) + '\n')
+    if ndjson:
+        writer.write(os.path.join(out_dir, CATALOG_NDJSON), ''.join(_dumps(with_fingerprint(s)) + '\n' for s in services))
@@ -0,0 +1,186 @@
+"""
+Diff de catálogos de serviços por chave normalizada
+
+A chave de um serviço é (nome normalizado, departmentCode): sem acentos,
+caixa e espaços repetidos. Tudo é indexado em dicts, então o diff é linear
+no número de serviços dos dois lados, e retorna:
+
+- added:   chave só no catálogo novo
+- removed: chave só no catálogo base
+- renamed: par (base, novo) com o mesmo fingerprint de conteúdo (ver
+           digiurban_tools.fingerprint, que ignora o name), achado por
+           consulta a dict
+- changed: par (base, novo) com a mesma chave e conteúdo diferente
+
+Os serviços são dicts com 'name', 'department_code' e, opcionalmente,
+'code' (o texto do objeto) e 'fingerprint'. Sem 'fingerprint' ele é
+calculado do 'code' só para os adicionados/removidos (objeto que não
+avalia, ex.: com referências a fragmentos, cai no hash dos tokens). Sem
+nenhum dos dois não há detecção de renomeação nem de conteúdo alterado.
+"""
+
+import hashlib
+import re
+import unicodedata
+from dataclasses import dataclass, field
+
+from digiurban_tools import profiling
+from digiurban_tools.fingerprint import service_fingerprint
+from digiurban_tools.seed_lexer import tokenize
+from digiurban_tools.ts_literal import LiteralError, evaluate
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def normalize_name(name):
+    """'  Atendimentos -  Saúde ' -> 'atendimentos - saude'"""
+    decomposed = unicodedata.normalize('NFKD', name)
+    folded = ''.join(c for c in decomposed if not unicodedata.combining(c))
+    return _WHITESPACE_RE.sub(' ', folded).strip().casefold()
+
+
+def service_key(service, department_code=None):
+    return (
+        normalize_name(service['name']),
+        service.get('department_code') or department_code or '',
+    )
+
+
+def service_entries(index, section=None):
+    """Serviços de um SeedIndex no formato aceito por diff_services"""
+    return [
+        {
+            'name': s.name,
+            'department_code': s.department_code,
+            'code': index.service_text(s),
+            'line': s.line,
+        }
+        for s in index.services(section)
+        if s.name is not None
+    ]
+
+
+def _normalized_tokens(code, include_name):
+    """
+    Tokens do objeto sem espaços, comentários e vírgulas finais. Com
+    include_name=False o par `name: '...'` do nível superior é omitido.
+    """
+    tokens = tokenize(code)
+    parts = []
+    depth = 0
+    skip = 0
+    for i, (kind, start, end) in enumerate(tokens):
+        if skip:
+            skip -= 1
+            continue
+        value = code[start:end]
+        if kind == 'punct':
+            if value in '{[(':
+                depth += 1
+            elif value in '}])':
+                depth -= 1
+                if parts and parts[-1] == ',':
+                    parts.pop()
+        if (
+            not include_name
+            and depth == 1
+            and value == 'name'
+            and i + 2 < len(tokens)
+            and code[tokens[i + 1][1]:tokens[i + 1][2]] == ':'
+        ):
+            skip = 2
+            if i + 3 < len(tokens) and code[tokens[i + 3][1]:tokens[i + 3][2]] == ',':
+                skip = 3
+            continue
+        parts.append(value)
+    return parts
+
+
+def content_hash(code, include_name=True):
+    """Hash do conteúdo do objeto, independente de formatação e comentários"""
+    joined = '\x1f'.join(_normalized_tokens(code, include_name))
+    return hashlib.blake2b(joined.encode('utf-8'), digest_size=16).hexdigest()
+
+
+@dataclass
+class CatalogDiff:
+    added: list = field(default_factory=list)
+    removed: list = field(default_factory=list)
+    renamed: list = field(default_factory=list)
+    changed: list = field(default_factory=list)
+    unchanged: int = 0
+
+    def is_empty(self):
+        return not (self.added or self.removed or self.renamed or self.changed)
+
+
+def _by_key(services, department_code):
+    indexed = {}
+    for service in services:
+        indexed.setdefault(service_key(service, department_code), service)
+    return indexed
+
+
+def _body_hash(service, memo):
+    if 'fingerprint' in service:
+        return service['fingerprint']
+    code = service.get('code')
+    if code is None:
+        return None
+    key = id(service)
+    if key not in memo:
+        try:
+            memo[key] = service_fingerprint(evaluate(code))
+        except LiteralError:
+            memo[key] = content_hash(code, include_name=False)
+    return memo[key]
+
+
+def diff_services(base, target, department_code=None):
+    """
+    Compara o catálogo base (ex.: seed modular) com o alvo (ex.: fonte).
+    department_code é usado para serviços sem departmentCode próprio.
+    Duplicatas de chave em um mesmo lado contam uma vez (a primeira).
+    """
+    with profiling.phase('diff'):
+        return _diff_services(base, target, department_code)
+
+
+def _diff_services(base, target, department_code):
+    base_by_key = _by_key(base, department_code)
+    target_by_key = _by_key(target, department_code)
+
+    result = CatalogDiff()
+    added = []
+    for key, service in target_by_key.items():
+        old = base_by_key.get(key)
+        if old is None:
+            added.append(service)
+        elif old.get('code') is not None and service.get('code') is not None \
+                and content_hash(old['code']) != content_hash(service['code']):
+            result.changed.append((old, service))
+        else:
+            result.unchanged += 1
+
+    removed = [s for key, s in base_by_key.items() if key not in target_by_key]
+
+    # Renomeações: removido e adicionado com o mesmo fingerprint (sem o name)
+    memo = {}
+    removed_by_body = {}
+    for service in removed:
+        body = _body_hash(service, memo)
+        if body is not None:
+            removed_by_body.setdefault(body, []).append(service)
+
+    renamed_old = set()
+    for service in added:
+        candidates = removed_by_body.get(_body_hash(service, memo))
+        if candidates:
+            old = candidates.pop(0)
+            renamed_old.add(id(old))
+            result.renamed.append((old, service))
+        else:
+            result.added.append(service)
+
+    result.removed = [s for s in removed if id(s) not in renamed_old]
+    return result
@@ -0,0 +1,158 @@
+"""
+digiurban-tools: ponto de entrada único das ferramentas de seeds e manutenção
+
+    python -m digiurban_tools [opções globais] COMANDO [opções] [COMANDO [opções] ...]
+
+Vários comandos na mesma chamada rodam em sequência e compartilham o
+catálogo parseado em memória (Session), ex.:
+
+    python -m digiurban_tools merge dedupe analyze
+
+Os módulos dos comandos só são importados quando usados, para que --help
+e comandos pequenos iniciem rápido; por isso este módulo não importa nada
+do pacote no nível de módulo além de paths e arguments.
+"""
+
+import argparse
+import importlib
+import sys
+
+from digiurban_tools.arguments import add_cache_arguments, add_jobs_argument, add_profile_arguments
+from digiurban_tools.paths import SERVICES_SEEDS_DIR, SOURCE_SERVICES_TS
+
+# nome -> (módulo, ajuda curta). A ajuda fica aqui para não importar o módulo no --help.
+COMMANDS = {
+    'extract': ('digiurban_tools.commands.extract',
+                'gera os seeds modulares e o index.ts a partir do arquivo consolidado'),
+    'analyze': ('digiurban_tools.commands.analyze',
+                'conta servicos por secao e compara a fonte com os seeds modulares'),
+    'dedupe': ('digiurban_tools.commands.dedupe',
+               'verifica nomes de servico duplicados em cada seed'),
+    'near-dupes': ('digiurban_tools.commands.near_dupes',
+                   'agrupa servicos quase duplicados entre secretarias (MinHash/LSH)'),
+    'fields': ('digiurban_tools.commands.fields',
+               'consulta citizenFields e fields[].id do catalogo (matriz de bitsets)'),
+    'validate-forms': ('digiurban_tools.commands.validate_forms',
+                       'valida os formSchema do catalogo contra schema-types.ts'),
+    'hoist-fragments': ('digiurban_tools.commands.hoist_fragments',
+                        'move trechos de formSchema repetidos para shared-fragments.ts'),
+    'fingerprints': ('digiurban_tools.commands.fingerprints',
+                     'gera o fingerprints.ts (hash de conteudo de cada servico)'),
+    'compile-catalog': ('digiurban_tools.commands.compile_catalog',
+                        'compila os seeds em um catalogo JSON/NDJSON validado'),
+    'upsert-sql': ('digiurban_tools.commands.upsert_sql',
+                   'gera o SQL de upsert em lote do catalogo (COPY + ON CONFLICT)'),
+    'db-diff': ('digiurban_tools.commands.db_diff',
+                'compara o catalogo com um export de services_simplified (SQL/JSON minimo)'),
+    'merge': ('digiurban_tools.commands.merge',
+              'adiciona aos seeds os servicos da fonte que ainda faltam'),
+    'fix-api-urls': ('digiurban_tools.commands.fix_api_urls',
+                     'corrige as URLs do backend nas rotas API do super-admin'),
+    'fix-dynamic-routes': ('digiurban_tools.commands.fix_dynamic_routes',
+                           "adiciona export const dynamic as rotas API que usam cookies"),
+    'rewrite': ('digiurban_tools.commands.rewrite',
+                'aplica um arquivo de regras de reescrita (JSON/YAML) ao frontend'),
+    'prune-models': ('digiurban_tools.commands.prune_models',
+                     'remove models legados do schema.prisma'),
+}
+
+PROG = 'digiurban-tools'
+
+
+def _add_global_options(parser):
+    parser.add_argument('--source', default=SOURCE_SERVICES_TS,
+                        help='arquivo consolidado (padrao: prisma/seeds/services-simplified-complete.ts)')
+    parser.add_argument('--seeds-dir', default=SERVICES_SEEDS_DIR,
+                        help='diretorio dos seeds modulares (padrao: prisma/seeds/services)')
+    add_jobs_argument(parser)
+    add_cache_arguments(parser)
+    add_profile_arguments(parser)
+
+
+def _global_parser():
+    parser = argparse.ArgumentParser(
+        prog=PROG,
+        usage=f'{PROG} [opcoes globais] COMANDO [opcoes] [COMANDO [opcoes] ...]',
+        description='Ferramentas de manutencao dos seeds de servicos e do frontend.',
+        epilog='comandos:\n' + '\n'.join(f'  {name:20} {help_text}' for name, (_module, help_text) in COMMANDS.items())
+               + f'\n\nAjuda de um comando: {PROG} COMANDO --help',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    _add_global_options(parser)
+    return parser
+
+
+def split_commands(argv):
+    """(argumentos globais, [(comando, argumentos)]) separando pelos nomes de comando"""
+    global_args = []
+    chain = []
+    for token in argv:
+        if token in COMMANDS:
+            chain.append((token, []))
+        elif chain:
+            chain[-1][1].append(token)
+        else:
+            global_args.append(token)
+    return global_args, chain
+
+
+def load_command(name):
+    return importlib.import_module(COMMANDS[name][0])
+
+
+def command_parser(name, module):
+    parser = argparse.ArgumentParser(prog=f'{PROG} {name}', description=module.__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    module.add_arguments(parser)
+
+    # Opções globais também são aceitas depois do comando (ex.: scripts antigos
+    # chamando `merge --no-cache`); sem default, só aparecem se informadas
+    group = parser.add_argument_group('opcoes globais')
+    _add_global_options(group)
+    for action in group._group_actions:
+        action.default = argparse.SUPPRESS
+    return parser
+
+
+def main(argv=None):
+    """Executa a cadeia de comandos; retorna o código de saída do primeiro que falhar"""
+    argv = sys.argv[1:] if argv is None else list(argv)
+    global_argv, chain = split_commands(argv)
+
+    parser = _global_parser()
+    args = parser.parse_args(global_argv)
+    if not chain:
+        parser.print_help()
+        return 2
+
+    # Valida todos os argumentos antes de executar o primeiro comando
+    global_dests = set(vars(args))
+    steps = []
+    for name, command_argv in chain:
+        module = load_command(name)
+        command_args = command_parser(name, module).parse_args(command_argv)
+        for dest in global_dests & set(vars(command_args)):
+            setattr(args, dest, getattr(command_args, dest))
+            delattr(command_args, dest)
+        steps.append((name, module, command_args))
+
+    from digiurban_tools import profiling, seed_cache
+    from digiurban_tools.parallel import resolve_jobs
+    from digiurban_tools.session import Session
+
+    seed_cache.apply_cache_arguments(args)
+    profiling.apply_profile_arguments(args, script='-'.join([PROG] + [name for name, _argv in chain]))
+
+    session = Session(args.source, args.seeds_dir, resolve_jobs(args.jobs))
+    for name, module, command_args in steps:
+        if len(steps) > 1:
+            print(f"\n>>> {name}\n")
+        with profiling.phase(f'command:{name}'):
+            code = module.run(command_args, session)
+        if code:
+            return code
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
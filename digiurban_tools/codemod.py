@@ -0,0 +1,203 @@
+"""
+Execução de codemods sobre a árvore do frontend
+
+Um codemod é uma transformação idempotente transform(texto, caminho) ->
+(texto novo, acertos por regra), aplicada aos arquivos cujo caminho
+relativo (com '/') passa no filtro `matches`. Os codemods do CLI vêm de
+arquivos de regras (digiurban_tools.rewrite_rules). run_codemods():
+
+- percorre a árvore com os.scandir (sem node_modules, .next e diretórios
+  ocultos)
+- processa os arquivos em um pool de threads
+- grava só quando o conteúdo muda (atomic_write); com diff=True guarda
+  também o diff unificado de cada arquivo alterado (útil com dry_run)
+- lembra tamanho, mtime e sha1 dos arquivos já limpos em CACHE_DIR; na
+  próxima execução um arquivo com o mesmo tamanho e mtime nem é lido, e
+  um com mtime diferente mas mesmo sha1 não passa pelas transformações
+
+A entrada do cache vale para um conjunto de codemods (nomes + assinatura):
+mudar os padrões de um codemod descarta os arquivos marcados como limpos
+por ele. --no-cache ignora o cache; --clear-cache o remove.
+"""
+
+import difflib
+import hashlib
+import marshal
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable
+
+from digiurban_tools import profiling, seed_cache
+from digiurban_tools.output import WriteStats, atomic_write
+from digiurban_tools.paths import CACHE_DIR
+
+# Sobe quando o formato da entrada mudar
+CODEMOD_CACHE_VERSION = 1
+# Extensão .idx para que --clear-cache também remova este arquivo
+CODEMOD_CACHE_FILE = 'codemods.idx'
+
+SKIP_DIRS = {'node_modules', '.next', 'dist', 'build', 'coverage'}
+
+
+@dataclass(frozen=True)
+class Codemod:
+    name: str
+    transform: Callable[[str, str], tuple]
+    matches: Callable[[str], bool]
+    # Muda quando a transformação muda (ex.: repr dos padrões)
+    signature: str = ''
+
+
+@dataclass
+class CodemodReport:
+    files_scanned: int = 0
+    files_cached: int = 0
+    # (caminho relativo, {regra: acertos})
+    changed: list = field(default_factory=list)
+    hits: dict = field(default_factory=dict)
+    diffs: list = field(default_factory=list)
+    stats: WriteStats = field(default_factory=WriteStats)
+
+
+def walk(root, skip_dirs=SKIP_DIRS):
+    """Gera (caminho relativo com '/', DirEntry) dos arquivos sob root, em ordem"""
+    stack = [('', root)]
+    while stack:
+        prefix, directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except FileNotFoundError:
+            continue
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in skip_dirs and not entry.name.startswith('.'):
+                    subdirs.append((prefix + entry.name + '/', entry.path))
+            elif entry.is_file():
+                yield prefix + entry.name, entry
+        stack.extend(reversed(subdirs))
+
+
+def _cache_key(root, codemods):
+    parts = [os.path.abspath(root)] + [f'{c.name}:{c.signature}' for c in codemods]
+    return hashlib.sha1('\0'.join(parts).encode('utf-8')).hexdigest()
+
+
+def _load_cache(cache_path):
+    try:
+        with open(cache_path, 'rb') as f:
+            data = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return {}
+    if not isinstance(data, dict) or data.get('version') != CODEMOD_CACHE_VERSION:
+        return {}
+    return data['entries']
+
+
+def _save_cache(cache_path, entries):
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        marshal.dump({'version': CODEMOD_CACHE_VERSION, 'entries': entries}, f)
+    os.replace(tmp_path, cache_path)
+
+
+def _apply(codemods, content, relpath):
+    hits = {}
+    for codemod in codemods:
+        new_content, codemod_hits = codemod.transform(content, relpath)
+        if new_content != content:
+            content = new_content
+            for name, amount in codemod_hits.items():
+                hits[name] = hits.get(name, 0) + amount
+    return content, hits
+
+
+def unified_diff(relpath, old, new):
+    return ''.join(difflib.unified_diff(
+        old.splitlines(keepends=True), new.splitlines(keepends=True),
+        fromfile=f'a/{relpath}', tofile=f'b/{relpath}',
+    ))
+
+
+def _process(relpath, path, codemods, known_sha1, dry_run, diff):
+    """(sha1 do conteúdo final, bytes lidos, acertos por regra, bytes gravados, diff)"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    sha1 = hashlib.sha1(data).hexdigest()
+    if sha1 == known_sha1:
+        return sha1, len(data), {}, 0, None
+
+    # Bytes decodificados sem tradução de fim de linha: CRLF é preservado
+    original = data.decode('utf-8')
+    content, hits = _apply(codemods, original, relpath)
+    if not hits:
+        return sha1, len(data), {}, 0, None
+
+    new_data = content.encode('utf-8')
+    if not dry_run:
+        atomic_write(path, new_data)
+    patch = unified_diff(relpath, original, content) if diff else None
+    return hashlib.sha1(new_data).hexdigest(), len(data), hits, len(new_data), patch
+
+
+def run_codemods(root, codemods, jobs=None, dry_run=False, diff=False, use_cache=None, cache_dir=None):
+    """Aplica os codemods aos arquivos de root; retorna um CodemodReport (ordem do walk)"""
+    if use_cache is None:
+        use_cache = seed_cache.is_enabled()
+    cache_path = os.path.join(cache_dir or CACHE_DIR, CODEMOD_CACHE_FILE)
+    all_entries = _load_cache(cache_path) if use_cache else {}
+    key = _cache_key(root, codemods)
+    known = all_entries.get(key, {})
+    clean = {}
+
+    report = CodemodReport()
+    pending = []
+    with profiling.phase('scan'):
+        for relpath, entry in walk(root):
+            selected = [c for c in codemods if c.matches(relpath)]
+            if not selected:
+                continue
+            report.files_scanned += 1
+            stat = entry.stat()
+            cached = known.get(relpath)
+            if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+                # Mesmo tamanho e mtime de quando estava limpo: nem lê
+                report.files_cached += 1
+                clean[relpath] = cached
+                continue
+            pending.append((relpath, entry.path, selected, cached[2] if cached else None))
+
+    # Leitura, hash e transformação liberam o GIL o suficiente para o pool de
+    # threads; sem --jobs explícito (> 1) usa o tamanho padrão do executor
+    workers = jobs if jobs and jobs > 1 else min(32, (os.cpu_count() or 1) + 4)
+    with profiling.phase('codemod'), ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(lambda item: _process(*item, dry_run, diff), pending))
+
+    for (relpath, path, _selected, _known_sha1), (sha1, bytes_read, hits, bytes_written, patch) in zip(pending, results):
+        profiling.count('bytes_read', bytes_read)
+        if hits:
+            report.changed.append((relpath, hits))
+            for name, amount in hits.items():
+                report.hits[name] = report.hits.get(name, 0) + amount
+            if patch:
+                report.diffs.append(patch)
+            if dry_run:
+                continue
+            report.stats.files_written += 1
+            report.stats.bytes_written += bytes_written
+        else:
+            report.stats.files_unchanged += 1
+        stat = os.stat(path)
+        clean[relpath] = (stat.st_size, stat.st_mtime_ns, sha1)
+
+    profiling.count('files_scanned', report.files_scanned)
+    profiling.count('files_cached', report.files_cached)
+    profiling.count('files_rewritten', report.stats.files_written)
+
+    if use_cache and clean != known:
+        all_entries[key] = clean
+        _save_cache(cache_path, all_entries)
+    return report
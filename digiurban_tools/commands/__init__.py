@@ -0,0 +1,6 @@
+"""
+Subcomandos do digiurban-tools (ver digiurban_tools.cli)
+
+Cada módulo expõe add_arguments(parser) e run(args, session) e é
+importado só quando o comando é usado.
+"""
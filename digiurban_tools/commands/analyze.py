@@ -0,0 +1,136 @@
+"""
+Conta os serviços por seção do arquivo consolidado e compara com os seeds
+modulares: faltantes e possíveis renomeações por secretaria
+
+Com --format ndjson|csv cada contagem e cada serviço faltante/renomeado
+sai como um registro assim que é calculado (ver digiurban_tools.report):
+
+- section:    serviços da seção na fonte (source_count)
+- comparison: modular_count / source_count e missing por secretaria
+- missing:    serviço da fonte que não está no seed (name, line na fonte)
+- renamed:    serviço possivelmente renomeado (name e line na fonte,
+              seed_name no seed)
+"""
+
+from itertools import groupby
+
+from digiurban_tools.catalog_diff import diff_services, service_entries
+from digiurban_tools.departments import DEPARTMENTS, source_section
+from digiurban_tools.report import add_format_argument, message_stream, write_records
+
+COLUMNS = ('type', 'department_code', 'department', 'section', 'source_count', 'modular_count',
+           'missing', 'name', 'seed_name', 'line')
+
+
+def add_arguments(parser):
+    """Além de --format, usa --source e --seeds-dir globais"""
+    add_format_argument(parser)
+
+
+def _record(kind, department, **values):
+    return {'type': kind, 'department_code': department.code, 'department': department.name, **values}
+
+
+def records(session, source):
+    """Registros da análise, na ordem do relatório em texto"""
+    sections = [(department, source_section(department, source)) for department in DEPARTMENTS]
+
+    for department, section_key in sections:
+        count = len(source.services(section_key)) if section_key else 0
+        yield _record('section', department, section=section_key, source_count=count)
+
+    for department, section_key in sections:
+        # Conta serviços no arquivo modular
+        seed = session.seed(department)
+        modular_count = len(seed.services()) if seed else 0
+        source_count = len(source.services(section_key)) if section_key else 0
+        yield _record('comparison', department, section=section_key, source_count=source_count,
+                      modular_count=modular_count, missing=source_count - modular_count)
+
+    for department, section_key in sections:
+        if section_key is None:
+            continue
+
+        # Serviços da fonte e do modular (mesmos índices já carregados acima)
+        source_services = service_entries(source, section_key)
+        seed = session.seed(department)
+        modular_services = service_entries(seed) if seed else []
+
+        # Identifica faltantes (nome normalizado + departmentCode)
+        diff = diff_services(modular_services, source_services, department.code)
+        for service in diff.added:
+            yield _record('missing', department, section=section_key, name=service['name'], line=service['line'])
+        for seeded, new in diff.renamed:
+            yield _record('renamed', department, section=section_key, name=new['name'],
+                          seed_name=seeded['name'], line=new['line'])
+
+
+def print_text(records):
+    """Relatório em texto a partir dos registros (guarda só os totais)"""
+    total = total_modular = total_missing = 0
+    phase = None
+
+    def advance(target):
+        # Fecha as partes anteriores do relatório e abre a de `target`
+        nonlocal phase
+        order = ('section', 'comparison', 'details')
+        while phase != target:
+            if phase == 'section':
+                print("=" * 60)
+                print(f"{'TOTAL':25} : {total:3} servicos")
+            elif phase == 'comparison':
+                print("=" * 60)
+                print(f"{'TOTAL':25} : {total_modular:3} / {total:3} (FALTAM {total_missing})")
+            phase = order[0] if phase is None else order[order.index(phase) + 1]
+            if phase == 'section':
+                print("Analise de services-simplified-complete.ts\n")
+                print("=" * 60)
+            elif phase == 'comparison':
+                # Agora vamos comparar com os seeds modulares
+                print("\n\nComparacao com seeds modulares:\n")
+                print("=" * 60)
+            else:
+                print("\n\nServicos faltantes por secao:\n")
+                print("=" * 80)
+
+    for (kind, _code), group in groupby(records, key=lambda r: (r['type'], r['department_code'])):
+        if kind == 'section':
+            advance('section')
+            for record in group:
+                total += record['source_count']
+                print(f"{record['department']:25} : {record['source_count']:3} servicos")
+        elif kind == 'comparison':
+            advance('comparison')
+            for record in group:
+                total_modular += record['modular_count']
+                total_missing += record['missing']
+                status = "OK" if record['missing'] == 0 else "FALTAM"
+                print(f"{record['department']:25} : {record['modular_count']:3} / {record['source_count']:3} "
+                      f"({status} {record['missing']})")
+        else:
+            advance('details')
+            # Um grupo é uma secretaria: faltantes ou renomeações
+            group = list(group)
+            department = group[0]['department']
+            if kind == 'missing':
+                print(f"\n{department} ({len(group)} faltantes):")
+                for i, record in enumerate(group, 1):
+                    print(f"  {i:2}. {record['name']}")
+            else:
+                print(f"\n{department} ({len(group)} possiveis renomeacoes):")
+                for record in group:
+                    print(f"  - {record['name']}  <-  {record['seed_name']}")
+    advance('details')
+
+
+def run(args, session):
+    source = session.source()
+    if source is None:
+        print(f"ERRO: Arquivo fonte nao encontrado: {session.source_file}", file=message_stream(args.format))
+        return 1
+
+    if args.format == 'text':
+        print_text(records(session, source))
+    else:
+        write_records(records(session, source), args.format, COLUMNS)
+    return 0
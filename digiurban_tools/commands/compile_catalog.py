@@ -0,0 +1,43 @@
+"""
+Compila os seeds modulares de serviços em um catálogo JSON/NDJSON validado
+
+Lê os *.seed.ts de --seeds-dir; o catálogo é gravado no próprio
+diretório dos seeds, ou em --out-dir.
+"""
+
+from digiurban_tools.catalog import CATALOG_JSON, CATALOG_NDJSON, build_catalog, write_catalog
+
+
+def add_arguments(parser):
+    parser.add_argument('--out-dir', default=None,
+                        help='onde gravar o catalogo (padrao: o proprio --seeds-dir)')
+    parser.add_argument('--no-ndjson', action='store_true',
+                        help=f'nao gera {CATALOG_NDJSON}')
+    parser.add_argument('--check', action='store_true',
+                        help='apenas valida, sem gravar arquivos')
+
+
+def run(args, session):
+    services, issues, sources = build_catalog(session.seeds_dir)
+
+    for issue in issues:
+        print(issue)
+
+    errors = sum(1 for issue in issues if issue.severity == 'error')
+    warnings = len(issues) - errors
+    print(f"\n{len(services)} servicos em {len(sources)} arquivos ({errors} erros, {warnings} avisos)")
+
+    if errors:
+        print("ERRO: catalogo nao gerado")
+        return 1
+
+    if args.check:
+        return 0
+
+    writer = session.writer()
+    write_catalog(services, sources, args.out_dir or session.seeds_dir, writer, ndjson=not args.no_ndjson)
+    stats = writer.flush()
+
+    print(f"OK Catalogo: {CATALOG_JSON}{'' if args.no_ndjson else ' + ' + CATALOG_NDJSON}")
+    print(stats.summary())
+    return 0
@@ -0,0 +1,78 @@
+"""
+Compara o catálogo dos seeds com um export de services_simplified e gera
+só as mudanças: serviços novos, colunas alteradas e desativações
+
+O export é um CSV com cabeçalho ou JSON/NDJSON da tabela (ver
+digiurban_tools.db_diff); sem a coluna departmentCode, passe também um
+export de departments com --departments. A saída é um script SQL
+(--emit sql, padrão) ou um documento JSON (--emit json), no stdout ou em
+-o ARQUIVO; o resumo vai para o stderr quando o diff sai no stdout.
+"""
+
+import json
+import sys
+
+from digiurban_tools.catalog import build_catalog
+from digiurban_tools.db_diff import diff_catalog, diff_document, generate_sql, load_departments, load_export
+
+
+def add_arguments(parser):
+    parser.add_argument('export', help='export de services_simplified (.csv, .json ou .ndjson)')
+    parser.add_argument('--departments', default=None, metavar='ARQ',
+                        help='export de departments (id, code) quando o de servicos nao tem departmentCode')
+    parser.add_argument('--emit', choices=('sql', 'json'), default='sql',
+                        help='formato do diff (padrao: sql)')
+    parser.add_argument('-o', '--output', default=None,
+                        help='grava o diff neste arquivo (padrao: stdout)')
+    parser.add_argument('--no-deactivate', action='store_true',
+                        help='nao desativa servicos do banco que sairam do catalogo')
+
+
+def run(args, session):
+    messages = sys.stdout if args.output else sys.stderr
+
+    services, issues, _sources = build_catalog(session.seeds_dir)
+    errors = [issue for issue in issues if issue.severity == 'error']
+    for issue in errors:
+        print(issue, file=messages)
+    if errors:
+        print(f"ERRO: {len(errors)} erros no catalogo, diff nao gerado", file=messages)
+        return 1
+
+    try:
+        departments = load_departments(args.departments) if args.departments else None
+        rows = load_export(args.export, departments)
+    except OSError as e:
+        print(f"ERRO: export nao lido: {e}", file=messages)
+        return 1
+    except ValueError as e:
+        # ExportError, JSON/CSV inválido ou valor fora do tipo da coluna
+        print(f"ERRO: export invalido: {e}", file=messages)
+        return 1
+
+    diff = diff_catalog(services, rows, deactivate=not args.no_deactivate)
+    if diff.unmapped:
+        print(f"AVISO: {len(diff.unmapped)} linhas sem departmentCode ignoradas (use --departments)", file=messages)
+    for row in diff.duplicates:
+        print(f"AVISO: linha duplicada no banco, mantida: {row['id']} [{row['departmentCode']}] {row['name']}",
+              file=messages)
+
+    if args.emit == 'sql':
+        content = generate_sql(diff)
+    else:
+        content = json.dumps(diff_document(diff), ensure_ascii=False, indent=2) + '\n'
+
+    if args.output:
+        writer = session.writer()
+        writer.write(args.output, content)
+        stats = writer.flush()
+    else:
+        sys.stdout.write(content)
+
+    print(f"Catalogo: {len(services)} servicos, banco: {len(rows)} linhas", file=messages)
+    print(f"Novos: {len(diff.creates)}, alterados: {len(diff.updates)} ({len(diff.renamed)} renomeados), "
+          f"desativados: {len(diff.deactivations)}, "
+          f"sem mudanca: {diff.unchanged}", file=messages)
+    if args.output:
+        print(stats.summary(), file=messages)
+    return 0
@@ -0,0 +1,271 @@
+"""
+Analisa cada arquivo de seed modular para verificar duplicações de nome
+
+Com --format ndjson|csv cada arquivo e cada nome duplicado sai como um
+registro assim que o arquivo é analisado (ver digiurban_tools.report):
+
+- file:      total de serviços, nomes únicos, nomes repetidos e duplicações
+             (ocorrências além da primeira) do arquivo
+- duplicate: nome repetido (name, count) no arquivo
+- not_found: arquivo de seed inexistente
+
+Com --watch fica acompanhando o diretório dos seeds (polling por stat):
+a cada gravação só o arquivo alterado é reparseado, o índice global de
+nomes é atualizado e o relatório de duplicações (no arquivo e entre
+arquivos), departmentCode ausentes ou divergentes e a variação das
+contagens é impresso de novo.
+"""
+
+import os
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+
+from digiurban_tools.arguments import positive_float
+from digiurban_tools.departments import DEPARTMENTS
+from digiurban_tools.parallel import map_ordered
+from digiurban_tools.report import add_format_argument, write_records
+from digiurban_tools.seed_cache import load_index
+from digiurban_tools.seed_lexer import SeedLexError, index_file
+from digiurban_tools.watch import watch
+
+
+COLUMNS = ('type', 'department_code', 'file', 'name', 'count', 'total', 'unique', 'duplicated_names', 'duplicates')
+
+
+def add_arguments(parser):
+    add_format_argument(parser)
+    parser.add_argument('--watch', action='store_true',
+                        help='acompanha os seeds e reanalisa a cada alteracao (Ctrl+C para sair)')
+    parser.add_argument('--interval', type=positive_float, default=0.05, metavar='SEG',
+                        help='intervalo do polling no modo --watch (padrao: 0.05)')
+
+
+def count_names(filepath):
+    """Nomes e contagem por nome de um arquivo (executa em um worker com --jobs)"""
+    if not os.path.exists(filepath):
+        return None
+
+    # Apenas o name de cada objeto de serviço (ignora name aninhado em documentos/links)
+    names = load_index(filepath).service_names()
+    return names, Counter(names)
+
+
+def _results(session):
+    if session.jobs > 1:
+        # Parse de cada arquivo em paralelo; o relatório segue a ordem de DEPARTMENTS
+        return map_ordered(count_names, [(session.seed_path(d),) for d in DEPARTMENTS], jobs=session.jobs)
+
+    return (_seed_names(session.seed(department)) for department in DEPARTMENTS)
+
+
+def _seed_names(seed):
+    if seed is None:
+        return None
+    names = seed.service_names()
+    return names, Counter(names)
+
+
+@dataclass
+class SeedNames:
+    """Estado de um arquivo de seed no índice global"""
+    names: Counter
+    total: int
+    # (linha, nome) de serviços sem departmentCode ou com outro código
+    missing_code: list = field(default_factory=list)
+    other_code: list = field(default_factory=list)
+
+
+class NameIndex:
+    """Índice global nome -> {arquivo: ocorrências}, atualizado por arquivo"""
+
+    def __init__(self):
+        self.files = {}
+        self.by_name = {}
+        # Nomes presentes em mais de um arquivo
+        self.shared = set()
+
+    def total(self):
+        return sum(state.total for state in self.files.values())
+
+    def update(self, department, seed):
+        """Substitui o estado de um arquivo (seed=None: arquivo removido)"""
+        file = department.file
+        old = self.files.pop(file, None)
+        touched = set(old.names) if old else set()
+
+        if seed is not None:
+            services = seed.services()
+            state = SeedNames(Counter(s.name for s in services if s.name is not None), len(services))
+            for service in services:
+                if service.department_code is None:
+                    state.missing_code.append((service.line, service.name))
+                elif service.department_code != department.code:
+                    state.other_code.append((service.line, service.name, service.department_code))
+            self.files[file] = state
+            touched.update(state.names)
+
+        for name in touched:
+            files = self.by_name.get(name, {})
+            files.pop(file, None)
+            if seed is not None and name in self.files[file].names:
+                files[file] = self.files[file].names[name]
+            if files:
+                self.by_name[name] = files
+            else:
+                self.by_name.pop(name, None)
+            if len(files) > 1:
+                self.shared.add(name)
+            else:
+                self.shared.discard(name)
+        return old.total if old else 0
+
+
+def _print_watch_report(index):
+    duplicates = 0
+    for department in DEPARTMENTS:
+        state = index.files.get(department.file)
+        if state is None:
+            continue
+        for name, count in state.names.items():
+            if count > 1:
+                duplicates += count - 1
+                print(f"  DUPLICADO   {department.file}: '{name}' aparece {count}x")
+        for line, name in state.missing_code:
+            print(f"  SEM CODIGO  {department.file}:{line}: '{name}' sem departmentCode")
+        for line, name, code in state.other_code:
+            print(f"  CODIGO      {department.file}:{line}: '{name}' com departmentCode {code} (esperado {department.code})")
+    for name in sorted(index.shared):
+        print(f"  ENTRE ARQS  '{name}': {', '.join(sorted(index.by_name[name]))}")
+    print(f"  Total: {index.total()} servicos, {duplicates} duplicacoes, "
+          f"{len(index.shared)} nomes em mais de um arquivo")
+
+
+def _reindex(path, department):
+    """Índice novo do arquivo (None se removido); False se não parseia"""
+    try:
+        return index_file(path) if os.path.exists(path) else None
+    except SeedLexError as exc:
+        # Gravação pela metade ou erro de sintaxe: mantém o estado anterior
+        print(f"\n[{time.strftime('%H:%M:%S')}] {department.file}: erro de parse ({exc}); aguardando")
+        return False
+
+
+def run_watch(args, session):
+    index = NameIndex()
+    by_path = {os.path.abspath(session.seed_path(d)): d for d in DEPARTMENTS}
+    for path, department in by_path.items():
+        seed = _reindex(path, department)
+        if seed is not False:
+            index.update(department, seed)
+
+    print(f"Acompanhando {len(by_path)} seeds em {session.seeds_dir} (Ctrl+C para sair)")
+    _print_watch_report(index)
+    sys.stdout.flush()
+
+    def on_change(paths):
+        start = time.perf_counter()
+        for path in paths:
+            department = by_path[path]
+            seed = _reindex(path, department)
+            if seed is False:
+                continue
+            before = index.update(department, seed)
+            after = index.files[department.file].total if seed is not None else 0
+            label = 'removido' if seed is None else 'alterado'
+            print(f"\n[{time.strftime('%H:%M:%S')}] {department.file} {label}: "
+                  f"{before} -> {after} servicos ({after - before:+d})")
+        _print_watch_report(index)
+        print(f"  ({(time.perf_counter() - start) * 1000:.1f} ms)")
+        sys.stdout.flush()
+
+    watch([*by_path], on_change, interval=args.interval)
+    return 0
+
+
+def records(session):
+    """Registros por arquivo, na ordem de DEPARTMENTS, gerados à medida que cada um é analisado"""
+    for department, result in zip(DEPARTMENTS, _results(session)):
+        base = {'department_code': department.code, 'file': department.file}
+        if result is None:
+            yield {'type': 'not_found', **base}
+            continue
+
+        names, name_counts = result
+        # Conta duplicatas
+        duplicates = {name: count for name, count in name_counts.items() if count > 1}
+        yield {'type': 'file', **base, 'total': len(names), 'unique': len(name_counts),
+               'duplicated_names': len(duplicates), 'duplicates': sum(count - 1 for count in duplicates.values())}
+        for name, count in duplicates.items():
+            yield {'type': 'duplicate', **base, 'name': name, 'count': count}
+
+
+def print_text(records):
+    print("="*80)
+    print("ANALISE DE DUPLICACOES NOS SEEDS MODULARES")
+    print("="*80)
+    print()
+
+    total_services = 0
+    total_duplicates = 0
+    # (arquivo, duplicações) dos arquivos com duplicação
+    files_with_duplicates = []
+    pending_blank = False
+
+    for record in records:
+        kind = record['type']
+        if kind != 'duplicate' and pending_blank:
+            print()
+            pending_blank = False
+
+        if kind == 'not_found':
+            print(f"AVISO: {record['file']} nao encontrado")
+        elif kind == 'file':
+            total_services += record['total']
+            if record['duplicates']:
+                total_duplicates += record['duplicates']
+                files_with_duplicates.append((record['file'], record['duplicates']))
+                print(f"[DUPLICADOS] {record['file']}")
+                print(f"  Total de servicos: {record['total']}")
+                print(f"  Servicos unicos: {record['unique']}")
+                print(f"  Duplicacoes encontradas: {record['duplicated_names']}")
+                pending_blank = True
+            else:
+                print(f"[OK] {record['file']}")
+                print(f"  Total de servicos: {record['total']} (todos unicos)")
+                print()
+        else:
+            print(f"    - '{record['name']}' aparece {record['count']}x (duplicado {record['count']-1}x)")
+    if pending_blank:
+        print()
+
+    print("="*80)
+    print("RESUMO")
+    print("="*80)
+    print(f"Total de servicos encontrados: {total_services}")
+    print(f"Total de duplicacoes: {total_duplicates}")
+    print(f"Arquivos com duplicacoes: {len(files_with_duplicates)}")
+
+    if files_with_duplicates:
+        print()
+        print("ACAO NECESSARIA:")
+        print("  Remover as duplicacoes dos seguintes arquivos:")
+        for file, duplicates in files_with_duplicates:
+            print(f"    - {file}: {duplicates} duplicacoes")
+    else:
+        print()
+        print("RESULTADO: Nenhuma duplicacao encontrada! Todos os seeds estao limpos.")
+
+    print("="*80)
+
+
+def run(args, session):
+    if args.watch:
+        return run_watch(args, session)
+
+    if args.format == 'text':
+        print_text(records(session))
+    else:
+        write_records(records(session), args.format, COLUMNS)
+    return 0
@@ -0,0 +1,619 @@
+"""
+Extrai as seções do arquivo consolidado (services-simplified-complete.ts)
+e gera um seed modular por secretaria, mais o index.ts que importa todos
+e o fingerprints.ts com o fingerprint de conteúdo de cada serviço
+"""
+
+import os
+
+from digiurban_tools.arguments import positive_int
+from digiurban_tools.departments import DEPARTMENTS, source_section
+from digiurban_tools.fingerprint import write_fingerprints
+from digiurban_tools.seed_lexer import build_index
+
+# seedServices em lotes: cada secretaria em andamento ocupa uma conexão do
+# pool do Prisma (connection_limit padrão: núcleos * 2 + 1, ou seja >= 3)
+DEFAULT_SEED_CONCURRENCY = 4
+DEFAULT_SEED_CHUNK_SIZE = 50
+
+
+def add_arguments(parser):
+    """Além das opções do index.ts, usa --source e --seeds-dir globais"""
+    parser.add_argument('--lazy-index', action='store_true',
+                        help='index.ts com import() por secretaria e seedServices({ departments })')
+    parser.add_argument('--seed-mode', choices=('sequential', 'batched'), default='sequential',
+                        help='seedServices: um servico por vez (padrao) ou lotes transacionais '
+                             'com secretarias em paralelo')
+    parser.add_argument('--seed-concurrency', type=positive_int, default=DEFAULT_SEED_CONCURRENCY,
+                        help=f'batched: secretarias gravadas ao mesmo tempo (padrao: {DEFAULT_SEED_CONCURRENCY})')
+    parser.add_argument('--seed-chunk-size', type=positive_int, default=DEFAULT_SEED_CHUNK_SIZE,
+                        help=f'batched: servicos por $transaction (padrao: {DEFAULT_SEED_CHUNK_SIZE})')
+
+
+def extract_section(index, section_name):
+    """Texto de uma seção do arquivo consolidado, terminado em ];"""
+    section_code = index.section_text(section_name)
+
+    if section_code is None:
+        return None
+
+    # Garante que termine com ];
+    if not section_code.rstrip().endswith('];'):
+        section_code = section_code.rstrip() + ';'
+
+    return section_code
+
+
+def create_seed_file(output_dir, department, section_name, section_code, writer):
+    """
+    Cria um arquivo de seed individual; retorna (quantos serviços,
+    departmentCodes de outras secretarias presentes no arquivo)
+    """
+    filepath = os.path.join(output_dir, department.file)
+
+    # Conta número de serviços (objetos do array, não ocorrências de "name:")
+    services = build_index(section_code).services()
+    service_count = len(services)
+    foreign_codes = sorted({service.department_code for service in services
+                            if service.department_code and service.department_code != department.code})
+
+    header = f'''/**
+ * SEED DE SERVIÇOS - SECRETARIA DE {department.name.upper()}
+ * Total: {service_count} serviços
+ */
+
+import {{ ServiceDefinition }} from './types';
+
+'''
+
+    # Renomeia a const para o export name
+    section_code = section_code.replace(
+        f"const {section_name}: ServiceDefinition[] = [",
+        f"export const {department.export}: ServiceDefinition[] = ["
+    )
+
+    content = header + section_code + '\n'
+
+    writer.write(filepath, content)
+
+    print(f"OK Gerado: {department.file} ({service_count} servicos)")
+    if foreign_codes:
+        print(f"AVISO: {department.file} tem servicos de outras secretarias: {', '.join(foreign_codes)}")
+    return service_count, foreign_codes
+
+
+def run(args, session):
+    source = session.source()
+    if source is None:
+        print(f"ERRO: Arquivo fonte nao encontrado: {session.source_file}")
+        return 1
+
+    batched = (args.seed_concurrency, args.seed_chunk_size) if args.seed_mode == 'batched' else None
+
+    print("Extraindo seeds modulares...\n")
+
+    # Todas as gravações acontecem no flush, só para arquivos que mudaram
+    writer = session.writer()
+    total_services = 0
+    created = []
+    # Código da secretaria do arquivo -> departmentCodes de outras secretarias nele
+    foreign = {}
+
+    # Extrai cada seção
+    for department in DEPARTMENTS:
+        section_name = source_section(department, source)
+        section_code = extract_section(source, section_name) if section_name else None
+
+        if section_code:
+            count, foreign_codes = create_seed_file(session.seeds_dir, department, section_name, section_code, writer)
+            total_services += count
+            created.append(department)
+            if foreign_codes:
+                foreign[department.code] = foreign_codes
+        else:
+            print(f"AVISO: Secao nao encontrada: {' / '.join(department.sections)}")
+
+    print(f"\nOK Extracao concluida: {len(created)} arquivos criados, {total_services} servicos no total")
+
+    # Cria o arquivo index.ts
+    create_index_file(session.seeds_dir, created, writer, lazy=args.lazy_index, batched=batched, foreign=foreign)
+
+    stats = writer.flush()
+
+    # Os fingerprints saem dos seeds já gravados (avaliados pelo cache de definições)
+    fingerprints_writer = session.writer()
+    count, duplicates = write_fingerprints(session.seeds_dir, fingerprints_writer)
+    stats.merge(fingerprints_writer.flush())
+    print(f"OK Gerado: fingerprints.ts ({count} servicos)")
+    if duplicates:
+        print(f"AVISO: {len(duplicates)} servicos repetidos (departmentCode:name); "
+              f"detalhes em `digiurban-tools fingerprints --check`")
+
+    print(f"\n{stats.summary()}")
+    return 0
+
+
+def _seed_loop(services_var):
+    """Laço de upsert do seedServices sobre o array `services_var`"""
+    return f"""  let totalCreated = 0;
+  let totalUnchanged = 0;
+
+  // Mesmo departmentCode:name repetido: só a última definição é gravada
+  const uniqueServices = [
+    ...new Map({services_var}.map(serviceDef => [fingerprintKey(serviceDef.departmentCode, serviceDef.name), serviceDef])).values(),
+  ];
+  warnStaleFingerprints(uniqueServices);
+
+  for (const serviceDef of uniqueServices) {{
+    const departmentId = departmentMap.get(serviceDef.departmentCode);
+
+    if (!departmentId) {{
+      console.warn(`   ⚠️  Departamento ${{serviceDef.departmentCode}} não encontrado, pulando serviço: ${{serviceDef.name}}`);
+      continue;
+    }}
+
+    // Calculado do conteúdo atual: um seed editado à mão nunca é pulado
+    const contentFingerprint = serviceFingerprint(serviceDef);
+
+    try {{
+      // Verificar se serviço já existe
+      const existing = await prisma.serviceSimplified.findFirst({{
+        where: {{
+          name: serviceDef.name,
+          departmentId: departmentId
+        }}
+      }});
+
+      if (existing && existing.contentFingerprint === contentFingerprint && existing.isActive) {{
+        // Conteúdo igual ao da última gravação
+        totalUnchanged++;
+        continue;
+      }}
+
+      if (existing) {{
+        // Atualizar serviço existente
+        await prisma.serviceSimplified.update({{
+          where: {{ id: existing.id }},
+          data: {{
+            description: serviceDef.description,
+            serviceType: serviceDef.serviceType,
+            moduleType: serviceDef.moduleType,
+            formSchema: serviceDef.formSchema || undefined,
+            linkedCitizensConfig: serviceDef.linkedCitizensConfig || undefined,
+            requiresDocuments: serviceDef.requiresDocuments,
+            requiredDocuments: serviceDef.requiredDocuments
+              ? JSON.stringify(serviceDef.requiredDocuments)
+              : undefined,
+            estimatedDays: serviceDef.estimatedDays,
+            priority: serviceDef.priority,
+            category: serviceDef.category,
+            icon: serviceDef.icon,
+            color: serviceDef.color,
+            isActive: true,
+            contentFingerprint,
+          }}
+        }});
+        console.log(`   🔄 ${{serviceDef.name}} (atualizado)`);
+      }} else {{
+        // Criar novo serviço
+        await prisma.serviceSimplified.create({{
+          data: {{
+            name: serviceDef.name,
+            description: serviceDef.description,
+            departmentId,
+            serviceType: serviceDef.serviceType,
+            moduleType: serviceDef.moduleType,
+            formSchema: serviceDef.formSchema || undefined,
+            linkedCitizensConfig: serviceDef.linkedCitizensConfig || undefined,
+            requiresDocuments: serviceDef.requiresDocuments,
+            requiredDocuments: serviceDef.requiredDocuments
+              ? JSON.stringify(serviceDef.requiredDocuments)
+              : undefined,
+            estimatedDays: serviceDef.estimatedDays,
+            priority: serviceDef.priority,
+            category: serviceDef.category,
+            icon: serviceDef.icon,
+            color: serviceDef.color,
+            isActive: true,
+            contentFingerprint,
+          }}
+        }});
+        totalCreated++;
+        console.log(`   ✅ ${{serviceDef.name}}`);
+      }}
+    }} catch (error: any) {{
+      console.error(`   ❌ Erro ao processar serviço ${{serviceDef.name}}:`, error.message);
+    }}
+  }}
+
+  console.log(`\\n✅ Seed de serviços concluído: ${{totalCreated}} serviços criados, ${{totalUnchanged}} sem alteração`);
+  return totalCreated;
+}}
+"""
+
+
+def _batched_seed(load_services, concurrency, chunk_size):
+    """
+    seedServices em lotes: secretarias em paralelo (no máximo `concurrency`),
+    cada lote de `chunk_size` serviços em um $transaction, departamentos e
+    serviços existentes buscados uma vez, tempo por secretaria no log
+    """
+    return f"""const SEED_CONCURRENCY = {concurrency};
+const SEED_CHUNK_SIZE = {chunk_size};
+
+export interface SeedServicesOptions {{
+  // Códigos das secretarias (padrão: todas)
+  departments?: string[];
+  // Secretarias gravadas ao mesmo tempo (padrão: {concurrency})
+  concurrency?: number;
+  // Serviços por transação (padrão: {chunk_size})
+  chunkSize?: number;
+}}
+
+interface DepartmentResult {{
+  code: string;
+  created: number;
+  updated: number;
+  unchanged: number;
+  failed: number;
+  ms: number;
+}}
+
+/**
+ * Aplica fn aos itens com no máximo `limit` chamadas em andamento
+ */
+async function mapWithConcurrency<T, R>(items: T[], limit: number, fn: (item: T) => Promise<R>): Promise<R[]> {{
+  const results: R[] = new Array(items.length);
+  let next = 0;
+  const worker = async () => {{
+    while (next < items.length) {{
+      const index = next++;
+      results[index] = await fn(items[index]);
+    }}
+  }};
+  await Promise.all(Array.from({{ length: Math.max(1, Math.min(limit, items.length)) }}, worker));
+  return results;
+}}
+
+function serviceData(serviceDef: ServiceDefinition, contentFingerprint: string) {{
+  return {{
+    description: serviceDef.description,
+    serviceType: serviceDef.serviceType,
+    moduleType: serviceDef.moduleType,
+    formSchema: serviceDef.formSchema || undefined,
+    linkedCitizensConfig: serviceDef.linkedCitizensConfig || undefined,
+    requiresDocuments: serviceDef.requiresDocuments,
+    requiredDocuments: serviceDef.requiredDocuments
+      ? JSON.stringify(serviceDef.requiredDocuments)
+      : undefined,
+    estimatedDays: serviceDef.estimatedDays,
+    priority: serviceDef.priority,
+    category: serviceDef.category,
+    icon: serviceDef.icon,
+    color: serviceDef.color,
+    isActive: true,
+    contentFingerprint,
+  }};
+}}
+
+/**
+ * Grava os serviços de uma secretaria em lotes de chunkSize, um $transaction por lote
+ */
+async function seedDepartment(
+  code: string,
+  services: ServiceDefinition[],
+  departmentId: string,
+  chunkSize: number,
+): Promise<DepartmentResult> {{
+  const start = Date.now();
+  const result: DepartmentResult = {{ code, created: 0, updated: 0, unchanged: 0, failed: 0, ms: 0 }};
+
+  // Nome repetido na secretaria: a última definição vence, como no laço sequencial
+  const byName = new Map<string, ServiceDefinition>();
+  for (const serviceDef of services) {{
+    byName.set(serviceDef.name, serviceDef);
+  }}
+  const unique = [...byName.values()];
+
+  // Uma consulta para todos os serviços já existentes da secretaria
+  const existingRows = await prisma.serviceSimplified.findMany({{
+    where: {{ departmentId, name: {{ in: unique.map(serviceDef => serviceDef.name) }} }},
+    select: {{ id: true, name: true, isActive: true, contentFingerprint: true }},
+  }});
+  const existingByName = new Map(existingRows.map(row => [row.name, row]));
+
+  for (let first = 0; first < unique.length; first += chunkSize) {{
+    const chunk = unique.slice(first, first + chunkSize);
+    const operations: Prisma.PrismaPromise<unknown>[] = [];
+    let created = 0;
+    let updated = 0;
+
+    for (const serviceDef of chunk) {{
+      // Calculado do conteúdo atual: um seed editado à mão nunca é pulado
+      const contentFingerprint = serviceFingerprint(serviceDef);
+      const existing = existingByName.get(serviceDef.name);
+
+      if (existing && existing.contentFingerprint === contentFingerprint && existing.isActive) {{
+        // Conteúdo igual ao da última gravação
+        result.unchanged++;
+      }} else if (existing) {{
+        operations.push(prisma.serviceSimplified.update({{
+          where: {{ id: existing.id }},
+          data: serviceData(serviceDef, contentFingerprint),
+        }}));
+        updated++;
+      }} else {{
+        operations.push(prisma.serviceSimplified.create({{
+          data: {{ name: serviceDef.name, departmentId, ...serviceData(serviceDef, contentFingerprint) }},
+        }}));
+        created++;
+      }}
+    }}
+
+    if (operations.length === 0) {{
+      continue;
+    }}
+
+    try {{
+      await prisma.$transaction(operations);
+      result.created += created;
+      result.updated += updated;
+    }} catch (error: any) {{
+      // O lote inteiro é desfeito; os demais lotes seguem
+      result.failed += operations.length;
+      console.error(`   ❌ ${{code}}: erro no lote de ${{operations.length}} serviços a partir de ${{chunk[0].name}}:`, error.message);
+    }}
+  }}
+
+  result.ms = Date.now() - start;
+  return result;
+}}
+
+/**
+ * Função principal de seed de serviços
+ */
+export async function seedServices(options: SeedServicesOptions = {{}}) {{
+  console.log('\\n📦 Iniciando seed de serviços simplificados...');
+  const start = Date.now();
+
+  const services = {load_services};
+  warnStaleFingerprints(services);
+
+  // Departamentos buscados uma única vez
+  const departments = await prisma.department.findMany(
+    options.departments ? {{ where: {{ code: {{ in: options.departments }} }} }} : undefined
+  );
+
+  const departmentMap = new Map(
+    departments.map(dept => [dept.code, dept.id])
+  );
+
+  // Serviços agrupados por secretaria, na ordem do catálogo
+  const groups = new Map<string, ServiceDefinition[]>();
+  for (const serviceDef of services) {{
+    if (!departmentMap.has(serviceDef.departmentCode)) {{
+      console.warn(`   ⚠️  Departamento ${{serviceDef.departmentCode}} não encontrado, pulando serviço: ${{serviceDef.name}}`);
+      continue;
+    }}
+    const group = groups.get(serviceDef.departmentCode) ?? [];
+    group.push(serviceDef);
+    groups.set(serviceDef.departmentCode, group);
+  }}
+
+  const results = await mapWithConcurrency(
+    [...groups.entries()],
+    options.concurrency ?? SEED_CONCURRENCY,
+    ([code, group]) => seedDepartment(code, group, departmentMap.get(code)!, options.chunkSize ?? SEED_CHUNK_SIZE),
+  );
+
+  for (const r of results) {{
+    const failed = r.failed ? `, ${{r.failed}} com erro` : '';
+    console.log(`   ⏱️  ${{r.code}}: ${{r.created}} criados, ${{r.updated}} atualizados, ${{r.unchanged}} sem alteração${{failed}} (${{r.ms}} ms)`);
+  }}
+
+  const totalCreated = results.reduce((sum, r) => sum + r.created, 0);
+  const totalUpdated = results.reduce((sum, r) => sum + r.updated, 0);
+  const totalUnchanged = results.reduce((sum, r) => sum + r.unchanged, 0);
+  console.log(`\\n✅ Seed de serviços concluído: ${{totalCreated}} serviços criados, ${{totalUpdated}} atualizados, ${{totalUnchanged}} sem alteração (${{Date.now() - start}} ms)`);
+  return totalCreated;
+}}
+"""
+
+
+_ARGV_CALL = (
+    "  // Secretarias opcionais na linha de comando: ts-node index.ts SAUDE EDUCACAO\n"
+    "  const departments = process.argv.slice(2);\n"
+    "  seedServices({ departments: departments.length > 0 ? departments : undefined })"
+)
+
+
+def _main_block(call):
+    """Execução direta do index.ts (ts-node prisma/seeds/services/index.ts)"""
+    return f"""
+// Executar seed se chamado diretamente
+if (require.main === module) {{
+{call}
+    .then(() => {{
+      console.log('✅ Seed executado com sucesso!');
+      process.exit(0);
+    }})
+    .catch((error) => {{
+      console.error('❌ Erro ao executar seed:', error);
+      process.exit(1);
+    }})
+    .finally(async () => {{
+      await prisma.$disconnect();
+    }});
+}}
+"""
+
+
+def _eager_index(departments, batched=None):
+    """index.ts que importa todos os seeds e os junta em allServices"""
+    imports = [f"import {{ {d.export} }} from './{d.module}';" for d in departments]
+    all_services = [f"  ...{d.export}," for d in departments]
+
+    if batched is None:
+        seed = f"""/**
+ * Função principal de seed de serviços
+ */
+export async function seedServices() {{
+  console.log('\\n📦 Iniciando seed de serviços simplificados...');
+
+  // Buscar departamentos
+  const departments = await prisma.department.findMany();
+
+  const departmentMap = new Map(
+    departments.map(dept => [dept.code, dept.id])
+  );
+
+{_seed_loop('allServices')}{_main_block('  seedServices()')}"""
+    else:
+        load = 'options.departments\n    ? allServices.filter(serviceDef => options.departments!.includes(serviceDef.departmentCode))\n    : allServices'
+        seed = _batched_seed(load, *batched) + _main_block(_ARGV_CALL)
+
+    return f"""/**
+ * SEED MODULAR DE SERVIÇOS
+ * Importa todos os seeds individuais por secretaria
+ */
+
+{_client_import(batched)}
+import {{ ServiceDefinition }} from './types';
+import {{ fingerprintKey, serviceFingerprint, warnStaleFingerprints }} from './fingerprints';
+
+{chr(10).join(imports)}
+
+const prisma = new PrismaClient();
+
+/**
+ * Todos os serviços consolidados
+ */
+export const allServices: ServiceDefinition[] = [
+{chr(10).join(all_services)}
+];
+
+{seed}"""
+
+
+def _lazy_index(departments, batched=None, foreign=None):
+    """
+    index.ts com um import() por secretaria, carregado só quando usado.
+    foreign: {código do arquivo: [departmentCodes de outras secretarias
+    nele]}, para que loadServices importe também esses arquivos
+    """
+    loaders = [
+        f"  {d.code}: () => import('./{d.module}').then(m => m.{d.export}),"
+        for d in departments
+    ]
+    carriers = {}
+    for file_code, codes in (foreign or {}).items():
+        for code in codes:
+            carriers.setdefault(code, []).append(file_code)
+    foreign_seeds = [
+        f"  {code}: [{', '.join(repr(file_code) for file_code in file_codes)}],"
+        for code, file_codes in sorted(carriers.items())
+    ]
+    foreign_block = ''.join(f'\n{line}' for line in foreign_seeds) + ('\n' if foreign_seeds else '')
+
+    if batched is None:
+        seed = f"""export interface SeedServicesOptions {{
+  // Códigos das secretarias (padrão: todas)
+  departments?: string[];
+}}
+
+/**
+ * Função principal de seed de serviços
+ */
+export async function seedServices(options: SeedServicesOptions = {{}}) {{
+  console.log('\\n📦 Iniciando seed de serviços simplificados...');
+
+  const services = await loadServices(options.departments);
+
+  // Buscar departamentos (só os pedidos)
+  const departments = await prisma.department.findMany(
+    options.departments ? {{ where: {{ code: {{ in: options.departments }} }} }} : undefined
+  );
+
+  const departmentMap = new Map(
+    departments.map(dept => [dept.code, dept.id])
+  );
+
+{_seed_loop('services')}"""
+    else:
+        seed = _batched_seed('await loadServices(options.departments)', *batched)
+
+    return f"""/**
+ * SEED MODULAR DE SERVIÇOS (carregamento por secretaria)
+ * Cada seed é importado só quando a secretaria é usada: seedServices({{ departments: ['SAUDE'] }})
+ * carrega e compila apenas health.seed.ts (mais os seeds listados em foreignSeeds)
+ */
+
+{_client_import(batched)}
+import {{ ServiceDefinition }} from './types';
+import {{ fingerprintKey, serviceFingerprint, warnStaleFingerprints }} from './fingerprints';
+
+const prisma = new PrismaClient();
+
+/**
+ * Carregador de cada secretaria (código -> import dinâmico do seed)
+ */
+export const departmentLoaders: Record<string, () => Promise<ServiceDefinition[]>> = {{
+{chr(10).join(loaders)}
+}};
+
+export const departmentCodes = Object.keys(departmentLoaders);
+
+/**
+ * Secretarias com serviços (departmentCode) também em seeds de outra
+ * secretaria, ex.: serviços de EDUCACAO em agriculture.seed.ts. O registro
+ * é por arquivo; loadServices importa esses seeds extras e filtra pelo
+ * departmentCode, como o seed completo
+ */
+export const foreignSeeds: Record<string, string[]> = {{{foreign_block}}};
+
+/**
+ * Serviços das secretarias pedidas (todas, se omitido), na ordem do registro
+ */
+export async function loadServices(departments?: string[]): Promise<ServiceDefinition[]> {{
+  if (!departments) {{
+    const groups = await Promise.all(departmentCodes.map(code => departmentLoaders[code]()));
+    return groups.flat();
+  }}
+  const unknown = departments.filter(code => !(code in departmentLoaders) && !(code in foreignSeeds));
+  if (unknown.length > 0) {{
+    throw new Error(`Secretarias sem seed: ${{unknown.join(', ')}}`);
+  }}
+  const files = new Set(departments.flatMap(code => [code, ...(foreignSeeds[code] ?? [])]));
+  const selected = departmentCodes.filter(code => files.has(code));
+  const groups = await Promise.all(selected.map(code => departmentLoaders[code]()));
+  return groups.flat().filter(serviceDef => departments.includes(serviceDef.departmentCode));
+}}
+
+{seed}{_main_block(_ARGV_CALL)}"""
+
+
+def _client_import(batched):
+    # O modo em lotes tipa as operações do $transaction com Prisma.PrismaPromise
+    names = 'Prisma, PrismaClient' if batched is not None else 'PrismaClient'
+    return f"import {{ {names} }} from '@prisma/client';"
+
+
+def create_index_file(output_dir, created_departments, writer, lazy=False, batched=None, foreign=None):
+    """
+    Cria o index.ts dos seeds: com lazy=True um registro de import() por
+    secretaria e seedServices({ departments }); senão o allServices que
+    importa todos os seeds. batched=(concorrência, tamanho do lote) gera o
+    seedServices em lotes transacionais por secretaria; None, o laço
+    sequencial (um serviço por vez, sem transação). foreign (ver
+    _lazy_index) só é usado no modo lazy
+    """
+    filepath = os.path.join(output_dir, 'index.ts')
+
+    content = (_lazy_index(created_departments, batched, foreign) if lazy
+               else _eager_index(created_departments, batched))
+    writer.write(filepath, content)
+
+    mode = 'carregamento por secretaria' if lazy else 'arquivo centralizador'
+    if batched is not None:
+        mode += f', seed em lotes de {batched[1]} com {batched[0]} secretarias em paralelo'
+    print(f"OK Gerado: index.ts ({mode})")
@@ -0,0 +1,120 @@
+"""
+Consultas sobre os campos coletados pelos serviços (citizenFields e fields[].id)
+
+Monta a matriz de bitsets do catálogo (ver digiurban_tools.field_matrix) e:
+
+- sem opções: uso de cada citizenField, nomes fora do vocabulário e os
+  fields[].id customizados mais comuns
+- --has/--without: lista os serviços que coletam todos os campos de --has
+  e nenhum de --without (ex.: --has citizen_familyincome --without citizen_cpf)
+- --cooccurrence: pares de citizenFields que aparecem juntos com mais frequência
+- --by-department: citizenFields por secretaria
+"""
+
+from digiurban_tools.arguments import positive_int
+from digiurban_tools.commands.near_dupes import collect_services
+from digiurban_tools.departments import DEPARTMENTS
+from digiurban_tools.field_matrix import build_field_matrix, read_citizen_field_vocabulary
+
+
+def add_arguments(parser):
+    parser.add_argument('--has', nargs='+', default=[], metavar='CAMPO',
+                        help='servicos que coletam todos estes campos')
+    parser.add_argument('--without', nargs='+', default=[], metavar='CAMPO',
+                        help='servicos que nao coletam nenhum destes campos')
+    parser.add_argument('--department', nargs='+', default=[], metavar='CODIGO',
+                        help='restringe as consultas a estas secretarias (ex.: SAUDE)')
+    parser.add_argument('--cooccurrence', action='store_true',
+                        help='pares de citizenFields mais frequentes')
+    parser.add_argument('--by-department', action='store_true',
+                        help='uso de cada citizenField por secretaria')
+    parser.add_argument('--top', type=positive_int, default=20,
+                        help='quantos itens listar nos rankings (padrao: 20)')
+
+
+def _print_overview(matrix, top):
+    total = len(matrix.services)
+    print(f"Servicos: {total} ({matrix.has_schema.bit_count()} com formSchema)")
+    print()
+    print("citizenFields:")
+    for name, column in zip(matrix.citizen_fields, matrix.citizen_columns):
+        count = column.bit_count()
+        marker = '  (fora do vocabulario)' if name in matrix.unknown_citizen else ''
+        percent = count * 100 / total if total else 0
+        print(f"  {name:28} {count:5}  {percent:5.1f}%{marker}")
+    print()
+    print(f"fields[].id customizados: {len(matrix.field_ids)} ids distintos")
+    ranking = sorted(range(len(matrix.field_ids)), key=lambda i: -matrix.field_columns[i].bit_count())
+    for index in ranking[:top]:
+        print(f"  {matrix.field_ids[index]:28} {matrix.field_columns[index].bit_count():5}")
+
+
+def _print_selection(matrix, selection, args):
+    conditions = [f"com {name}" for name in args.has] + [f"sem {name}" for name in args.without]
+    rows = matrix.rows(selection)
+    print(f"Servicos {', '.join(conditions)}: {len(rows)}")
+    for code, file, line, name in rows:
+        print(f"  {file}:{line} [{code}] {name}")
+
+
+def _print_cooccurrence(matrix, selection, top):
+    print(f"Pares de citizenFields mais frequentes (de {selection.bit_count()} servicos):")
+    for a, b, count in matrix.citizen_cooccurrence(selection)[:top]:
+        print(f"  {count:5}  {a} + {b}")
+
+
+def _print_by_department(matrix, codes):
+    summary = matrix.department_summary()
+    codes = [code for code in codes if code in summary]
+    labels = [code[:4] for code in codes]
+    print(f"{'':28} " + ' '.join(f"{label:>5}" for label in labels))
+    print(f"{'servicos':28} " + ' '.join(f"{summary[code]['services']:5}" for code in codes))
+    print(f"{'com formSchema':28} " + ' '.join(f"{summary[code]['with_schema']:5}" for code in codes))
+    for bit, name in enumerate(matrix.citizen_fields):
+        print(f"{name:28} " + ' '.join(f"{summary[code]['citizen'][bit]:5}" for code in codes))
+    print(f"{'fields[].id distintos':28} " + ' '.join(f"{summary[code]['custom_fields']:5}" for code in codes))
+    print()
+    print('  '.join(f"{label}={code}" for label, code in zip(labels, codes)))
+
+
+def run(args, session):
+    try:
+        vocabulary = read_citizen_field_vocabulary()
+    except (OSError, ValueError) as e:
+        print(f"ERRO: {e}")
+        return 1
+
+    services, skipped = collect_services(session)
+    matrix = build_field_matrix(services, vocabulary)
+
+    known = {d.code for d in DEPARTMENTS}
+    for code in args.department:
+        if code not in known:
+            print(f"ERRO: secretaria desconhecida: {code}")
+            return 1
+    for name in args.has + args.without:
+        if not matrix.known(name):
+            print(f"AVISO: campo '{name}' nao aparece em nenhum servico")
+
+    print("="*80)
+    print("CAMPOS DOS SERVICOS")
+    print("="*80)
+    if skipped:
+        print(f"({skipped} servicos com erro de avaliacao ignorados)")
+
+    selection = matrix.select(args.has, args.without, args.department)
+
+    if args.has or args.without:
+        _print_selection(matrix, selection, args)
+    elif args.cooccurrence:
+        _print_cooccurrence(matrix, selection, args.top)
+    elif args.by_department:
+        _print_by_department(matrix, args.department or [d.code for d in DEPARTMENTS])
+    else:
+        _print_overview(matrix, args.top)
+
+    if (args.has or args.without) and args.cooccurrence:
+        print()
+        _print_cooccurrence(matrix, selection, args.top)
+    print("="*80)
+    return 0
@@ -0,0 +1,70 @@
+"""
+Gera prisma/seeds/services/fingerprints.ts a partir dos seeds atuais
+
+O extract e o merge já regeneram o arquivo; rode este comando depois de
+editar um seed à mão. O seedServices calcula o fingerprint do serviceDef
+que vai gravar (serviceFingerprint), então um arquivo desatualizado nunca
+faz pular um serviço editado: só gera um aviso no seed. --check falha
+nesse caso (para CI), mantendo o mapa e as duas implementações em dia.
+
+Chaves departmentCode:name repetidas são listadas como aviso (vale a
+última ocorrência, a que o seedServices grava); com --check --strict o
+comando também falha quando as ocorrências têm conteúdos diferentes, já
+que as anteriores nunca chegam ao banco.
+"""
+
+import os
+
+from digiurban_tools.fingerprint import (
+    FINGERPRINTS_FILE,
+    catalog_fingerprints,
+    conflicting,
+    describe_duplicate,
+    duplicate_keys,
+    fingerprint_entries,
+    render_fingerprints,
+)
+
+
+def add_arguments(parser):
+    parser.add_argument('--check', action='store_true',
+                        help='so verifica se o fingerprints.ts esta atualizado (sai com 1 se nao)')
+    parser.add_argument('--strict', action='store_true',
+                        help='com --check, servicos repetidos com conteudos diferentes tambem falham')
+
+
+def run(args, session):
+    entries = fingerprint_entries(session.seeds_dir)
+    fingerprints = catalog_fingerprints(session.seeds_dir, entries)
+    content = render_fingerprints(fingerprints)
+    filepath = os.path.join(session.seeds_dir, FINGERPRINTS_FILE)
+
+    duplicates = duplicate_keys(entries)
+    for key, occurrences in duplicates.items():
+        print(describe_duplicate(key, occurrences))
+    conflicts = sum(1 for occurrences in duplicates.values() if conflicting(occurrences))
+
+    if args.check:
+        try:
+            with open(filepath, 'r', encoding='utf-8', newline='') as f:
+                current = f.read()
+        except FileNotFoundError:
+            current = None
+        failed = False
+        if current != content:
+            print(f"ERRO: {FINGERPRINTS_FILE} desatualizado: rode `digiurban-tools fingerprints`")
+            failed = True
+        if conflicts and args.strict:
+            print(f"ERRO: {conflicts} servicos repetidos com conteudos diferentes: remova as definicoes anteriores")
+            failed = True
+        if failed:
+            return 1
+        print(f"OK {FINGERPRINTS_FILE} atualizado ({len(fingerprints)} servicos)")
+        return 0
+
+    writer = session.writer()
+    writer.write(filepath, content)
+    stats = writer.flush()
+    print(f"OK Gerado: {FINGERPRINTS_FILE} ({len(fingerprints)} servicos)")
+    print(stats.summary())
+    return 0
@@ -0,0 +1,23 @@
+"""
+Corrige as URLs do backend nas rotas API do super-admin
+
+As substituições estão em digiurban_tools/rules/fix-api-urls.json e são
+aplicadas a todo route.ts sob app/api/super-admin em uma passada por
+arquivo. Arquivos já corrigidos e não alterados desde a última execução
+são pulados pelo cache de codemods.
+"""
+
+import os
+
+from digiurban_tools.commands.rewrite import add_rule_arguments, run_rules
+from digiurban_tools.paths import RULES_DIR
+
+RULES_FILE = os.path.join(RULES_DIR, 'fix-api-urls.json')
+
+
+def add_arguments(parser):
+    add_rule_arguments(parser)
+
+
+def run(args, session):
+    return run_rules(RULES_FILE, 'fix-api-urls', args, session)
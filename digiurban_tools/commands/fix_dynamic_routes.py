@@ -0,0 +1,24 @@
+"""
+Adiciona export const dynamic = 'force-dynamic' nas rotas API que usam cookies
+
+A inserção (após o último import, só em route.ts que usa request.cookies
+e ainda não tem o export) está em digiurban_tools/rules/fix-dynamic-routes.json.
+Rotas não alteradas desde a última execução são puladas pelo cache de
+codemods.
+"""
+
+import os
+
+from digiurban_tools.commands.rewrite import add_rule_arguments, run_rules
+from digiurban_tools.paths import RULES_DIR
+
+RULES_FILE = os.path.join(RULES_DIR, 'fix-dynamic-routes.json')
+
+
+def add_arguments(parser):
+    # --api-dir: nome da opção antes do percurso passar a cobrir todo o app
+    add_rule_arguments(parser, app_dir_aliases=('--api-dir',))
+
+
+def run(args, session):
+    return run_rules(RULES_FILE, 'fix-dynamic-routes', args, session)
@@ -0,0 +1,146 @@
+"""
+Move trechos de formSchema repetidos nos seeds para shared-fragments.ts
+
+Compara por hash de conteúdo todos os objetos/arrays dos formSchema do
+catálogo (ver digiurban_tools.fragments); os que se repetem pelo menos
+--min-count vezes com pelo menos --min-bytes viram constantes em
+prisma/seeds/services/shared-fragments.ts, e os seeds passam a importá-las.
+
+Relata os bytes economizados e os tokens TypeScript antes/depois (o custo
+do parse do tsc/ts-node cresce com eles). --measure-compile roda também o
+tsc --noEmit sobre os seeds antes e depois, em um diretório temporário,
+e compara os tempos (precisa do typescript instalado no backend).
+
+O extract regenera os seeds a partir do arquivo consolidado, sem os
+fragmentos: depois dele, rode este comando de novo.
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+
+from digiurban_tools.departments import DEPARTMENTS
+from digiurban_tools.fragments import (
+    DEFAULT_MIN_BYTES, DEFAULT_MIN_COUNT, SHARED_FRAGMENTS_FILE, FragmentError, form_schema_nodes,
+    plan_hoist, read_fragments, render_fragments, rewrite_seed,
+)
+from digiurban_tools.paths import BACKEND_DIR
+from digiurban_tools.seed_lexer import tokenize
+
+
+def add_arguments(parser):
+    parser.add_argument('--min-count', type=int, default=DEFAULT_MIN_COUNT,
+                        help=f'ocorrencias minimas para virar fragmento (padrao: {DEFAULT_MIN_COUNT})')
+    parser.add_argument('--min-bytes', type=int, default=DEFAULT_MIN_BYTES,
+                        help=f'tamanho minimo do trecho em bytes (padrao: {DEFAULT_MIN_BYTES})')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='mostra os fragmentos e a economia, sem gravar')
+    parser.add_argument('--measure-compile', action='store_true',
+                        help='mede o tsc --noEmit dos seeds antes e depois')
+
+
+def _find_tsc():
+    local = os.path.join(BACKEND_DIR, 'node_modules', '.bin', 'tsc')
+    return local if os.path.exists(local) else shutil.which('tsc')
+
+
+def compile_seconds(tsc, contents, types_ts):
+    """Tempo do tsc --noEmit sobre {arquivo: conteúdo} (mais o types.ts) e o código de saída"""
+    with tempfile.TemporaryDirectory(prefix='digiurban-tsc-') as tmp:
+        files = []
+        for name, content in contents.items():
+            path = os.path.join(tmp, name)
+            with open(path, 'w', encoding='utf-8', newline='') as f:
+                f.write(content)
+            files.append(path)
+        shutil.copy(types_ts, os.path.join(tmp, 'types.ts'))
+        command = [tsc, '--noEmit', '--skipLibCheck', '--strict', '--target', 'ES2022',
+                   '--module', 'commonjs', *files]
+        start = time.perf_counter()
+        result = subprocess.run(command, capture_output=True, text=True)
+        return time.perf_counter() - start, result.returncode
+
+
+def _tokens(contents):
+    return sum(len(tokenize(content)) for content in contents.values())
+
+
+def _size(contents):
+    return sum(len(content.encode('utf-8')) for content in contents.values())
+
+
+def run(args, session):
+    shared_path = os.path.join(session.seeds_dir, SHARED_FRAGMENTS_FILE)
+    try:
+        existing, _digest = read_fragments(shared_path)
+    except FragmentError as e:
+        print(f"ERRO: {e}")
+        return 1
+
+    before = {}
+    nodes = []
+    for department in DEPARTMENTS:
+        seed = session.seed(department)
+        if seed is None:
+            print(f"AVISO: {department.file} nao encontrado")
+            continue
+        before[department.file] = seed.text
+        nodes.extend(form_schema_nodes(department.file, seed))
+
+    plan = plan_hoist(nodes, existing, min_count=args.min_count, min_bytes=args.min_bytes)
+
+    after = {file: rewrite_seed(text, plan.replacements.get(file, [])) for file, text in before.items()}
+    if plan.fragments:
+        after[SHARED_FRAGMENTS_FILE] = render_fragments(plan.fragments)
+    if os.path.exists(shared_path):
+        with open(shared_path, 'r', encoding='utf-8', newline='') as f:
+            before[SHARED_FRAGMENTS_FILE] = f.read()
+
+    print("="*80)
+    print("FRAGMENTOS COMPARTILHADOS DE formSchema")
+    print("="*80)
+    print(f"Trechos analisados: {len(nodes)} (limiar: {args.min_count}x, {args.min_bytes} bytes)")
+    print()
+    for fragment in plan.fragments:
+        if not fragment.uses:
+            continue
+        label = '' if fragment.existing else ' (novo)'
+        size = len(fragment.text.encode('utf-8'))
+        print(f"  {fragment.name:36} {fragment.uses:4}x {size:6} bytes{label}")
+    for file, replacements in plan.replacements.items():
+        print(f"  {file}: {len(replacements)} trechos substituidos")
+
+    size_before, size_after = _size(before), _size(after)
+    tokens_before, tokens_after = _tokens(before), _tokens(after)
+    print()
+    print(f"Fragmentos novos: {len(plan.new_fragments)}, existentes: {len(existing)}")
+    print(f"Bytes (seeds + {SHARED_FRAGMENTS_FILE}): {size_before} -> {size_after} "
+          f"({size_before - size_after} economizados, {(size_before - size_after) * 100 / size_before:.1f}%)")
+    print(f"Tokens TypeScript: {tokens_before} -> {tokens_after} ({tokens_after - tokens_before:+d})")
+
+    if args.measure_compile:
+        tsc = _find_tsc()
+        if tsc is None:
+            print("AVISO: tsc nao encontrado (npm install no backend); tempo de compilacao nao medido")
+        else:
+            types_ts = os.path.join(session.seeds_dir, 'types.ts')
+            seconds_before, code_before = compile_seconds(tsc, before, types_ts)
+            seconds_after, code_after = compile_seconds(tsc, after, types_ts)
+            print(f"tsc --noEmit: {seconds_before:.2f}s -> {seconds_after:.2f}s "
+                  f"({seconds_after - seconds_before:+.2f}s)")
+            if code_after != code_before:
+                print(f"AVISO: codigo de saida do tsc mudou ({code_before} -> {code_after})")
+
+    if args.dry_run or not plan.replacements:
+        print("="*80)
+        return 0
+
+    writer = session.writer()
+    for file, content in after.items():
+        writer.write(os.path.join(session.seeds_dir, file), content)
+    stats = writer.flush()
+    print(stats.summary())
+    print("="*80)
+    return 0
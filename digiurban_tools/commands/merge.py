@@ -0,0 +1,227 @@
+"""
+Adiciona aos seeds modulares os serviços do arquivo consolidado que ainda
+faltam (chave: nome normalizado + departmentCode)
+
+O manifesto de merge guarda o hash de cada seção e o sha1 do seed após o
+último merge: seções sem alteração desde então são puladas (--full
+reprocessa tudo, --no-manifest nem lê nem grava o manifesto). Com --jobs
+cada secretaria é processada em um worker; a saída segue a ordem de
+DEPARTMENTS em qualquer caso. Quando algum seed muda, o fingerprints.ts
+é gerado de novo.
+"""
+
+import os
+
+from digiurban_tools.catalog_diff import diff_services, service_entries
+from digiurban_tools.departments import BY_CODE, DEPARTMENTS, source_section
+from digiurban_tools.fingerprint import write_fingerprints
+from digiurban_tools.manifest import (
+    DEFAULT_MANIFEST,
+    file_hash,
+    load_manifest,
+    save_manifest,
+    section_unchanged,
+    service_changes,
+    service_hashes,
+    text_hash,
+)
+from digiurban_tools.output import OutputWriter, WriteStats
+from digiurban_tools.parallel import map_ordered
+from digiurban_tools.seed_cache import load_index
+from digiurban_tools.seed_lexer import build_index
+
+
+def add_arguments(parser):
+    parser.add_argument('--manifest', default=DEFAULT_MANIFEST,
+                        help='arquivo de manifesto do merge incremental')
+    parser.add_argument('--full', action='store_true',
+                        help='reprocessa todas as secoes, ignorando o manifesto')
+    parser.add_argument('--no-manifest', action='store_true',
+                        help='nao le nem grava o manifesto (sempre reprocessa tudo)')
+    parser.add_argument('--since-manifest', action='store_true',
+                        help='lista o que mudou desde o ultimo merge, sem alterar arquivos')
+
+
+def add_services_to_seed(filepath, new_services, export_name, writer):
+    """Adiciona novos serviços a um arquivo seed existente (gravado no flush do writer)"""
+    if not os.path.exists(filepath):
+        print(f"ERRO: Arquivo nao existe: {filepath}")
+        return 0
+
+    content = writer.original(filepath)
+
+    # Encontra o ] que fecha o array "export const XXXX: ServiceDefinition[] = ["
+    section = build_index(content).section(export_name)
+
+    if section is None or not section.exported:
+        print(f"ERRO: Nao encontrado array de servicos em {filepath}")
+        return 0
+
+    # Insere os novos serviços logo após o último elemento do array
+    insert_pos = len(content[:section.close_bracket].rstrip())
+
+    # Adiciona vírgula se necessário (array não vazio ou outro lote já inserido aqui)
+    separator = ''
+    if not content[:insert_pos].endswith(('[', ',')) or writer.has_insert(filepath, insert_pos):
+        separator = ','
+
+    # Indenta o código de cada serviço
+    new_services_code = []
+    for service in new_services:
+        service_lines = service['code'].split('\n')
+        new_services_code.append('\n'.join(['  ' + line if line.strip() else line for line in service_lines]))
+
+    writer.insert(filepath, insert_pos, separator + '\n' + ',\n'.join(new_services_code))
+
+    return len(new_services)
+
+
+def merge_section(source, section_key, seed, filepath, department, writer):
+    """Adiciona ao seed os serviços faltantes de uma seção. Retorna quantos."""
+    source_services = service_entries(source, section_key)
+    existing = service_entries(seed) if seed else []
+
+    # Identifica faltantes (nome normalizado + departmentCode)
+    diff = diff_services(existing, source_services, department.code)
+
+    added = 0
+    if diff.added:
+        added = add_services_to_seed(filepath, diff.added, department.export, writer)
+        print(f"{department.name:25} : {added:2} servicos adicionados ({len(existing):2} -> {len(existing) + added:2})")
+    else:
+        print(f"{department.name:25} : OK - Completo ({len(source_services)} servicos)")
+
+    for old, new in diff.renamed:
+        print(f"{'':25}   AVISO: '{new['name']}' parece renomeacao de '{old['name']}' (nao adicionado)")
+
+    return added
+
+
+def _merge_worker(source_file, section_key, filepath, department_code):
+    """merge_section em um processo worker: lê pelo cache em disco e grava o próprio seed"""
+    writer = OutputWriter()
+    seed = load_index(filepath) if os.path.exists(filepath) else None
+    added = merge_section(load_index(source_file), section_key, seed, filepath, BY_CODE[department_code], writer)
+    return added, writer.flush()
+
+
+def report_since_manifest(source, session, manifest):
+    """Lista o que mudou desde o último merge, sem alterar arquivos"""
+    print(f"Manifesto: {len(manifest['sections'])} secoes registradas\n")
+
+    for department in DEPARTMENTS:
+        section_key = source_section(department, source)
+
+        if section_key is None:
+            print(f"{department.name:25} : AVISO - secao {department.sections[0]} nao encontrada")
+            continue
+
+        filepath = session.seed_path(department)
+        entry = manifest['sections'].get(section_key)
+        source_hash = text_hash(source.section_text(section_key))
+
+        if section_unchanged(manifest, section_key, source_hash, filepath):
+            print(f"{department.name:25} : pulada (sem alteracoes)")
+            continue
+
+        if entry is None:
+            print(f"{department.name:25} : nova (sem registro no manifesto)")
+            continue
+
+        reasons = []
+        if entry.get('source_hash') != source_hash:
+            reasons.append('fonte alterada')
+        if entry.get('target_sha1') != file_hash(filepath):
+            reasons.append(f"{department.file} alterado")
+        print(f"{department.name:25} : reprocessar ({', '.join(reasons)})")
+
+        current = service_hashes(service_entries(source, section_key))
+        added, removed, changed = service_changes(entry, current)
+        for label, names in (('+', added), ('-', removed), ('~', changed)):
+            for name in names:
+                print(f"{'':25}   {label} {name}")
+
+
+def run(args, session):
+    source = session.source()
+    if source is None:
+        print(f"ERRO: Arquivo fonte nao encontrado: {session.source_file}")
+        return 1
+
+    manifest = None
+    if not args.no_manifest:
+        manifest = load_manifest(args.manifest, source=os.path.abspath(session.source_file))
+
+    if args.since_manifest:
+        if manifest is None:
+            print("ERRO: --since-manifest nao combina com --no-manifest")
+            return 1
+        report_since_manifest(source, session, manifest)
+        return 0
+
+    print("Processando secoes...\n")
+
+    pending = []
+    skipped = []
+    for department in DEPARTMENTS:
+        section_key = source_section(department, source)
+        if section_key is None:
+            print(f"{department.name:25} : AVISO: Secao {department.sections[0]} nao encontrada")
+            continue
+
+        filepath = session.seed_path(department)
+        source_hash = text_hash(source.section_text(section_key))
+
+        # Seção e seed inalterados desde o último merge: nada a fazer
+        if manifest is not None and not args.full and section_unchanged(manifest, section_key, source_hash, filepath):
+            skipped.append(section_key)
+            print(f"{department.name:25} : OK - Sem alteracoes desde o ultimo merge (pulado)")
+            continue
+
+        pending.append((department, section_key, filepath, source_hash))
+
+    total_added = 0
+    if session.jobs > 1 and len(pending) > 1:
+        # Cada secretaria grava só o seu arquivo; a sessão relê o que os workers gravaram
+        stats = WriteStats()
+        for added, section_stats in map_ordered(
+            _merge_worker,
+            [(session.source_file, key, path, department.code) for department, key, path, _hash in pending],
+            jobs=session.jobs,
+        ):
+            total_added += added
+            stats.merge(section_stats)
+        for _department, _key, filepath, _hash in pending:
+            session.invalidate(filepath)
+    else:
+        # Inserções de todas as seções são aplicadas de uma vez no flush
+        writer = session.writer()
+        for department, section_key, filepath, _hash in pending:
+            total_added += merge_section(source, section_key, session.seed(department), filepath, department, writer)
+        stats = writer.flush()
+
+    if stats.files_written:
+        fingerprints_writer = session.writer()
+        _count, duplicates = write_fingerprints(session.seeds_dir, fingerprints_writer)
+        if duplicates:
+            print(f"AVISO: {len(duplicates)} servicos repetidos (departmentCode:name); "
+                  f"detalhes em `digiurban-tools fingerprints --check`")
+        stats.merge(fingerprints_writer.flush())
+
+    if manifest is not None:
+        # O sha1 do destino só é conhecido depois da gravação
+        for department, section_key, filepath, source_hash in pending:
+            manifest['sections'][section_key] = {
+                'source_hash': source_hash,
+                'target_file': department.file,
+                'target_sha1': file_hash(filepath),
+                'services': service_hashes(service_entries(source, section_key)),
+            }
+        save_manifest(manifest, args.manifest)
+
+    print(f"\n{'='*60}")
+    print(f"TOTAL: {total_added} servicos adicionados")
+    print(stats.summary())
+    if skipped:
+        print(f"Secoes puladas (inalteradas): {len(skipped)} - use --since-manifest para detalhes")
+    return 0
@@ -0,0 +1,89 @@
+"""
+Procura serviços quase duplicados entre secretarias (MinHash + LSH)
+
+Compara nome, descrição e ids de campo do formSchema de todos os serviços
+dos seeds sem comparar todos os pares (ver digiurban_tools.near_duplicates).
+Por padrão lista só clusters com serviços de mais de uma secretaria;
+--all inclui os de uma secretaria só. Clusters cujo formSchema é idêntico
+em todos os membros são marcados, com o tamanho que se repete no catálogo.
+"""
+
+import json
+
+from digiurban_tools.arguments import fraction, non_negative_int, positive_int
+from digiurban_tools.catalog import load_definitions
+from digiurban_tools.departments import DEPARTMENTS
+from digiurban_tools.near_duplicates import DEFAULT_THRESHOLD, NUM_PERM, find_clusters, lsh_parameters, shingles
+
+
+def add_arguments(parser):
+    parser.add_argument('--threshold', type=fraction, default=DEFAULT_THRESHOLD,
+                        help=f'similaridade (Jaccard) minima, em (0, 1] (padrao: {DEFAULT_THRESHOLD})')
+    parser.add_argument('--num-perm', type=positive_int, default=NUM_PERM,
+                        help=f'tamanho da assinatura MinHash (padrao: {NUM_PERM})')
+    parser.add_argument('--all', action='store_true',
+                        help='inclui clusters dentro de uma mesma secretaria')
+    parser.add_argument('--limit', type=non_negative_int, default=0,
+                        help='mostra no maximo N clusters (padrao: todos)')
+
+
+def collect_services(session):
+    """[(departamento, arquivo, linha, definição)] dos seeds, na ordem de DEPARTMENTS"""
+    services = []
+    skipped = 0
+    for department in DEPARTMENTS:
+        filepath = session.seed_path(department)
+        if session.index(filepath) is None:
+            print(f"AVISO: {department.file} nao encontrado")
+            continue
+        for entry in load_definitions(filepath):
+            if 'error' in entry:
+                skipped += 1
+                continue
+            services.append((department, department.file, entry['line'], entry['definition']))
+    return services, skipped
+
+
+def _schema_bytes(definition):
+    return json.dumps(definition.get('formSchema'), ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+
+
+def run(args, session):
+    services, skipped = collect_services(session)
+    items = [(shingles(definition), department.code) for department, _file, _line, definition in services]
+    clusters = find_clusters(items, threshold=args.threshold, num_perm=args.num_perm)
+    if not args.all:
+        clusters = [c for c in clusters if c.cross_department]
+
+    bands, rows = lsh_parameters(args.threshold, args.num_perm)
+    print("="*80)
+    print("SERVICOS QUASE DUPLICADOS")
+    print("="*80)
+    print(f"Servicos analisados: {len(services)}" + (f" ({skipped} com erro de avaliacao ignorados)" if skipped else ''))
+    print(f"Limiar: {args.threshold:.2f} (LSH: {bands} faixas x {rows} linhas)")
+    print()
+
+    repeated_bytes = 0
+    shown = clusters[:args.limit] if args.limit else clusters
+    for number, cluster in enumerate(shown, 1):
+        members = [services[i] for i in cluster.members]
+        schemas = {_schema_bytes(definition) for _d, _f, _l, definition in members}
+        identical = len(schemas) == 1 and members[0][3].get('formSchema') is not None
+
+        print(f"[{number}] {len(members)} servicos, similaridade >= {cluster.min_similarity:.2f}, "
+              f"secretarias: {', '.join(cluster.departments)}")
+        if identical:
+            size = len(next(iter(schemas)).encode('utf-8'))
+            repeated_bytes += size * (len(members) - 1)
+            print(f"    formSchema identico em todos ({size} bytes cada)")
+        for department, file, line, definition in members:
+            print(f"    - {file}:{line} [{department.code}] {definition.get('name')}")
+        print()
+
+    print("="*80)
+    print(f"Clusters: {len(clusters)}" + (f" (mostrando {len(shown)})" if len(shown) < len(clusters) else ''))
+    print(f"Servicos em clusters: {sum(len(c.members) for c in clusters)}")
+    if repeated_bytes:
+        print(f"formSchema repetido nos clusters mostrados: {repeated_bytes} bytes")
+    print("="*80)
+    return 0
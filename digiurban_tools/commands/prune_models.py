@@ -0,0 +1,108 @@
+"""
+Remove models legados do schema.prisma
+
+O schema é indexado uma vez (digiurban_tools.prisma_schema) e reconstruído
+sem todos os models pedidos em uma única passada; comentários colados
+acima de cada model saem junto, banners de seção (// ====) ficam.
+--locate só informa em que linhas estão os models, sem alterar o arquivo.
+
+Antes de gravar, os campos dos models restantes que apontam para os
+removidos (relações e listas de back-reference) são listados pelo grafo
+de referências do índice. Sem --cascade o schema não é alterado, já que
+o `prisma generate` falharia; com --cascade esses campos saem na mesma
+gravação. Colunas escalares de FK (ex.: serviceFormId) são mantidas.
+"""
+
+from digiurban_tools import profiling
+from digiurban_tools.paths import SCHEMA_PRISMA
+from digiurban_tools.prisma_schema import index_schema
+
+# Models legados a remover
+LEGACY_MODELS = [
+    'ServiceGeneration',
+    'ProtocolLocation',
+    'ServiceLocation',
+    'ServiceForm',
+    'ServiceFormSubmission',
+    'ServiceScheduling',
+    'ServiceCustomField',
+    'ProtocolCustomFieldValue',
+    'ServiceDocument'
+]
+
+
+def add_arguments(parser):
+    parser.add_argument('models', nargs='*', metavar='MODEL',
+                        help='models a remover (padrao: lista de models legados)')
+    parser.add_argument('--schema', default=SCHEMA_PRISMA,
+                        help='arquivo schema.prisma (padrao: digiurban/backend/prisma/schema.prisma)')
+    parser.add_argument('--locate', action='store_true',
+                        help='apenas mostra as linhas de cada model, sem alterar o schema')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='mostra o que seria removido, sem gravar')
+    parser.add_argument('--cascade', action='store_true',
+                        help='remove tambem os campos de outros models que apontam para os removidos')
+
+
+def locate(index, models):
+    for model_name in models:
+        block = index.model(model_name)
+        if block is None:
+            print(f'⚠️  Não encontrado: model {model_name}')
+        else:
+            print(f'model {model_name}: linhas {block.line}-{block.end_line}')
+
+
+def run(args, session):
+    models = args.models or LEGACY_MODELS
+    index = index_schema(args.schema)
+
+    if args.locate:
+        locate(index, models)
+        return 0
+
+    found = []
+    for model_name in models:
+        block = index.model(model_name)
+        if block is None:
+            print(f'⚠️  Não encontrado: model {model_name}')
+        else:
+            found.append(block)
+
+    dangling = index.dangling(block.name for block in found)
+    blocked = dangling and not args.cascade
+    label = 'Seria removido' if args.dry_run or blocked else 'Removido'
+    for block in found:
+        print(f'✅ {label}: model {block.name} (linhas {block.line}-{block.end_line})')
+
+    if dangling:
+        title = 'Campos que ficariam órfãos' if blocked else 'Campos removidos junto (--cascade)'
+        print(f'\n{title} ({len(dangling)}):')
+        for f in sorted(dangling, key=lambda f: f.line):
+            if f.is_list:
+                kind = 'back-reference'
+            elif index.enum(f.type):
+                kind = 'enum'
+            else:
+                kind = 'relação'
+            print(f'  {f.block}.{f.name}: {f.type}{"[]" if f.is_list else ""} ({kind}, linha {f.line})')
+        if blocked:
+            print('\n❌ Schema não alterado: use --cascade para remover esses campos junto')
+            return 1
+
+    profiling.count('models_removed', len(found))
+    profiling.count('fields_removed', len(dangling))
+
+    if found and not args.dry_run:
+        with profiling.phase('prune'):
+            content = index.remove(found, dangling)
+        writer = session.writer()
+        writer.write(args.schema, content)
+        writer.flush()
+
+    print(f'\n✅ Total de models removidos: {len(found)}')
+    if args.dry_run:
+        print('📝 Simulação (--dry-run): schema não alterado')
+    else:
+        print(f'📝 Schema atualizado: {args.schema}')
+    return 0
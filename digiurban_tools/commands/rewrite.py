@@ -0,0 +1,61 @@
+"""
+Aplica um arquivo de regras de reescrita (JSON ou YAML) à árvore do frontend
+
+Todas as regras são compiladas em uma única regex e cada arquivo é
+percorrido uma vez (formato em digiurban_tools.rewrite_rules). Com
+--dry-run nada é gravado; --diff imprime o diff unificado de cada arquivo
+alterado. No fim são listados os acertos de cada regra.
+"""
+
+from digiurban_tools.codemod import run_codemods
+from digiurban_tools.paths import FRONTEND_APP_DIR
+from digiurban_tools.rewrite_rules import RewriteRuleError, load_rules
+
+
+def add_arguments(parser):
+    parser.add_argument('--rules', required=True, metavar='ARQUIVO',
+                        help='arquivo de regras (.json, .yaml ou .yml)')
+    add_rule_arguments(parser)
+
+
+def add_rule_arguments(parser, app_dir_aliases=()):
+    """Opções comuns aos comandos baseados em regras"""
+    parser.add_argument('--app-dir', *app_dir_aliases, dest='app_dir', default=FRONTEND_APP_DIR,
+                        help='diretorio percorrido (padrao: digiurban/frontend/app)')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='lista o que seria alterado, sem gravar')
+    parser.add_argument('--diff', action='store_true',
+                        help='imprime o diff unificado de cada arquivo alterado')
+
+
+def run_rules(rules_path, name, args, session):
+    """Carrega as regras, aplica e imprime o relatório. Retorna o código de saída."""
+    try:
+        ruleset = load_rules(rules_path)
+    except (OSError, RewriteRuleError) as exc:
+        print(f"ERRO: {exc}")
+        return 1
+
+    report = run_codemods(args.app_dir, [ruleset.as_codemod(name)], jobs=session.jobs,
+                          dry_run=args.dry_run, diff=args.diff)
+
+    label = 'Seria corrigido' if args.dry_run else 'Corrigido'
+    for relpath, hits in report.changed:
+        print(f"✅ {label}: {relpath} ({', '.join(sorted(hits))})")
+
+    if args.diff and report.diffs:
+        print()
+        for patch in report.diffs:
+            print(patch, end='' if patch.endswith('\n') else '\n')
+
+    print("\nAcertos por regra:")
+    for rule in ruleset.rules:
+        print(f"  {rule.id:40} {report.hits.get(rule.id, 0):6}")
+
+    print(f"\n🎯 Total de arquivos corrigidos: {len(report.changed)}/{report.files_scanned}"
+          f" ({report.files_cached} sem alteracoes desde a ultima execucao)")
+    return 0
+
+
+def run(args, session):
+    return run_rules(args.rules, 'rewrite', args, session)
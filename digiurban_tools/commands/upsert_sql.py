@@ -0,0 +1,80 @@
+"""
+Gera o script SQL de upsert em lote do catálogo de serviços
+
+Em vez de um findFirst + update/create por serviço (seedServices), carrega
+todos os serviços em uma tabela temporária via COPY e aplica um único
+INSERT ... ON CONFLICT (name, departmentId) DO UPDATE, resolvendo o
+departmentCode por JOIN em departments. O ON CONFLICT usa o
+@@unique([name, departmentId]) do schema.prisma: rode as migrations antes.
+
+Exemplos:
+  digiurban-tools upsert-sql
+  digiurban-tools upsert-sql --data-file services.upsert.csv
+  digiurban-tools upsert-sql --chunk-size 500
+  digiurban-tools upsert-sql --psql postgresql://localhost/digiurban
+"""
+
+import os
+import shutil
+import subprocess
+
+from digiurban_tools.arguments import positive_int
+from digiurban_tools.catalog import build_catalog
+from digiurban_tools.sql_upsert import generate_copy_data, generate_sql
+
+DEFAULT_OUTPUT_FILE = 'services.upsert.sql'
+
+
+def add_arguments(parser):
+    parser.add_argument('-o', '--output', default=None,
+                        help=f'arquivo .sql gerado (padrao: {DEFAULT_OUTPUT_FILE} nos seeds)')
+    parser.add_argument('--copy-format', choices=('csv', 'text'), default='csv',
+                        help='formato do COPY do staging (padrao: csv)')
+    parser.add_argument('--data-file', default=None,
+                        help='grava os dados do COPY neste arquivo e usa \\copy no script')
+    parser.add_argument('--chunk-size', type=positive_int, default=None,
+                        help='sem COPY: INSERT ... VALUES e upsert em lotes de N servicos')
+    parser.add_argument('--psql', metavar='DATABASE_URL', default=None,
+                        help='executa o script gerado com psql nesse banco')
+
+
+def run(args, session):
+    if args.chunk_size and args.data_file:
+        print("ERRO: --chunk-size e --data-file sao exclusivos")
+        return 1
+
+    services, issues, _sources = build_catalog(session.seeds_dir)
+    errors = [issue for issue in issues if issue.severity == 'error']
+    for issue in errors:
+        print(issue)
+    if errors:
+        print(f"ERRO: {len(errors)} erros no catalogo, SQL nao gerado")
+        return 1
+
+    output = args.output or os.path.join(session.seeds_dir, DEFAULT_OUTPUT_FILE)
+    writer = session.writer()
+    copy_file = None
+    if args.data_file:
+        writer.write(args.data_file, generate_copy_data(services, args.copy_format))
+        copy_file = os.path.abspath(args.data_file).replace('\\', '/')
+
+    writer.write(output, generate_sql(
+        services,
+        copy_format=args.copy_format,
+        copy_file=copy_file,
+        chunk_size=args.chunk_size,
+    ))
+    stats = writer.flush()
+
+    mode = f"lotes de {args.chunk_size}" if args.chunk_size else f"COPY {args.copy_format}"
+    print(f"OK {len(services)} servicos -> {output} ({mode})")
+    print(stats.summary())
+
+    if args.psql:
+        if shutil.which('psql') is None:
+            print("ERRO: psql nao encontrado no PATH")
+            return 1
+        result = subprocess.run(['psql', args.psql, '-v', 'ON_ERROR_STOP=1', '-f', output])
+        return result.returncode
+
+    return 0
@@ -0,0 +1,82 @@
+"""
+Valida os formSchema de todos os serviços dos seeds
+
+Confere cada formSchema contra as interfaces de
+prisma/seeds/services/schema-types.ts (formato unificado) e contra o que o
+schema-converter.ts espera do formato legado (ver
+digiurban_tools.form_schema): pattern que não compila, minLength >
+maxLength, citizen_* desconhecido, ids de campo repetidos etc. Os
+pattern são compilados pelo node quando ele está no PATH (são RegExp do
+JavaScript); sem ele, ou com --no-node, só o subconjunto comum JS/Python
+é verificado.
+
+Os resultados ficam em cache por hash do formSchema; numa nova execução
+só os alterados são validados. Sai com código 1 se houver erros (e, com
+--strict, também se houver avisos).
+
+Com --format ndjson|csv cada problema sai como um registro (type
+'problem': department_code, file, line, name, severity, path, message).
+"""
+
+import time
+
+from digiurban_tools.commands.near_dupes import collect_services
+from digiurban_tools.form_schema import FormSchemaRules, validate_catalog
+from digiurban_tools.report import add_format_argument, write_records
+
+COLUMNS = ('type', 'department_code', 'file', 'line', 'name', 'severity', 'path', 'message')
+
+_LABELS = {'error': 'ERRO', 'warning': 'AVISO'}
+
+
+def add_arguments(parser):
+    add_format_argument(parser)
+    parser.add_argument('--strict', action='store_true',
+                        help='avisos tambem fazem o comando falhar')
+    parser.add_argument('--errors-only', action='store_true',
+                        help='lista so os erros')
+    parser.add_argument('--no-node', action='store_true',
+                        help='nao usa o node: valida os pattern so pelo subconjunto comum JS/Python')
+
+
+def _records(problems):
+    for department_code, file, line, name, severity, path, message in problems:
+        yield {'type': 'problem', 'department_code': department_code, 'file': file, 'line': line,
+               'name': name, 'severity': severity, 'path': path, 'message': message}
+
+
+def run(args, session):
+    start = time.perf_counter()
+    services, skipped = collect_services(session)
+    rules = FormSchemaRules.load(node=not args.no_node)
+    report = validate_catalog(services, rules)
+    elapsed = time.perf_counter() - start
+
+    problems = report.problems
+    if args.errors_only:
+        problems = [problem for problem in problems if problem[4] == 'error']
+    warnings = len(report.problems) - report.errors
+    failed = report.errors or (args.strict and warnings)
+
+    if args.format != 'text':
+        write_records(_records(problems), args.format, COLUMNS)
+        return 1 if failed else 0
+
+    print("="*80)
+    print("VALIDACAO DOS formSchema")
+    print("="*80)
+    current = None
+    for _code, file, line, name, severity, path, message in problems:
+        if (file, line) != current:
+            current = (file, line)
+            print(f"\n{file}:{line} {name}")
+        print(f"  {_LABELS[severity]:5} {path}: {message}")
+    if problems:
+        print()
+    print("="*80)
+    print(f"formSchema: {report.schemas} (validados: {report.validated}, do cache: {report.cached}, "
+          f"pattern: {rules.pattern_engine})"
+          + (f", {skipped} servicos com erro de avaliacao ignorados" if skipped else ''))
+    print(f"Erros: {report.errors}, avisos: {warnings} ({elapsed * 1000:.0f} ms)")
+    print("="*80)
+    return 1 if failed else 0
@@ -0,0 +1,339 @@
+"""
+Diff do catálogo de seeds contra um export de services_simplified
+
+Em vez de reescrever todos os serviços a cada seed, compara o catálogo
+(build_catalog) com o que já está no banco e gera só o necessário:
+
+- creates:       serviço do catálogo sem linha no banco
+- updates:       linha existente com colunas diferentes (só as que mudaram)
+- deactivations: linha ativa de uma secretaria do catálogo que não está
+                 mais no catálogo (isActive = false; nada é apagado)
+
+Uma linha fora do catálogo cujo contentFingerprint é o fingerprint de um
+serviço novo da mesma secretaria é uma renomeação: vira update do name
+(e do que mais mudou) em vez de create + deactivation, com uma consulta
+a dict por serviço novo.
+
+O export é lido de um CSV (com cabeçalho) ou JSON/NDJSON, ex.:
+
+    \\copy (SELECT s.*, d.code AS "departmentCode" FROM services_simplified s
+            JOIN departments d ON d.id = s."departmentId") TO 'services.csv' CSV HEADER
+
+ou o \\copy da tabela pura mais um export de departments (id, code). Os
+dois lados são indexados em dicts (hash join) pela chave de
+catalog_diff.service_key, (nome normalizado, departmentCode): o custo é
+linear nos dois lados.
+
+O valor esperado de cada coluna segue o seedServices: campo ausente na
+definição não é escrito, formSchema/requiredDocuments vazios também não,
+requiredDocuments vai como JSON.stringify do array, isActive volta a
+true e contentFingerprint recebe o fingerprint de conteúdo do serviço.
+Colunas JSON são comparadas pelo valor (ordem das chaves não conta).
+"""
+
+import csv
+import json
+import os
+from dataclasses import dataclass, field
+
+from digiurban_tools import profiling
+from digiurban_tools.catalog_diff import normalize_name
+from digiurban_tools.fingerprint import service_fingerprint
+from digiurban_tools.sql_upsert import TABLE, sql_literal
+
+DB_DIFF_VERSION = 1
+
+# (coluna, tipo) que o seed escreve, na ordem do model ServiceSimplified
+COLUMNS = [
+    ('name', 'text'),
+    ('description', 'text'),
+    ('serviceType', 'enum'),
+    ('moduleType', 'text'),
+    ('formSchema', 'jsonb'),
+    ('linkedCitizensConfig', 'jsonb'),
+    ('isActive', 'boolean'),
+    ('requiresDocuments', 'boolean'),
+    ('requiredDocuments', 'jsonb'),
+    ('estimatedDays', 'integer'),
+    ('priority', 'integer'),
+    ('category', 'text'),
+    ('icon', 'text'),
+    ('color', 'text'),
+    ('contentFingerprint', 'text'),
+]
+_TYPES = dict(COLUMNS)
+
+# seedServices usa `valor || undefined`: vazio não sobrescreve
+_SKIP_WHEN_EMPTY = {'formSchema', 'requiredDocuments'}
+
+_TRUE = {'t', 'true', '1', 'yes'}
+
+
+class ExportError(ValueError):
+    """Export ilegível ou sem as colunas necessárias"""
+
+
+def _compact(value):
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def catalog_values(definition):
+    """{coluna: valor} que o seedServices escreveria para a definição"""
+    values = {}
+    for column, _type in COLUMNS:
+        if column == 'isActive':
+            values[column] = True
+            continue
+        if column == 'contentFingerprint':
+            values[column] = service_fingerprint(definition)
+            continue
+        if column not in definition:
+            continue
+        value = definition[column]
+        if column in _SKIP_WHEN_EMPTY and not value:
+            continue
+        if column == 'requiredDocuments':
+            value = _compact(value)
+        values[column] = value
+    return values
+
+
+def _parse_text(value, column_type):
+    """Valor de uma célula do CSV (texto) no tipo da coluna; vazio é NULL"""
+    if value is None or value == '':
+        return None
+    if column_type == 'boolean':
+        return value.strip().lower() in _TRUE
+    if column_type == 'integer':
+        return int(value)
+    if column_type == 'jsonb':
+        return json.loads(value)
+    return value
+
+
+def _read_rows(path):
+    """(linhas como dicts, valores em texto?) de um .csv, .json ou .ndjson/.jsonl"""
+    ext = os.path.splitext(path)[1].lower()
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        if ext == '.csv':
+            return list(csv.DictReader(f)), True
+        if ext in ('.ndjson', '.jsonl'):
+            return [json.loads(line) for line in f if line.strip()], False
+        data = json.load(f)
+    if isinstance(data, dict):
+        # {"services": [...]} / {"rows": [...]} (ex.: saída de scripts Prisma)
+        data = data.get('services', data.get('rows'))
+    if not isinstance(data, list):
+        raise ExportError(f"{path}: esperado um array de linhas")
+    return data, False
+
+
+def load_departments(path):
+    """{departmentId: code} de um export de departments"""
+    rows, _text = _read_rows(path)
+    try:
+        return {row['id']: row['code'] for row in rows}
+    except KeyError as e:
+        raise ExportError(f"{path}: coluna {e} ausente") from e
+
+
+def load_export(path, departments=None):
+    """
+    Linhas de services_simplified com os valores já nos tipos das colunas.
+    O departmentCode vem da própria linha (departmentCode/department_code)
+    ou do mapa {departmentId: code} de load_departments.
+    """
+    rows, text = _read_rows(path)
+    result = []
+    for number, raw in enumerate(rows, 1):
+        if 'id' not in raw or 'name' not in raw:
+            raise ExportError(f"{path}: linha {number} sem id/name")
+        row = {'id': raw['id']}
+        for column, column_type in COLUMNS:
+            if column in raw:
+                row[column] = _parse_text(raw[column], column_type) if text else raw[column]
+        if text and row.get('name') is None:
+            row['name'] = ''
+        code = raw.get('departmentCode') or raw.get('department_code')
+        if not code and departments is not None:
+            code = departments.get(raw.get('departmentId'))
+        row['departmentCode'] = code
+        result.append(row)
+    return result
+
+
+@dataclass
+class DbDiff:
+    creates: list = field(default_factory=list)
+    # (linha do banco, {coluna: novo valor})
+    updates: list = field(default_factory=list)
+    deactivations: list = field(default_factory=list)
+    # (linha do banco, definição) das renomeações, também presentes em updates
+    renamed: list = field(default_factory=list)
+    unchanged: int = 0
+    # Linhas do banco com a mesma chave de outra (ficam como estão)
+    duplicates: list = field(default_factory=list)
+    # Linhas sem departmentCode (sem mapa de departments)
+    unmapped: list = field(default_factory=list)
+
+    def is_empty(self):
+        return not (self.creates or self.updates or self.deactivations)
+
+
+def _key(name, department_code):
+    return normalize_name(name or ''), department_code or ''
+
+
+def changed_columns(row, values):
+    """{coluna: novo valor} das colunas de `values` que diferem da linha"""
+    return {column: value for column, value in values.items()
+            if column not in row or row[column] != value}
+
+
+def diff_catalog(services, rows, deactivate=True):
+    """
+    Compara o catálogo (definições de build_catalog) com as linhas do
+    banco (load_export). Como no sql_upsert, se a mesma chave aparece duas
+    vezes no catálogo a última ocorrência vence; no banco, a primeira linha
+    ativa da chave é a que recebe o update.
+    """
+    with profiling.phase('db_diff'):
+        return _diff_catalog(services, rows, deactivate)
+
+
+def _diff_catalog(services, rows, deactivate):
+    result = DbDiff()
+
+    # Lado de build: o catálogo, que cabe em memória inteiro
+    catalog = {}
+    for definition in services:
+        catalog[_key(definition.get('name'), definition.get('departmentCode'))] = definition
+
+    matched = {}
+    for row in rows:
+        if not row['departmentCode']:
+            result.unmapped.append(row)
+            continue
+        key = _key(row['name'], row['departmentCode'])
+        current = matched.get(key)
+        if current is None:
+            matched[key] = row
+        elif row.get('isActive') and not current.get('isActive'):
+            result.duplicates.append(current)
+            matched[key] = row
+        else:
+            result.duplicates.append(row)
+
+    # Linhas das secretarias do catálogo que não estão nele, por fingerprint gravado
+    codes = {code for _name, code in catalog}
+    orphans = [row for key, row in matched.items() if key not in catalog and row['departmentCode'] in codes]
+    by_fingerprint = {}
+    for row in orphans:
+        if row.get('contentFingerprint'):
+            by_fingerprint.setdefault((row['contentFingerprint'], row['departmentCode']), []).append(row)
+
+    renamed = set()
+    for key, definition in catalog.items():
+        row = matched.get(key)
+        if row is None:
+            candidates = by_fingerprint.get((service_fingerprint(definition), definition.get('departmentCode')))
+            if not candidates:
+                result.creates.append(definition)
+                continue
+            row = candidates.pop(0)
+            renamed.add(row['id'])
+            result.renamed.append((row, definition))
+        changes = changed_columns(row, catalog_values(definition))
+        if changes:
+            result.updates.append((row, changes))
+        else:
+            result.unchanged += 1
+
+    if deactivate:
+        for row in orphans:
+            if row.get('isActive', True) and row['id'] not in renamed:
+                result.deactivations.append(row)
+    profiling.count('db_diff_changes', len(result.creates) + len(result.updates) + len(result.deactivations))
+    return result
+
+
+def _literal(column, value):
+    literal = sql_literal(_compact(value) if _TYPES[column] == 'jsonb' and value is not None else value,
+                          _TYPES[column])
+    return f'{literal}::"ServiceType"' if _TYPES[column] == 'enum' and value is not None else literal
+
+
+def _create_sql(definition):
+    values = catalog_values(definition)
+    columns = ', '.join(f'"{column}"' for column in ['id', 'departmentId', *values, 'createdAt', 'updatedAt'])
+    expressions = (['gen_random_uuid()::text', 'd.id']
+                   + [_literal(column, value) for column, value in values.items()]
+                   + ['now()', 'now()'])
+    return (
+        f'INSERT INTO {TABLE} ({columns})\n'
+        f'SELECT {", ".join(expressions)}\n'
+        f'FROM "departments" d WHERE d.code = {sql_literal(definition.get("departmentCode"), "text")};'
+    )
+
+
+def _update_sql(row, changes):
+    assignments = ', '.join(f'"{column}" = {_literal(column, value)}' for column, value in changes.items())
+    return f'UPDATE {TABLE} SET {assignments}, "updatedAt" = now() WHERE "id" = {sql_literal(row["id"], "text")};'
+
+
+def generate_sql(diff):
+    """Script SQL (psql) que aplica o diff em uma transação"""
+    out = [
+        f'-- Diff do catálogo: {len(diff.creates)} novos, {len(diff.updates)} alterados '
+        f'({len(diff.renamed)} renomeados), '
+        f'{len(diff.deactivations)} desativados, {diff.unchanged} sem mudança',
+        '-- Executar com: psql -v ON_ERROR_STOP=1 -f <arquivo>',
+        '\\set ON_ERROR_STOP on',
+        '',
+        'BEGIN;',
+        '',
+    ]
+    if diff.creates:
+        out.append('-- Novos (secretaria inexistente no banco: nada é inserido, como no seedServices)')
+        out += [_create_sql(definition) for definition in diff.creates]
+        out.append('')
+    if diff.updates:
+        out.append('-- Alterados (só as colunas que mudaram)')
+        out += [_update_sql(row, changes) for row, changes in diff.updates]
+        out.append('')
+    if diff.deactivations:
+        ids = ',\n  '.join(sql_literal(row['id'], 'text') for row in diff.deactivations)
+        out += [
+            '-- Fora do catálogo',
+            f'UPDATE {TABLE} SET "isActive" = false, "updatedAt" = now() WHERE "id" IN (\n  {ids}\n);',
+            '',
+        ]
+    out += ['COMMIT;', '']
+    return '\n'.join(out)
+
+
+def diff_document(diff):
+    """Diff como documento JSON (para um passo de seed aplicar via Prisma)"""
+    return {
+        'version': DB_DIFF_VERSION,
+        'creates': [{'departmentCode': d.get('departmentCode'), 'values': catalog_values(d)} for d in diff.creates],
+        'updates': [
+            {
+                'id': row['id'],
+                'name': row['name'],
+                'departmentCode': row['departmentCode'],
+                'changes': changes,
+                'previous': {column: row.get(column) for column in changes},
+            }
+            for row, changes in diff.updates
+        ],
+        'deactivations': [
+            {'id': row['id'], 'name': row['name'], 'departmentCode': row['departmentCode']}
+            for row in diff.deactivations
+        ],
+        'renamed': [
+            {'id': row['id'], 'from': row['name'], 'to': definition.get('name')}
+            for row, definition in diff.renamed
+        ],
+        'unchanged': diff.unchanged,
+    }
@@ -0,0 +1,53 @@
+"""
+Tabela única das secretarias e dos seus arquivos de seed
+
+A ordem é a mesma do allServices em prisma/seeds/services/index.ts.
+`sections` lista os nomes da const no arquivo fonte consolidado
+(services-simplified-complete.ts); Segurança Pública aparece com dois
+nomes nas versões do arquivo.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Department:
+    code: str
+    name: str
+    file: str
+    export: str
+    sections: tuple
+
+    @property
+    def module(self):
+        return self.file[:-len('.ts')]
+
+
+DEPARTMENTS = (
+    Department('SAUDE', 'Saúde', 'health.seed.ts', 'healthServices', ('HEALTH_SERVICES',)),
+    Department('EDUCACAO', 'Educação', 'education.seed.ts', 'educationServices', ('EDUCATION_SERVICES',)),
+    Department('ASSISTENCIA_SOCIAL', 'Assistência Social', 'social.seed.ts', 'socialServices', ('SOCIAL_SERVICES',)),
+    Department('AGRICULTURA', 'Agricultura', 'agriculture.seed.ts', 'agricultureServices', ('AGRICULTURE_SERVICES',)),
+    Department('CULTURA', 'Cultura', 'culture.seed.ts', 'cultureServices', ('CULTURE_SERVICES',)),
+    Department('ESPORTES', 'Esportes', 'sports.seed.ts', 'sportsServices', ('SPORTS_SERVICES',)),
+    Department('HABITACAO', 'Habitação', 'housing.seed.ts', 'housingServices', ('HOUSING_SERVICES',)),
+    Department('MEIO_AMBIENTE', 'Meio Ambiente', 'environment.seed.ts', 'environmentServices', ('ENVIRONMENT_SERVICES',)),
+    Department('OBRAS_PUBLICAS', 'Obras Públicas', 'public-works.seed.ts', 'publicWorksServices', ('PUBLIC_WORKS_SERVICES',)),
+    Department('PLANEJAMENTO_URBANO', 'Planejamento Urbano', 'urban-planning.seed.ts', 'urbanPlanningServices', ('URBAN_PLANNING_SERVICES',)),
+    Department('SEGURANCA_PUBLICA', 'Segurança Pública', 'public-safety.seed.ts', 'publicSafetyServices', ('PUBLIC_SAFETY_SERVICES', 'SECURITY_SERVICES')),
+    Department('SERVICOS_PUBLICOS', 'Serviços Públicos', 'public-services.seed.ts', 'publicServices', ('PUBLIC_SERVICES',)),
+    Department('TURISMO', 'Turismo', 'tourism.seed.ts', 'tourismServices', ('TOURISM_SERVICES',)),
+)
+
+BY_CODE = {d.code: d for d in DEPARTMENTS}
+BY_FILE = {d.file: d for d in DEPARTMENTS}
+
+SEED_FILES = [d.file for d in DEPARTMENTS]
+
+
+def source_section(department, index):
+    """Nome da seção do departamento presente no índice da fonte, ou None"""
+    for name in department.sections:
+        if index.section(name) is not None:
+            return name
+    return None
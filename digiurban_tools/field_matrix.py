@@ -0,0 +1,194 @@
+"""
+Matriz de campos do catálogo (citizenFields e fields[].id) em bitsets
+
+Cada serviço tem:
+
+- uma máscara de citizenFields (array 'Q', um inteiro por serviço), com um
+  bit por nome do vocabulário de OLD_TO_NEW_CITIZEN_FIELDS
+  (prisma/seeds/services/schema-converter.ts); nomes fora do vocabulário
+  ganham bits novos no fim e ficam em `unknown_citizen`
+- uma máscara dos fields[].id customizados, sobre a tabela de ids internados
+  (`field_ids`, na ordem em que aparecem)
+
+Além das linhas, a matriz guarda as colunas transpostas: para cada campo,
+um inteiro em que o bit i indica que o serviço i coleta o campo, e uma
+máscara de serviços por secretaria. Consultas como "tem
+citizen_familyincome e não tem citizen_cpf" viram um & e um ~ sobre o
+catálogo inteiro, e contagens (coocorrência, resumo por secretaria) são
+bit_count() da interseção das colunas.
+"""
+
+import re
+from array import array
+
+from digiurban_tools import profiling
+from digiurban_tools.paths import SCHEMA_CONVERTER_TS
+
+_VOCABULARY_RE = re.compile(r'OLD_TO_NEW_CITIZEN_FIELDS\s*:[^=]*=\s*\{(.*?)\}', re.S)
+_ENTRY_RE = re.compile(r"^\s*['\"]?(\w+)['\"]?\s*:\s*['\"]([^'\"]*)['\"]", re.M)
+
+
+def read_citizen_field_mapping(converter_ts=SCHEMA_CONVERTER_TS):
+    """{citizen_*: nome da property no JSON Schema} de OLD_TO_NEW_CITIZEN_FIELDS, em ordem"""
+    with open(converter_ts, 'r', encoding='utf-8') as f:
+        match = _VOCABULARY_RE.search(f.read())
+    if match is None:
+        raise ValueError(f'OLD_TO_NEW_CITIZEN_FIELDS nao encontrado em {converter_ts}')
+    return dict(_ENTRY_RE.findall(match.group(1)))
+
+
+def read_citizen_field_vocabulary(converter_ts=SCHEMA_CONVERTER_TS):
+    """Nomes de citizenFields aceitos (chaves de OLD_TO_NEW_CITIZEN_FIELDS), em ordem"""
+    return list(read_citizen_field_mapping(converter_ts))
+
+
+def bits(mask):
+    """Índices dos bits ligados, em ordem crescente"""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class FieldMatrix:
+    def __init__(self, vocabulary):
+        self.citizen_fields = list(vocabulary)
+        self.citizen_bit = {name: i for i, name in enumerate(self.citizen_fields)}
+        self.unknown_citizen = set()
+        self.field_ids = []
+        self.field_index = {}
+
+        # Linhas: (departamento, arquivo, linha, nome) e máscaras por serviço
+        self.services = []
+        self.citizen_rows = array('Q')
+        self.field_rows = []
+        self.has_schema = 0
+
+        # Colunas: bitset de serviços por campo e por secretaria
+        self.citizen_columns = [0] * len(self.citizen_fields)
+        self.field_columns = []
+        self.department_masks = {}
+
+    def _citizen_bit(self, name):
+        bit = self.citizen_bit.get(name)
+        if bit is None:
+            if len(self.citizen_fields) >= 64:
+                raise ValueError(f"citizenFields demais para a mascara de 64 bits: '{name}'")
+            bit = len(self.citizen_fields)
+            self.citizen_fields.append(name)
+            self.citizen_bit[name] = bit
+            self.citizen_columns.append(0)
+            self.unknown_citizen.add(name)
+        return bit
+
+    def intern(self, field_id):
+        index = self.field_index.get(field_id)
+        if index is None:
+            index = len(self.field_ids)
+            self.field_ids.append(field_id)
+            self.field_index[field_id] = index
+            self.field_columns.append(0)
+        return index
+
+    def add(self, department_code, file, line, definition):
+        """Acrescenta um serviço (dict da definição); devolve o índice dele"""
+        row = len(self.services)
+        service_bit = 1 << row
+        self.services.append((department_code, file, line, definition.get('name')))
+        self.department_masks[department_code] = self.department_masks.get(department_code, 0) | service_bit
+
+        citizen_mask = 0
+        field_mask = 0
+        form_schema = definition.get('formSchema')
+        if isinstance(form_schema, dict):
+            self.has_schema |= service_bit
+            for name in form_schema.get('citizenFields') or ():
+                if isinstance(name, str):
+                    citizen_mask |= 1 << self._citizen_bit(name)
+            for field in form_schema.get('fields') or ():
+                if isinstance(field, dict) and isinstance(field.get('id'), str):
+                    field_mask |= 1 << self.intern(field['id'])
+
+        self.citizen_rows.append(citizen_mask)
+        self.field_rows.append(field_mask)
+        for bit in bits(citizen_mask):
+            self.citizen_columns[bit] |= service_bit
+        for index in bits(field_mask):
+            self.field_columns[index] |= service_bit
+        return row
+
+    @property
+    def all(self):
+        return (1 << len(self.services)) - 1
+
+    def known(self, name):
+        return name in self.citizen_bit or name in self.field_index
+
+    def column(self, name):
+        """Bitset dos serviços com o campo (citizenField ou fields[].id); 0 se ninguém usa"""
+        bit = self.citizen_bit.get(name)
+        if bit is not None:
+            return self.citizen_columns[bit]
+        index = self.field_index.get(name)
+        return self.field_columns[index] if index is not None else 0
+
+    def select(self, has=(), without=(), departments=()):
+        """Bitset dos serviços com todos os campos de `has` e nenhum de `without`"""
+        result = self.all
+        if departments:
+            allowed = 0
+            for code in departments:
+                allowed |= self.department_masks.get(code, 0)
+            result &= allowed
+        for name in has:
+            result &= self.column(name)
+        for name in without:
+            result &= ~self.column(name)
+        return result
+
+    def rows(self, selection):
+        """Serviços (departamento, arquivo, linha, nome) de um bitset"""
+        return [self.services[i] for i in bits(selection)]
+
+    def citizen_cooccurrence(self, selection=None):
+        """[(campo a, campo b, serviços com os dois)] dos pares com contagem > 0"""
+        selection = self.all if selection is None else selection
+        columns = [column & selection for column in self.citizen_columns]
+        result = []
+        for a in range(len(columns)):
+            if not columns[a]:
+                continue
+            for b in range(a + 1, len(columns)):
+                count = (columns[a] & columns[b]).bit_count()
+                if count:
+                    result.append((self.citizen_fields[a], self.citizen_fields[b], count))
+        result.sort(key=lambda item: -item[2])
+        return result
+
+    def department_summary(self):
+        """{secretaria: {'services', 'with_schema', 'citizen': [contagem por bit], 'custom_fields'}}"""
+        summary = {}
+        for code, mask in self.department_masks.items():
+            custom = sum(1 for column in self.field_columns if column & mask)
+            summary[code] = {
+                'services': mask.bit_count(),
+                'with_schema': (mask & self.has_schema).bit_count(),
+                'citizen': [(column & mask).bit_count() for column in self.citizen_columns],
+                'custom_fields': custom,
+            }
+        return summary
+
+
+def build_field_matrix(services, vocabulary=None):
+    """Matriz de [(departamento, arquivo, linha, definição)] (ver near_dupes.collect_services)
+
+    Cada serviço conta na secretaria do próprio departmentCode, não na do
+    arquivo em que está (o seedServices grava pelo departmentCode); o
+    departamento do arquivo só vale para definições sem departmentCode.
+    """
+    matrix = FieldMatrix(read_citizen_field_vocabulary() if vocabulary is None else vocabulary)
+    with profiling.phase('field_matrix'):
+        for department, file, line, definition in services:
+            matrix.add(definition.get('departmentCode') or department.code, file, line, definition)
+    profiling.count('field_ids_interned', len(matrix.field_ids))
+    return matrix
@@ -0,0 +1,195 @@
+"""
+Fingerprint de conteúdo de cada ServiceDefinition
+
+sha1 do JSON canônico da definição: chaves ordenadas em todos os níveis
+(inclusive dentro do formSchema), sem espaços, números inteiros sem ".0"
+e sem o `name`. Não depende da formatação do seed, da ordem das chaves nem
+de trechos movidos para o shared-fragments.ts, e é o mesmo para um
+serviço apenas renomeado.
+
+O seedServices calcula o mesmo sha1 em TypeScript (serviceFingerprint,
+em prisma/seeds/services/fingerprints.ts) a partir do serviceDef que vai
+gravar, guarda o valor em services_simplified.contentFingerprint e pula
+as linhas em que ele não mudou: um seed editado à mão é sempre gravado,
+sem depender de regenerar arquivo algum. sql_upsert, catalog_diff e
+db_diff usam service_fingerprint; os dois lados precisam gerar o mesmo
+JSON canônico (ver render_fingerprints).
+
+Os geradores (extract, merge e o comando fingerprints) também gravam no
+fingerprints.ts os valores calculados aqui, indexados por
+`departmentCode:name`. O seed só os compara com os que calcula, para
+avisar de um arquivo desatualizado ou de divergência entre as duas
+implementações; nenhuma decisão depende deles. Se a chave se repete (o
+mesmo serviço em dois pontos dos seeds, ou em um seed de outra
+secretaria) vale a última ocorrência, a mesma que o seedServices grava:
+o laço descarta as anteriores antes de consultar o banco. duplicate_keys
+lista esses casos para o comando fingerprints.
+"""
+
+import hashlib
+import json
+import os
+
+from digiurban_tools.departments import DEPARTMENTS
+
+# Sobe quando a forma canônica mudar (todas as linhas voltam a ser gravadas)
+FINGERPRINT_VERSION = 1
+
+FINGERPRINTS_FILE = 'fingerprints.ts'
+
+FINGERPRINTS_HEADER = '''/**
+ * FINGERPRINTS DE CONTEÚDO DOS SERVIÇOS
+ * Gerado por `digiurban-tools fingerprints` (e pelo extract/merge): sha1 do
+ * JSON canônico de cada ServiceDefinition, sem o name. Não editar à mão.
+ *
+ * O seed calcula serviceFingerprint() de cada serviço; serviceFingerprints
+ * só serve para avisar quando este arquivo está desatualizado.
+ */
+
+import { createHash } from 'crypto';
+import { ServiceDefinition } from './types';
+'''
+
+# Mesma forma canônica de canonical_json: chaves ordenadas em todos os
+# níveis, JSON.stringify sem espaços (inteiros já saem sem ".0"), sem o name
+FINGERPRINT_FUNCTIONS = '''export function fingerprintKey(departmentCode: string, name: string): string {
+  return `${departmentCode}:${name}`;
+}
+
+function canonical(value: unknown): unknown {
+  if (Array.isArray(value)) {
+    return value.map(canonical);
+  }
+  if (value !== null && typeof value === 'object') {
+    const sorted: Record<string, unknown> = {};
+    for (const key of Object.keys(value).sort()) {
+      sorted[key] = canonical((value as Record<string, unknown>)[key]);
+    }
+    return sorted;
+  }
+  return value;
+}
+
+/**
+ * sha1 do JSON canônico do serviço, sem o name (igual a
+ * digiurban_tools.fingerprint.service_fingerprint)
+ */
+export function serviceFingerprint(serviceDef: ServiceDefinition): string {
+  const { name: _name, ...body } = serviceDef;
+  return createHash('sha1')
+    .update(`${FINGERPRINT_VERSION}:${JSON.stringify(canonical(body))}`, 'utf8')
+    .digest('hex');
+}
+
+/**
+ * Avisa quando o conteúdo atual difere do fingerprint gerado (seed editado
+ * depois do último `digiurban-tools fingerprints`). Só informativo: o seed
+ * grava sempre o fingerprint calculado
+ */
+export function warnStaleFingerprints(services: ServiceDefinition[]): void {
+  // A última ocorrência de cada chave é a que o seed grava
+  const last = new Map(services.map(serviceDef => [fingerprintKey(serviceDef.departmentCode, serviceDef.name), serviceDef]));
+  const stale = [...last].filter(([key, serviceDef]) =>
+    key in serviceFingerprints && serviceFingerprints[key] !== serviceFingerprint(serviceDef));
+  if (stale.length > 0) {
+    console.warn(`   ⚠️  fingerprints.ts desatualizado para ${stale.length} serviços (rode digiurban-tools fingerprints)`);
+  }
+}
+'''
+
+
+def _canonical(value):
+    if isinstance(value, dict):
+        return {key: _canonical(value[key]) for key in sorted(value)}
+    if isinstance(value, list):
+        return [_canonical(item) for item in value]
+    if isinstance(value, float) and value.is_integer():
+        # JSON.stringify(1.0) === '1'
+        return int(value)
+    return value
+
+
+def canonical_json(definition):
+    """JSON canônico da definição, sem o name"""
+    body = {key: value for key, value in definition.items() if key != 'name'}
+    return json.dumps(_canonical(body), ensure_ascii=False, separators=(',', ':'))
+
+
+def service_fingerprint(definition):
+    return hashlib.sha1(f'{FINGERPRINT_VERSION}:{canonical_json(definition)}'.encode('utf-8')).hexdigest()
+
+
+def fingerprint_key(definition):
+    """Chave do fingerprints.ts: departmentCode:name (como fingerprintKey() no TS)"""
+    return f"{definition.get('departmentCode')}:{definition.get('name')}"
+
+
+def fingerprint_entries(seeds_dir):
+    """[(chave, fingerprint, arquivo, linha)] dos serviços dos seeds, na ordem de DEPARTMENTS"""
+    # Import tardio: catalog importa este módulo
+    from digiurban_tools.catalog import load_definitions
+
+    entries = []
+    for department in DEPARTMENTS:
+        filepath = os.path.join(seeds_dir, department.file)
+        if not os.path.exists(filepath):
+            continue
+        for entry in load_definitions(filepath):
+            if 'definition' in entry:
+                definition = entry['definition']
+                entries.append((fingerprint_key(definition), service_fingerprint(definition),
+                                department.file, entry['line']))
+    return entries
+
+
+def catalog_fingerprints(seeds_dir, entries=None):
+    """{departmentCode:name: fingerprint} dos seeds, na ordem de DEPARTMENTS; a última ocorrência vence"""
+    if entries is None:
+        entries = fingerprint_entries(seeds_dir)
+    return {key: fingerprint for key, fingerprint, _file, _line in entries}
+
+
+def duplicate_keys(entries):
+    """{chave: [(arquivo, linha, fingerprint)]} das chaves com mais de uma ocorrência, em ordem"""
+    occurrences = {}
+    for key, fingerprint, file, line in entries:
+        occurrences.setdefault(key, []).append((file, line, fingerprint))
+    return {key: found for key, found in occurrences.items() if len(found) > 1}
+
+
+def conflicting(occurrences):
+    """As ocorrências de uma chave repetida têm conteúdos diferentes?"""
+    return len({fingerprint for _file, _line, fingerprint in occurrences}) > 1
+
+
+def describe_duplicate(key, occurrences):
+    """Linha de aviso de uma chave repetida"""
+    places = ', '.join(f'{file}:{line}' for file, line, _fingerprint in occurrences)
+    kind = 'conteudos diferentes, vale o ultimo' if conflicting(occurrences) else 'conteudo igual'
+    return f"AVISO: {key} repetido em {places} ({kind})"
+
+
+def render_fingerprints(fingerprints):
+    """Conteúdo do fingerprints.ts"""
+    entries = ''.join(f'  {json.dumps(key, ensure_ascii=False)}: "{value}",\n'
+                      for key, value in fingerprints.items())
+    return (
+        FINGERPRINTS_HEADER
+        + f'\nexport const FINGERPRINT_VERSION = {FINGERPRINT_VERSION};\n\n'
+        + FINGERPRINT_FUNCTIONS
+        + '\n'
+        + 'export const serviceFingerprints: Record<string, string> = {\n'
+        + entries
+        + '};\n'
+    )
+
+
+def write_fingerprints(seeds_dir, writer):
+    """
+    Registra o fingerprints.ts dos seeds atuais no writer; retorna
+    (quantas chaves, duplicate_keys)
+    """
+    entries = fingerprint_entries(seeds_dir)
+    fingerprints = catalog_fingerprints(seeds_dir, entries)
+    writer.write(os.path.join(seeds_dir, FINGERPRINTS_FILE), render_fingerprints(fingerprints))
+    return len(fingerprints), duplicate_keys(entries)
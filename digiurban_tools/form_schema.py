@@ -0,0 +1,521 @@
+"""
+Validação dos formSchema do catálogo
+
+As regras são montadas uma vez (FormSchemaRules.load):
+
+- formato unificado: interfaces UnifiedFormSchema e JSONSchemaProperty de
+  prisma/seeds/services/schema-types.ts (campos, obrigatórios e tipos,
+  inclusive uniões de literais como type e format)
+- formato legado (citizenFields + fields[]): os campos que o
+  schema-converter.ts lê de cada field
+- vocabulário de citizenFields: OLD_TO_NEW_CITIZEN_FIELDS do
+  schema-converter.ts
+
+e cada `pattern` distinto é verificado uma só vez. Além dos tipos, a
+validação acusa pattern inválido, minLength > maxLength (e
+minimum/maximum, minItems/maxItems), citizen_* fora do vocabulário, ids
+de campo repetidos ou que colidem com os campos do cidadão, `required`
+apontando para campo inexistente e default fora de enum/options/pattern.
+
+Os resultados ficam em CACHE_DIR/form-schemas.idx por hash do conteúdo do
+formSchema (e da assinatura das regras): numa nova execução só os
+formSchema alterados são validados de novo.
+
+Os pattern são fontes de RegExp do JavaScript (o DynamicForm do frontend
+faz `new RegExp(pattern)`, sem flags), não do módulo re. Com o node no
+PATH todos os pattern ainda não verificados são compilados por ele, em
+uma única chamada, e o resultado do JS é o que vale. Sem o node (ou com
+node=False) só o subconjunto comum aos dois dialetos é verificado pelo
+re: construções só do JS (grupo nomeado (?<nome>), \\k<nome>, \\p{...},
+\\cX, \\u{...}) viram aviso de pattern não verificado, e as só do Python
+((?P...), flags inline, grupos atômicos/condicionais, quantificadores
+possessivos, \\A e \\Z) viram erro. O re ainda compila o pattern, quando
+consegue, para conferir os default contra ele.
+"""
+
+import hashlib
+import json
+import marshal
+import os
+import re
+import shutil
+import subprocess
+from dataclasses import dataclass, field
+
+from digiurban_tools import profiling, seed_cache
+from digiurban_tools.catalog import _type_checker, read_interface_fields
+from digiurban_tools.field_matrix import read_citizen_field_mapping
+from digiurban_tools.paths import CACHE_DIR, SCHEMA_CONVERTER_TS, SCHEMA_TYPES_TS
+
+# Sobe quando as verificações mudarem (invalida o cache)
+VALIDATOR_VERSION = 2
+FORM_SCHEMA_CACHE_VERSION = 1
+# Extensão .idx para que --clear-cache também remova este arquivo
+FORM_SCHEMA_CACHE_FILE = 'form-schemas.idx'
+
+# Tipos de field legado tratados pelo schema-converter.ts (e pelo formulário)
+LEGACY_FIELD_TYPES = ('text', 'textarea', 'select', 'checkbox', 'number', 'date', 'email', 'phone', 'array')
+
+_RANGES = (('minLength', 'maxLength'), ('minimum', 'maximum'), ('minItems', 'maxItems'))
+_COUNTS = ('minLength', 'maxLength', 'minItems', 'maxItems')
+
+# Lê um array JSON de pattern no stdin; escreve [null | mensagem de erro]
+_NODE_CHECK = (
+    "let s='';process.stdin.on('data',c=>s+=c).on('end',()=>{"
+    "process.stdout.write(JSON.stringify(JSON.parse(s).map(p=>{"
+    "try{new RegExp(p);return null}catch(e){return e.message}})))})"
+)
+_NODE_TIMEOUT = 30
+
+_PY_FLAGS = re.compile(r'[aiLmsux-]+[:)]')
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class _Interface:
+    """Campos de uma interface do schema-types.ts, com os tipos já compilados"""
+
+    def __init__(self, fields):
+        self.fields = fields
+        self.known = {name for name, _type, _required in self.fields}
+        self.required = [name for name, _type, required in self.fields if required]
+        self.types = {name: type_text for name, type_text, _required in self.fields}
+        self.checkers = {name: _type_checker(type_text, {}) for name, type_text, _required in self.fields}
+
+    def check(self, path, value, problems, ignore=()):
+        for name in self.required:
+            if name not in value:
+                problems.append(('error', path, f"campo obrigatorio '{name}' ausente"))
+        for name, item in value.items():
+            if name not in self.known:
+                if name not in ignore:
+                    problems.append(('warning', path, f"campo '{name}' nao existe na interface"))
+            elif not self.checkers[name](item):
+                problems.append(('error', f'{path}.{name}', f"{item!r} nao e do tipo {self.types[name]}"))
+
+
+def dialect_constructs(pattern):
+    """
+    ([construções só do JS], [só do Python]) do pattern, fora de escapes
+    (e de classes [...], onde só os escapes contam)
+    """
+    js_only, py_only = [], []
+    i, n = 0, len(pattern)
+    in_class = False
+    after_quantifier = False
+    while i < n:
+        c = pattern[i]
+        if c == '\\' and i + 1 < n:
+            escape = pattern[i + 1]
+            following = pattern[i + 2:i + 3]
+            if escape in 'pP' and following == '{':
+                js_only.append(f'\\{escape}{{...}}')
+            elif escape == 'k' and following == '<':
+                js_only.append('\\k<nome>')
+            elif escape == 'c' and following.isalpha():
+                js_only.append('\\cX')
+            elif escape == 'u' and following == '{':
+                js_only.append('\\u{...}')
+            elif escape in 'AZ' and not in_class:
+                py_only.append(f'\\{escape}')
+            i += 2
+            if following == '{' and escape in 'pPu':
+                # Pula o {...} inteiro: o } não é fim de quantificador
+                close = pattern.find('}', i)
+                i = n if close < 0 else close + 1
+            after_quantifier = False
+            continue
+        if in_class:
+            in_class = c != ']'
+            i += 1
+            continue
+        if c == '[':
+            in_class = True
+        elif c == '(' and pattern.startswith('?', i + 1):
+            rest = pattern[i + 2:]
+            if rest.startswith('<') and not rest.startswith(('<=', '<!')):
+                js_only.append('(?<nome>...)')
+            elif rest.startswith('P'):
+                py_only.append('(?P...)')
+            elif rest[:1] in ('#', '>', '('):
+                py_only.append(f'(?{rest[0]}...)')
+            elif _PY_FLAGS.match(rest):
+                py_only.append('flags inline (?...)')
+        elif c == '+' and after_quantifier:
+            py_only.append('quantificador possessivo')
+        after_quantifier = c in '*+?}'
+        i += 1
+    return js_only, py_only
+
+
+def node_pattern_errors(patterns, node):
+    """{pattern: None | mensagem} de `new RegExp(pattern)` no node; None se o node falhar"""
+    try:
+        result = subprocess.run([node, '-e', _NODE_CHECK], input=json.dumps(patterns),
+                                capture_output=True, text=True, encoding='utf-8', timeout=_NODE_TIMEOUT)
+        errors = json.loads(result.stdout) if result.returncode == 0 else None
+    except (OSError, subprocess.TimeoutExpired, ValueError):
+        errors = None
+    if not isinstance(errors, list) or len(errors) != len(patterns):
+        return None
+    return dict(zip(patterns, errors))
+
+
+class FormSchemaRules:
+    def __init__(self, schema_fields, property_fields, citizen_mapping, node=None):
+        self.schema = _Interface(schema_fields)
+        self.property = _Interface(property_fields)
+        self.citizen_mapping = citizen_mapping
+        self.citizen_properties = set(citizen_mapping.values())
+        # Executável do node que valida os pattern (None: só o subconjunto comum)
+        self.node = node
+        self._rules_signature = repr((
+            VALIDATOR_VERSION, schema_fields, property_fields, sorted(citizen_mapping.items()),
+        ))
+        self._patterns = {}
+        self._js_errors = {}
+
+    @classmethod
+    def load(cls, schema_types_ts=SCHEMA_TYPES_TS, converter_ts=SCHEMA_CONVERTER_TS, node=True):
+        """node=True procura o node no PATH; False valida os pattern só pelo subconjunto comum"""
+        return cls(
+            read_interface_fields('UnifiedFormSchema', schema_types_ts),
+            read_interface_fields('JSONSchemaProperty', schema_types_ts),
+            read_citizen_field_mapping(converter_ts),
+            node=shutil.which('node') if node is True else (node or None),
+        )
+
+    @property
+    def pattern_engine(self):
+        return 'node' if self.node else 'subconjunto'
+
+    @property
+    def signature(self):
+        # Os resultados dos pattern dependem de quem os validou
+        return hashlib.sha1(f'{self._rules_signature}:{self.pattern_engine}'.encode('utf-8')).hexdigest()
+
+    def prepare_patterns(self, patterns):
+        """Valida no node, em uma chamada, os pattern ainda não vistos"""
+        if not self.node:
+            return
+        pending = sorted({p for p in patterns if p not in self._js_errors})
+        if not pending:
+            return
+        errors = node_pattern_errors(pending, self.node)
+        if errors is None:
+            print(f"AVISO: node ({self.node}) falhou; pattern validados so pelo subconjunto comum JS/Python")
+            self.node = None
+            return
+        self._js_errors.update(errors)
+
+    def compile_pattern(self, pattern):
+        """
+        (regex do re ou None, problema ou None), problema = (severidade,
+        mensagem); cada pattern distinto é verificado uma vez
+        """
+        result = self._patterns.get(pattern)
+        if result is None:
+            result = self._compile_pattern(pattern)
+            self._patterns[pattern] = result
+        return result
+
+    def _compile_pattern(self, pattern):
+        try:
+            regex, error = re.compile(pattern), None
+        except re.error as e:
+            regex, error = None, str(e)
+
+        if self.node:
+            self.prepare_patterns([pattern])
+        if self.node:
+            js_error = self._js_errors[pattern]
+            if js_error:
+                return None, ('error', f"regex invalida {pattern!r}: {js_error}")
+            # Válido no JS; o re só serve para conferir defaults quando entende o pattern
+            return regex, None
+
+        js_only, py_only = dialect_constructs(pattern)
+        if py_only:
+            return None, ('error', f"regex {pattern!r} usa {', '.join(py_only)}, que o RegExp do navegador "
+                                   f"nao aceita ou le de outro jeito")
+        if js_only:
+            return None, ('warning', f"regex {pattern!r} usa {', '.join(js_only)} (so JS): "
+                                     f"nao verificada sem o node")
+        if error:
+            return None, ('error', f"regex invalida {pattern!r}: {error}")
+        return regex, None
+
+    def validate(self, form_schema):
+        """[(severidade, caminho, mensagem)] de um formSchema"""
+        problems = []
+        path = 'formSchema'
+        if not isinstance(form_schema, dict):
+            return [('error', path, f"{type(form_schema).__name__} em vez de objeto")]
+
+        citizen = self._check_citizen_fields(path, form_schema.get('citizenFields'), problems)
+        if 'properties' in form_schema or form_schema.get('type') == 'object':
+            self.schema.check(path, form_schema, problems, ignore=('fields',))
+            if 'fields' in form_schema:
+                problems.append(('warning', path, "mistura 'fields' (legado) com 'properties'"))
+            self._check_unified(path, form_schema, citizen, problems)
+        elif 'fields' in form_schema or 'citizenFields' in form_schema:
+            self._check_legacy(path, form_schema, problems)
+        else:
+            problems.append(('error', path, "sem 'properties' nem 'fields'"))
+        return problems
+
+    def _check_citizen_fields(self, path, citizen_fields, problems):
+        """Nomes de property dos citizenFields válidos"""
+        names = set()
+        if citizen_fields is None:
+            return names
+        if not isinstance(citizen_fields, list):
+            problems.append(('error', f'{path}.citizenFields', 'deve ser uma lista'))
+            return names
+        seen = set()
+        for i, name in enumerate(citizen_fields):
+            item_path = f'{path}.citizenFields[{i}]'
+            if name not in self.citizen_mapping:
+                problems.append(('error', item_path, f"citizenField desconhecido {name!r}"))
+                continue
+            if name in seen:
+                problems.append(('warning', item_path, f"'{name}' repetido"))
+            seen.add(name)
+            names.add(self.citizen_mapping[name])
+        return names
+
+    def _check_range(self, path, obj, problems):
+        for low, high in _RANGES:
+            if _is_number(obj.get(low)) and _is_number(obj.get(high)) and obj[low] > obj[high]:
+                problems.append(('error', path, f"{low} ({obj[low]}) maior que {high} ({obj[high]})"))
+        for name in _COUNTS:
+            if _is_number(obj.get(name)) and obj[name] < 0:
+                problems.append(('error', f'{path}.{name}', 'negativo'))
+
+    def _check_default(self, path, value, regex, max_length, choices, problems):
+        """Default de um campo contra opções, pattern e maxLength"""
+        if choices is not None and value not in choices:
+            problems.append(('error', path, f"default {value!r} fora das opcoes"))
+        if not isinstance(value, str):
+            return
+        if regex is not None and not regex.search(value):
+            problems.append(('warning', path, f"default {value!r} nao casa com o pattern"))
+        if _is_number(max_length) and len(value) > max_length:
+            problems.append(('warning', path, f"default maior que maxLength ({max_length})"))
+
+    def _check_pattern(self, path, obj, problems):
+        """Regex compilada do pattern do campo (ou None)"""
+        pattern = obj.get('pattern')
+        if pattern is None:
+            return None
+        if not isinstance(pattern, str):
+            problems.append(('error', f'{path}.pattern', 'deve ser string'))
+            return None
+        regex, problem = self.compile_pattern(pattern)
+        if problem:
+            problems.append((problem[0], f'{path}.pattern', problem[1]))
+        return regex
+
+    def _check_property(self, path, prop, problems):
+        if not isinstance(prop, dict):
+            problems.append(('error', path, 'property deve ser um objeto'))
+            return
+        self.property.check(path, prop, problems)
+        self._check_range(path, prop, problems)
+        regex = self._check_pattern(path, prop, problems)
+
+        enum = prop.get('enum')
+        if isinstance(enum, list):
+            if not enum:
+                problems.append(('error', f'{path}.enum', 'vazio'))
+            if len(set(map(str, enum))) != len(enum):
+                problems.append(('warning', f'{path}.enum', 'valores repetidos'))
+            names = prop.get('enumNames')
+            if isinstance(names, list) and len(names) != len(enum):
+                problems.append(('error', f'{path}.enumNames', f"{len(names)} nomes para {len(enum)} valores"))
+        if 'default' in prop:
+            self._check_default(f'{path}.default', prop['default'], regex, prop.get('maxLength'),
+                                enum if isinstance(enum, list) else None, problems)
+
+        if isinstance(prop.get('items'), dict):
+            self._check_property(f'{path}.items', prop['items'], problems)
+        if isinstance(prop.get('properties'), dict):
+            for name, child in prop['properties'].items():
+                self._check_property(f'{path}.properties.{name}', child, problems)
+
+    def _check_unified(self, path, form_schema, citizen, problems):
+        properties = form_schema.get('properties')
+        if not isinstance(properties, dict):
+            return
+        for name, prop in properties.items():
+            prop_path = f'{path}.properties.{name}'
+            if name in citizen:
+                problems.append(('warning', prop_path, 'mesmo nome de um campo do cidadao em citizenFields'))
+            self._check_property(prop_path, prop, problems)
+
+        required = form_schema.get('required')
+        if isinstance(required, list):
+            seen = set()
+            for i, name in enumerate(required):
+                item_path = f'{path}.required[{i}]'
+                if name in seen:
+                    problems.append(('warning', item_path, f"'{name}' repetido"))
+                elif name not in properties and name not in citizen:
+                    problems.append(('error', item_path, f"'{name}' nao esta em properties nem em citizenFields"))
+                seen.add(name)
+
+    def _check_legacy(self, path, form_schema, problems):
+        fields = form_schema.get('fields', [])
+        if not isinstance(fields, list):
+            problems.append(('error', f'{path}.fields', 'deve ser uma lista'))
+            return
+        ids = {}
+        for i, item in enumerate(fields):
+            item_path = f'{path}.fields[{i}]'
+            if not isinstance(item, dict):
+                problems.append(('error', item_path, 'field deve ser um objeto'))
+                continue
+            field_id = item.get('id')
+            if not isinstance(field_id, str) or not field_id:
+                problems.append(('error', item_path, 'field sem id'))
+            else:
+                item_path = f'{path}.fields[{i}:{field_id}]'
+                if field_id in ids:
+                    problems.append(('error', item_path, f"id repetido (primeiro em fields[{ids[field_id]}])"))
+                else:
+                    ids[field_id] = i
+                if field_id in self.citizen_properties:
+                    # O converter grava properties[id] por cima do campo do cidadão
+                    problems.append(('error', item_path, f"id '{field_id}' colide com um campo do cidadao"))
+            if not isinstance(item.get('label'), str):
+                problems.append(('error', item_path, 'field sem label'))
+            field_type = item.get('type')
+            if field_type not in LEGACY_FIELD_TYPES:
+                problems.append(('warning', item_path, f"type {field_type!r} nao tratado pelo schema-converter"))
+            if 'required' in item and not isinstance(item['required'], bool):
+                problems.append(('error', f'{item_path}.required', 'deve ser booleano'))
+
+            self._check_range(item_path, item, problems)
+            regex = self._check_pattern(item_path, item, problems)
+
+            options = item.get('options')
+            choices = None
+            if field_type == 'select' and 'enumSource' not in item:
+                if not isinstance(options, list) or not options:
+                    problems.append(('error', item_path, 'select sem options'))
+                else:
+                    choices = [o.get('value') if isinstance(o, dict) else o for o in options]
+                    if len(set(map(str, choices))) != len(choices):
+                        problems.append(('warning', f'{item_path}.options', 'opcoes repetidas'))
+            for key in ('defaultValue', 'default'):
+                if key in item:
+                    self._check_default(f'{item_path}.{key}', item[key], regex, item.get('maxLength'),
+                                        choices, problems)
+
+        for i, item in enumerate(fields):
+            condition = item.get('visibleWhen') if isinstance(item, dict) else None
+            if isinstance(condition, dict):
+                target = condition.get('field')
+                if isinstance(target, str) and target not in ids:
+                    problems.append(('warning', f'{path}.fields[{i}].visibleWhen',
+                                     f"campo '{target}' nao existe no formulario"))
+
+
+def collect_patterns(value, patterns):
+    """Acrescenta a `patterns` os `pattern` (string) de um formSchema, em qualquer nível"""
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if key == 'pattern' and isinstance(item, str):
+                patterns.add(item)
+            else:
+                collect_patterns(item, patterns)
+    elif isinstance(value, list):
+        for item in value:
+            collect_patterns(item, patterns)
+
+
+def schema_digest(form_schema):
+    return hashlib.sha1(json.dumps(form_schema, ensure_ascii=False, separators=(',', ':')).encode('utf-8')).hexdigest()
+
+
+def _load_cache(cache_path, signature):
+    try:
+        with open(cache_path, 'rb') as f:
+            data = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return {}
+    if (not isinstance(data, dict) or data.get('version') != FORM_SCHEMA_CACHE_VERSION
+            or data.get('rules') != signature):
+        return {}
+    return data['results']
+
+
+def _save_cache(cache_path, signature, results):
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        marshal.dump({'version': FORM_SCHEMA_CACHE_VERSION, 'rules': signature, 'results': results}, f)
+    os.replace(tmp_path, cache_path)
+
+
+@dataclass
+class ValidationReport:
+    schemas: int = 0
+    validated: int = 0
+    cached: int = 0
+    # (departamento, arquivo, linha, nome do serviço, severidade, caminho, mensagem)
+    problems: list = field(default_factory=list)
+
+    @property
+    def errors(self):
+        return sum(1 for problem in self.problems if problem[4] == 'error')
+
+
+def validate_catalog(services, rules=None, use_cache=None, cache_dir=None):
+    """
+    Valida os formSchema de [(departamento, arquivo, linha, definição)]
+    (ver near_dupes.collect_services) em uma passada, com cache por hash.
+    """
+    rules = rules or FormSchemaRules.load()
+    if use_cache is None:
+        use_cache = seed_cache.is_enabled()
+    cache_path = os.path.join(cache_dir or CACHE_DIR, FORM_SCHEMA_CACHE_FILE)
+    known = _load_cache(cache_path, rules.signature) if use_cache else {}
+
+    report = ValidationReport()
+    results = {}
+    with profiling.phase('validate_forms'):
+        # formSchema: null nos serviços SEM_DADOS
+        schemas = [(entry, schema_digest(entry[3]['formSchema']))
+                   for entry in services if entry[3].get('formSchema') is not None]
+
+        # Pattern dos formSchema fora do cache, validados no node de uma vez
+        patterns = set()
+        for (_department, _file, _line, definition), digest in schemas:
+            if digest not in known:
+                collect_patterns(definition['formSchema'], patterns)
+        rules.prepare_patterns(patterns)
+
+        for (department, file, line, definition), digest in schemas:
+            report.schemas += 1
+            problems = results.get(digest)
+            if problems is None:
+                problems = known.get(digest)
+                if problems is None:
+                    problems = [tuple(p) for p in rules.validate(definition['formSchema'])]
+                    report.validated += 1
+                else:
+                    report.cached += 1
+                results[digest] = problems
+            else:
+                report.cached += 1
+            for severity, path, message in problems:
+                report.problems.append((department.code, file, line, definition.get('name'), severity, path, message))
+    profiling.count('form_schemas_validated', report.validated)
+
+    # Só os formSchema atuais ficam no cache
+    if use_cache and results != known:
+        _save_cache(cache_path, rules.signature, results)
+    return report
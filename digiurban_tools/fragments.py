@@ -0,0 +1,307 @@
+"""
+Fragmentos de formSchema compartilhados entre os seeds (shared-fragments.ts)
+
+Cada objeto/array dentro do formSchema de cada serviço é avaliado e
+identificado pelo sha1 do JSON do valor (a formatação no .ts não conta).
+Os que se repetem pelo menos `min_count` vezes no catálogo, com pelo
+menos `min_bytes`, viram `export const NOME = ...;` em
+prisma/seeds/services/shared-fragments.ts e cada ocorrência no seed passa
+a ser só o nome da constante, importado do módulo.
+
+A escolha vai do maior fragmento para o menor: o que fica dentro de um
+trecho já substituído não conta mais, então um formSchema inteiro
+repetido vira uma constante só, e não uma por campo. Fragmentos já
+existentes no shared-fragments.ts são mantidos (nomes estáveis entre
+execuções) e reaproveitados sempre que o conteúdo bate, mesmo abaixo do
+limiar.
+
+fragment_constants() devolve os valores das constantes para o avaliador
+de literais, para que catálogo, near-dupes, fields etc. continuem lendo
+os seeds depois da substituição.
+"""
+
+import bisect
+import hashlib
+import json
+import os
+import re
+import unicodedata
+from dataclasses import dataclass, field
+
+from digiurban_tools.seed_lexer import _line_starts, _match_brackets, tokenize, unquote
+from digiurban_tools.ts_literal import LiteralError, evaluate
+
+SHARED_FRAGMENTS_FILE = 'shared-fragments.ts'
+SHARED_FRAGMENTS_MODULE = './shared-fragments'
+
+DEFAULT_MIN_COUNT = 3
+DEFAULT_MIN_BYTES = 60
+
+_IMPORT_RE = re.compile(r"^import\b[^;]*;[ \t]*\n", re.M)
+_FRAGMENT_IMPORT_RE = re.compile(r"^import\s*\{([^}]*)\}\s*from\s*'\./shared-fragments';[ \t]*\n", re.M)
+_IMPORT_LINE_LIMIT = 100
+
+SHARED_FRAGMENTS_HEADER = '''/**
+ * FRAGMENTOS COMPARTILHADOS DOS SEEDS DE SERVIÇOS
+ * Gerado por `digiurban-tools hoist-fragments`: trechos de formSchema que
+ * se repetem nos seeds. Não editar à mão; rode o comando de novo depois de
+ * alterar os seeds.
+ */
+'''
+
+
+class FragmentError(ValueError):
+    """shared-fragments.ts com conteúdo que não é `export const NOME = literal;`"""
+
+
+@dataclass
+class Fragment:
+    name: str
+    # Literal na coluna 0, como fica no shared-fragments.ts
+    text: str
+    value: object
+    digest: str
+    existing: bool = False
+    # Ocorrências substituídas nesta execução
+    uses: int = 0
+
+
+@dataclass
+class Node:
+    """Objeto/array dentro de um formSchema"""
+    file: str
+    start: int
+    end: int
+    line: int
+    key: str | None
+    text: str
+    value: object
+    digest: str
+    size: int
+
+
+@dataclass
+class HoistPlan:
+    fragments: list
+    # arquivo -> [(início, fim, nome)] em ordem
+    replacements: dict = field(default_factory=dict)
+
+    @property
+    def new_fragments(self):
+        return [f for f in self.fragments if not f.existing]
+
+
+def value_digest(value):
+    return hashlib.sha1(json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')).hexdigest()
+
+
+def _dedent(text, indent):
+    lines = text.split('\n')
+    return '\n'.join([lines[0]] + [
+        line[len(indent):] if line.startswith(indent) else line.lstrip()
+        for line in lines[1:]
+    ])
+
+
+def parse_fragments(text):
+    """{nome: Fragment} de um shared-fragments.ts, na ordem do arquivo"""
+    tokens = tokenize(text)
+    pairs = _match_brackets(text, tokens)
+    line_starts = _line_starts(text)
+    fragments = {}
+    i = 0
+    while i < len(tokens):
+        words = [text[t[1]:t[2]] for t in tokens[i:i + 4]]
+        if words[:2] == ['export', 'const'] and len(words) == 4 and words[3] == '=' and i + 4 in pairs:
+            name = words[2]
+            close = pairs[i + 4]
+            literal = text[tokens[i + 4][1]:tokens[close][2]]
+            line = bisect.bisect_right(line_starts, tokens[i][1])
+            try:
+                value = evaluate(literal, line)
+            except LiteralError as e:
+                raise FragmentError(f"{SHARED_FRAGMENTS_FILE}: '{name}': {e}") from e
+            fragments[name] = Fragment(name, literal, value, value_digest(value), existing=True)
+            i = close + 1
+            continue
+        if words[:1] == ['export']:
+            line = bisect.bisect_right(line_starts, tokens[i][1])
+            raise FragmentError(f"{SHARED_FRAGMENTS_FILE}:{line}: esperado 'export const NOME = literal;'")
+        i += 1
+    return fragments
+
+
+_read_memo = {}
+
+
+def read_fragments(path):
+    """Fragmentos de um shared-fragments.ts ({} se não existir), memoizado por tamanho/mtime"""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return {}, None
+    key = os.path.abspath(path)
+    memo = _read_memo.get(key)
+    if memo is not None and memo[0] == (st.st_size, st.st_mtime_ns):
+        return memo[1], memo[2]
+    with open(path, 'rb') as f:
+        raw = f.read()
+    fragments = parse_fragments(raw.decode('utf-8'))
+    digest = hashlib.sha1(raw).hexdigest()
+    _read_memo[key] = ((st.st_size, st.st_mtime_ns), fragments, digest)
+    return fragments, digest
+
+
+def fragment_constants(seeds_dir):
+    """({nome: valor}, sha1 do arquivo ou None) dos fragmentos de um diretório de seeds"""
+    fragments, digest = read_fragments(os.path.join(seeds_dir, SHARED_FRAGMENTS_FILE))
+    return {name: f.value for name, f in fragments.items()}, digest
+
+
+def _form_schema_opener(text, tokens, pairs):
+    """Índice do token que abre o valor de formSchema no nível superior do serviço"""
+    i = 1
+    last = len(tokens) - 1
+    while i < last:
+        kind, start, end = tokens[i]
+        if i in pairs:
+            i = pairs[i] + 1
+            continue
+        if (kind in ('ident', 'string') and i + 2 < last
+                and text[tokens[i + 1][1]:tokens[i + 1][2]] == ':'
+                and (text[start:end] if kind == 'ident' else unquote(text[start:end])) == 'formSchema'):
+            return i + 2 if i + 2 in pairs else None
+        i += 1
+    return None
+
+
+def form_schema_nodes(file, index):
+    """Node de cada objeto/array literal dentro dos formSchema de um seed"""
+    nodes = []
+    line_starts = _line_starts(index.text)
+    for service in index.services():
+        text = index.service_text(service)
+        tokens = tokenize(text)
+        pairs = _match_brackets(text, tokens)
+        root = _form_schema_opener(text, tokens, pairs)
+        if root is None:
+            continue
+        for j in range(root, pairs[root] + 1):
+            if j not in pairs:
+                continue
+            start = service.start + tokens[j][1]
+            end = service.start + tokens[pairs[j]][2]
+            literal = index.text[start:end]
+            try:
+                # Sem constantes: trechos que já usam fragmentos ficam como estão
+                value = evaluate(literal)
+            except LiteralError:
+                continue
+            key = None
+            if j >= 2 and text[tokens[j - 1][1]:tokens[j - 1][2]] == ':':
+                kind, key_start, key_end = tokens[j - 2]
+                key = text[key_start:key_end] if kind == 'ident' else unquote(text[key_start:key_end])
+            line = bisect.bisect_right(line_starts, start)
+            indent = index.text[line_starts[line - 1]:start]
+            indent = indent[:len(indent) - len(indent.lstrip())]
+            nodes.append(Node(file, start, end, line, key, _dedent(literal, indent), value,
+                              value_digest(value), len(literal.encode('utf-8'))))
+    return nodes
+
+
+def _constant_name(node):
+    value = node.value
+    if isinstance(value, dict) and isinstance(value.get('id'), str):
+        base = 'FIELD_' + value['id']
+    elif node.key:
+        base = node.key
+    else:
+        base = 'FRAGMENT'
+    base = unicodedata.normalize('NFKD', base).encode('ascii', 'ignore').decode('ascii')
+    base = re.sub(r'(?<=[a-z0-9])(?=[A-Z])', '_', base)
+    base = re.sub(r'\W+', '_', base).strip('_').upper() or 'FRAGMENT'
+    return base if not base[0].isdigit() else 'F_' + base
+
+
+def _covered(spans, node):
+    """O nó está dentro de um trecho já escolhido (spans: [(início, fim)] ordenados, disjuntos)"""
+    i = bisect.bisect_right(spans, (node.start, float('inf'))) - 1
+    return i >= 0 and spans[i][1] >= node.end
+
+
+def plan_hoist(nodes, existing, min_count=DEFAULT_MIN_COUNT, min_bytes=DEFAULT_MIN_BYTES):
+    """HoistPlan para os nós (na ordem do catálogo) dados os fragmentos existentes"""
+    groups = {}
+    for node in nodes:
+        groups.setdefault(node.digest, []).append(node)
+    by_digest = {f.digest: f for f in existing.values()}
+    used_names = set(existing)
+
+    position = {id(node): i for i, node in enumerate(nodes)}
+    order = sorted(groups, key=lambda digest: -groups[digest][0].size)
+    spans = {}
+    new = []
+    plan = HoistPlan(list(existing.values()))
+    for digest in order:
+        group = [node for node in groups[digest] if not _covered(spans.get(node.file, ()), node)]
+        if not group:
+            continue
+        fragment = by_digest.get(digest)
+        if fragment is None:
+            if len(group) < min_count or group[0].size < min_bytes:
+                continue
+            name = base = _constant_name(group[0])
+            suffix = 2
+            while name in used_names:
+                name = f'{base}_{suffix}'
+                suffix += 1
+            used_names.add(name)
+            fragment = Fragment(name, group[0].text, group[0].value, digest)
+            by_digest[digest] = fragment
+            new.append((position[id(group[0])], fragment))
+        for node in group:
+            bisect.insort(spans.setdefault(node.file, []), (node.start, node.end))
+            plan.replacements.setdefault(node.file, []).append((node.start, node.end, fragment.name))
+            fragment.uses += 1
+
+    # Novos fragmentos na ordem da primeira ocorrência no catálogo
+    plan.fragments.extend(fragment for _position, fragment in sorted(new, key=lambda item: item[0]))
+    for replacements in plan.replacements.values():
+        replacements.sort()
+    return plan
+
+
+def _import_statement(names):
+    line = f"import {{ {', '.join(names)} }} from '{SHARED_FRAGMENTS_MODULE}';\n"
+    if len(line) <= _IMPORT_LINE_LIMIT:
+        return line
+    return 'import {\n' + ''.join(f'  {name},\n' for name in names) + f"}} from '{SHARED_FRAGMENTS_MODULE}';\n"
+
+
+def rewrite_seed(text, replacements):
+    """Texto do seed com os trechos trocados pelos nomes e o import ajustado"""
+    parts = []
+    pos = 0
+    for start, end, name in replacements:
+        parts.append(text[pos:start])
+        parts.append(name)
+        pos = end
+    parts.append(text[pos:])
+    content = ''.join(parts)
+
+    names = {name for _start, _end, name in replacements}
+    current = _FRAGMENT_IMPORT_RE.search(content)
+    if current is not None:
+        names.update(n.strip() for n in current.group(1).split(',') if n.strip())
+        return content[:current.start()] + _import_statement(sorted(names)) + content[current.end():]
+    if not names:
+        return content
+    imports = list(_IMPORT_RE.finditer(content))
+    offset = imports[-1].end() if imports else 0
+    return content[:offset] + _import_statement(sorted(names)) + content[offset:]
+
+
+def render_fragments(fragments):
+    """Conteúdo do shared-fragments.ts"""
+    body = '\n'.join(f'export const {f.name} = {f.text};\n' for f in fragments)
+    return SHARED_FRAGMENTS_HEADER + '\n' + body
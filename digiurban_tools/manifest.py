@@ -0,0 +1,79 @@
+"""
+Manifesto de conteúdo por seção para merges incrementais
+
+Guarda, para cada seção da fonte, o hash do texto da seção, o hash de cada
+serviço e o sha1 do arquivo de seed de destino após o último merge. Uma
+seção só precisa ser reprocessada quando o hash da fonte ou o arquivo de
+destino mudou desde então.
+"""
+
+import hashlib
+import json
+import os
+
+from digiurban_tools import seed_cache
+from digiurban_tools.catalog_diff import content_hash
+
+MANIFEST_VERSION = 1
+
+DEFAULT_MANIFEST = os.path.join(seed_cache.CACHE_DIR, 'merge-manifest.json')
+
+
+def text_hash(text):
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def file_hash(filepath):
+    try:
+        with open(filepath, 'rb') as f:
+            return hashlib.sha1(f.read()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def service_hashes(services):
+    """{nome: hash do conteúdo} para dicts com 'name' e 'code'"""
+    return {s['name']: content_hash(s['code']) for s in services}
+
+
+def load_manifest(path=DEFAULT_MANIFEST, source=None):
+    """Manifesto salvo, ou vazio se não existir, for de outra versão ou de outra fonte"""
+    empty = {'version': MANIFEST_VERSION, 'source': source, 'sections': {}}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return empty
+    if data.get('version') != MANIFEST_VERSION:
+        return empty
+    if source is not None and data.get('source') != source:
+        return empty
+    return data
+
+
+def save_manifest(manifest, path=DEFAULT_MANIFEST):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+        f.write('\n')
+    os.replace(tmp_path, path)
+
+
+def section_unchanged(manifest, section_name, source_hash, target_path):
+    """True se a seção e o arquivo de destino estão como no último merge"""
+    entry = manifest['sections'].get(section_name)
+    return (
+        entry is not None
+        and entry.get('source_hash') == source_hash
+        and entry.get('target_sha1') == file_hash(target_path)
+    )
+
+
+def service_changes(entry, current):
+    """(adicionados, removidos, alterados) entre os hashes salvos e os atuais"""
+    previous = (entry or {}).get('services', {})
+    added = [name for name in current if name not in previous]
+    removed = [name for name in previous if name not in current]
+    changed = [name for name, h in current.items() if name in previous and previous[name] != h]
+    return added, removed, changed
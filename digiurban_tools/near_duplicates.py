@@ -0,0 +1,239 @@
+"""
+Detecção de serviços quase duplicados (MinHash + LSH)
+
+Cada serviço vira um conjunto de shingles:
+
+- n:  palavras (e pares de palavras) do nome normalizado
+- d:  pares de palavras da descrição normalizada
+- f:  ids dos campos do formSchema (citizenFields, fields[].id e chaves
+      de properties)
+
+A assinatura MinHash usa one-permutation hashing: cada shingle é hasheado
+uma vez (blake2b de 64 bits, memoizado, já que os ids de campo se repetem
+em quase todos os serviços), o hash escolhe um dos NUM_PERM compartimentos
+e fica o menor valor de cada um; compartimentos vazios são preenchidos
+pela densificação por rotação. Assim o custo é linear no número de
+shingles, e não NUM_PERM vezes isso como no MinHash clássico.
+
+As assinaturas são divididas em faixas (LSH); só serviços que caem no
+mesmo balde em alguma faixa viram candidatos (em baldes grandes, só
+contra o primeiro membro), e cada candidato é confirmado pelo Jaccard
+exato dos conjuntos. Conjuntos idênticos são agrupados antes (por hash),
+então cópias exatas não geram pares quadráticos. Os pares confirmados
+são unidos em clusters (union-find).
+"""
+
+import hashlib
+import re
+from dataclasses import dataclass, field
+
+from digiurban_tools import profiling
+from digiurban_tools.catalog_diff import normalize_name
+
+NUM_PERM = 128
+DEFAULT_THRESHOLD = 0.6
+
+_WORD_RE = re.compile(r'\w+')
+_MAX_HASH = (1 << 64) - 1
+# Baldes maiores que isto comparam cada membro só com o primeiro (evita pares quadráticos)
+_SMALL_BUCKET = 16
+
+
+@dataclass
+class Cluster:
+    # Índices dos itens, em ordem
+    members: list
+    # Menor Jaccard exato entre os pares que ligaram o cluster
+    min_similarity: float
+    departments: list = field(default_factory=list)
+
+    @property
+    def cross_department(self):
+        return len(self.departments) > 1
+
+
+def _words(text):
+    return _WORD_RE.findall(normalize_name(text)) if text else []
+
+
+def form_field_ids(form_schema):
+    """Ids de campo do formSchema (citizenFields, fields[].id e properties), na ordem"""
+    if not isinstance(form_schema, dict):
+        return []
+    ids = [f for f in form_schema.get('citizenFields') or () if isinstance(f, str)]
+    ids.extend(f['id'] for f in form_schema.get('fields') or ()
+               if isinstance(f, dict) and isinstance(f.get('id'), str))
+    properties = form_schema.get('properties')
+    if isinstance(properties, dict):
+        ids.extend(properties)
+    return ids
+
+
+def shingles(definition):
+    """Conjunto de shingles de um serviço (dict da definição)"""
+    result = set()
+    name_words = _words(str(definition.get('name') or ''))
+    result.update('n:' + word for word in name_words)
+    result.update(f'n:{a} {b}' for a, b in zip(name_words, name_words[1:]))
+
+    description_words = _words(str(definition.get('description') or ''))
+    if len(description_words) == 1:
+        result.add('d:' + description_words[0])
+    result.update(f'd:{a} {b}' for a, b in zip(description_words, description_words[1:]))
+
+    result.update('f:' + field_id for field_id in form_field_ids(definition.get('formSchema')))
+    return result
+
+
+def jaccard(a, b):
+    if not a and not b:
+        return 1.0
+    common = len(a & b)
+    return common / (len(a) + len(b) - common)
+
+
+class MinHasher:
+    """Assinaturas por one-permutation hashing com densificação"""
+
+    def __init__(self, num_perm=NUM_PERM):
+        self.num_perm = num_perm
+        self._hashes = {}
+
+    def _hash(self, shingle):
+        value = self._hashes.get(shingle)
+        if value is None:
+            value = int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'big')
+            self._hashes[shingle] = value
+        return value
+
+    def signature(self, shingle_set):
+        k = self.num_perm
+        bins = [None] * k
+        for shingle in shingle_set:
+            h = self._hash(shingle)
+            slot = h % k
+            value = h // k
+            current = bins[slot]
+            if current is None or value < current:
+                bins[slot] = value
+        if not shingle_set:
+            return tuple([_MAX_HASH] * k)
+
+        # Densificação por rotação: compartimento vazio herda o próximo
+        # preenchido (circular), deslocado pela distância
+        offset = (_MAX_HASH // k) + 1
+        filled = [i for i in range(k) if bins[i] is not None]
+        if len(filled) < k:
+            result = list(bins)
+            next_filled = filled[0] + k
+            for i in range(k - 1, -1, -1):
+                if bins[i] is not None:
+                    next_filled = i
+                else:
+                    source = next_filled % k
+                    result[i] = bins[source] + (next_filled - i) * offset
+            bins = result
+        return tuple(bins)
+
+
+def lsh_parameters(threshold, num_perm=NUM_PERM):
+    """(faixas, linhas) com limiar (1/b)^(1/r) mais próximo, sem passar de threshold"""
+    best = None
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        estimate = (1 / bands) ** (1 / rows)
+        if estimate <= threshold and (best is None or estimate > best[0]):
+            best = (estimate, bands, rows)
+    if best is None:
+        return num_perm, 1
+    return best[1], best[2]
+
+
+def _bucket_pairs(bucket):
+    """Pares a confirmar em um balde: todos se pequeno, senão cada um contra o primeiro"""
+    if len(bucket) <= _SMALL_BUCKET:
+        return [(a, b) for i, a in enumerate(bucket) for b in bucket[i + 1:]]
+    return [(bucket[0], other) for other in bucket[1:]]
+
+
+def _find(parent, i):
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def find_clusters(items, threshold=DEFAULT_THRESHOLD, num_perm=NUM_PERM, bands=None):
+    """
+    Clusters de itens quase duplicados. items: lista de (shingles, departamento).
+    Retorna os clusters com 2+ membros, do maior para o menor.
+    """
+    with profiling.phase('minhash'):
+        # Conjuntos idênticos viram um único representante
+        groups = {}
+        for i, (shingle_set, _department) in enumerate(items):
+            groups.setdefault(frozenset(shingle_set), []).append(i)
+        representatives = list(groups.items())
+
+        hasher = MinHasher(num_perm)
+        signatures = [hasher.signature(shingle_set) for shingle_set, _members in representatives]
+    profiling.count('services_hashed', len(items))
+
+    if bands is None:
+        bands, rows = lsh_parameters(threshold, num_perm)
+    else:
+        rows = num_perm // bands
+
+    parent = list(range(len(items)))
+    similarity = {}
+
+    def union(a, b, value):
+        ra, rb = _find(parent, a), _find(parent, b)
+        if ra != rb:
+            parent[rb] = ra
+            similarity[ra] = min(similarity.get(ra, 1.0), similarity.pop(rb, 1.0), value)
+        else:
+            similarity[ra] = min(similarity.get(ra, 1.0), value)
+
+    for _shingle_set, members in representatives:
+        for other in members[1:]:
+            union(members[0], other, 1.0)
+
+    with profiling.phase('lsh'):
+        checked = set()
+        for band in range(bands):
+            start = band * rows
+            buckets = {}
+            for r, signature in enumerate(signatures):
+                buckets.setdefault(signature[start:start + rows], []).append(r)
+            for bucket in buckets.values():
+                if len(bucket) < 2:
+                    continue
+                for pair in _bucket_pairs(bucket):
+                    if pair in checked:
+                        continue
+                    checked.add(pair)
+                    a, b = pair
+                    first, second = representatives[a][1][0], representatives[b][1][0]
+                    if _find(parent, first) == _find(parent, second):
+                        # Já ligados por outro caminho: não precisa do Jaccard
+                        continue
+                    value = jaccard(representatives[a][0], representatives[b][0])
+                    if value >= threshold:
+                        union(first, second, value)
+    profiling.count('lsh_candidates', len(checked))
+
+    clusters = {}
+    for i in range(len(items)):
+        clusters.setdefault(_find(parent, i), []).append(i)
+
+    result = []
+    for root, members in clusters.items():
+        if len(members) < 2:
+            continue
+        departments = sorted({items[i][1] for i in members})
+        result.append(Cluster(members, similarity.get(root, 1.0), departments))
+    result.sort(key=lambda c: (-len(c.members), c.members[0]))
+    return result
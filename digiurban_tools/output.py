@@ -0,0 +1,151 @@
+"""
+Camada de saída dos arquivos gerados (seeds, index.ts, schema)
+
+- write(): conteúdo completo de um arquivo
+- insert()/replace(): trechos sobre o conteúdo original, acumulados e
+  aplicados de uma vez no flush()
+
+No flush() cada arquivo é comparado byte a byte com o que está em disco e
+só é gravado se mudou, via arquivo temporário + os.replace (um leitor
+nunca vê o arquivo pela metade, e o nodemon/tsc só recarrega quando há
+mudança real). Os arquivos são sempre gravados em utf-8 com LF, como
+definido no .gitattributes para *.ts.
+"""
+
+import os
+import shutil
+from dataclasses import dataclass
+
+from digiurban_tools import profiling
+
+
+@dataclass
+class WriteStats:
+    files_written: int = 0
+    files_unchanged: int = 0
+    bytes_written: int = 0
+
+    def merge(self, other):
+        self.files_written += other.files_written
+        self.files_unchanged += other.files_unchanged
+        self.bytes_written += other.bytes_written
+        return self
+
+    def summary(self):
+        return (
+            f"Arquivos gravados: {self.files_written} ({self.bytes_written} bytes), "
+            f"inalterados: {self.files_unchanged}"
+        )
+
+
+def atomic_write(filepath, data):
+    """Grava bytes via temporário no mesmo diretório + os.replace"""
+    directory = os.path.dirname(os.path.abspath(filepath))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = os.path.join(directory, f'.{os.path.basename(filepath)}.{os.getpid()}.tmp')
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        if os.path.exists(filepath):
+            shutil.copymode(filepath, tmp_path)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class OutputWriter:
+    """
+    Acumula as alterações por arquivo e grava tudo no flush().
+    on_write(caminho, conteúdo) é chamado no flush para cada arquivo,
+    gravado ou não (a sessão do CLI usa para atualizar o índice em memória).
+    """
+
+    def __init__(self, on_write=None):
+        self.on_write = on_write
+        self.stats = WriteStats()
+        self._contents = {}
+        self._originals = {}
+        self._splices = {}
+
+    def original(self, filepath):
+        """Conteúdo atual do arquivo em disco (lido uma única vez)"""
+        key = os.path.abspath(filepath)
+        if key not in self._originals:
+            with profiling.phase('read'), open(filepath, 'r', encoding='utf-8', newline='') as f:
+                self._originals[key] = f.read()
+            profiling.count('bytes_read', len(self._originals[key]))
+        return self._originals[key]
+
+    def write(self, filepath, content):
+        key = os.path.abspath(filepath)
+        if key in self._splices:
+            raise ValueError(f'{filepath}: write() e insert()/replace() no mesmo arquivo')
+        self._contents[key] = content
+
+    def replace(self, filepath, start, end, text):
+        """Substitui original[start:end] por text"""
+        key = os.path.abspath(filepath)
+        if key in self._contents:
+            raise ValueError(f'{filepath}: write() e insert()/replace() no mesmo arquivo')
+        self.original(filepath)
+        self._splices.setdefault(key, []).append((start, end, text))
+
+    def insert(self, filepath, offset, text):
+        self.replace(filepath, offset, offset, text)
+
+    def has_insert(self, filepath, offset):
+        splices = self._splices.get(os.path.abspath(filepath), ())
+        return any(start == offset == end for start, end, _text in splices)
+
+    def _apply_splices(self, key):
+        original = self._originals[key]
+        # sort estável: inserções no mesmo ponto ficam na ordem de registro
+        splices = sorted(self._splices[key], key=lambda s: (s[0], s[1]))
+        parts = []
+        pos = 0
+        for start, end, text in splices:
+            if start < pos:
+                raise ValueError(f'{key}: trechos sobrepostos em {start}')
+            parts.append(original[pos:start])
+            parts.append(text)
+            pos = end
+        parts.append(original[pos:])
+        return ''.join(parts)
+
+    def flush(self):
+        """Grava os arquivos que mudaram. Retorna as estatísticas acumuladas."""
+        with profiling.phase('write'):
+            return self._flush()
+
+    def _flush(self):
+        pending = dict(self._contents)
+        for key in self._splices:
+            pending[key] = self._apply_splices(key)
+
+        for key, content in pending.items():
+            data = content.encode('utf-8')
+            try:
+                with open(key, 'rb') as f:
+                    unchanged = f.read() == data
+            except FileNotFoundError:
+                unchanged = False
+
+            if unchanged:
+                self.stats.files_unchanged += 1
+                profiling.count('files_unchanged')
+            else:
+                atomic_write(key, data)
+                self.stats.files_written += 1
+                self.stats.bytes_written += len(data)
+                profiling.count('files_rewritten')
+                profiling.count('bytes_written', len(data))
+
+            if self.on_write is not None:
+                self.on_write(key, content)
+
+        self._contents.clear()
+        self._originals.clear()
+        self._splices.clear()
+        return self.stats
@@ -0,0 +1,64 @@
+"""
+Execução por departamento em um pool de processos, com saída determinística
+
+map_ordered() devolve os resultados na ordem das entradas. No modo
+paralelo o stdout de cada tarefa é capturado no worker e reimpresso pelo
+processo principal na mesma ordem, então a saída é idêntica à execução
+serial (--jobs 1). Com --profile, fases e contadores medidos nos workers
+são somados ao perfil do processo principal.
+"""
+
+import contextlib
+import io
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from digiurban_tools import profiling, seed_cache
+from digiurban_tools.arguments import add_jobs_argument  # noqa: F401 (reexportado)
+
+
+def resolve_jobs(jobs):
+    if jobs is None or jobs < 0:
+        return 1
+    if jobs == 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def _init_worker(cache_enabled, profile_enabled):
+    # Com spawn (Windows/macOS) o worker não herda o estado do processo pai
+    seed_cache.set_enabled(cache_enabled)
+    profiling.start_worker(profile_enabled)
+
+
+def _call_captured(payload):
+    func, args = payload
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        result = func(*args)
+    return result, buffer.getvalue(), profiling.take_snapshot()
+
+
+def map_ordered(func, arg_tuples, jobs=1):
+    """
+    Gera func(*args) para cada tupla de arg_tuples, na ordem de entrada.
+    func precisa ser uma função de nível de módulo (picklable).
+    """
+    arg_tuples = list(arg_tuples)
+    jobs = min(resolve_jobs(jobs), len(arg_tuples) or 1)
+
+    if jobs <= 1:
+        for args in arg_tuples:
+            yield func(*args)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_worker,
+        initargs=(seed_cache.is_enabled(), profiling.enabled()),
+    ) as pool:
+        for result, output, snapshot in pool.map(_call_captured, [(func, args) for args in arg_tuples]):
+            sys.stdout.write(output)
+            profiling.merge_snapshot(snapshot)
+            yield result
@@ -0,0 +1,29 @@
+"""
+Caminhos padrão do repositório, relativos a este pacote
+
+Substituem os caminhos absolutos (c:\\Projetos Cursor\\...) que os scripts
+antigos tinham fixos.
+"""
+
+import os
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BACKEND_DIR = os.path.join(REPO_ROOT, 'digiurban', 'backend')
+FRONTEND_DIR = os.path.join(REPO_ROOT, 'digiurban', 'frontend')
+SCHEMA_PRISMA = os.path.join(BACKEND_DIR, 'prisma', 'schema.prisma')
+SEEDS_DIR = os.path.join(BACKEND_DIR, 'prisma', 'seeds')
+SERVICES_SEEDS_DIR = os.path.join(SEEDS_DIR, 'services')
+# Arquivo consolidado de onde os seeds modulares são extraídos
+SOURCE_SERVICES_TS = os.path.join(SEEDS_DIR, 'services-simplified-complete.ts')
+SERVICE_TYPES_TS = os.path.join(SERVICES_SEEDS_DIR, 'types.ts')
+# JSONSchemaProperty / UnifiedFormSchema: formato dos formSchema
+SCHEMA_TYPES_TS = os.path.join(SERVICES_SEEDS_DIR, 'schema-types.ts')
+# OLD_TO_NEW_CITIZEN_FIELDS: vocabulário de citizenFields
+SCHEMA_CONVERTER_TS = os.path.join(SERVICES_SEEDS_DIR, 'schema-converter.ts')
+FRONTEND_APP_DIR = os.path.join(FRONTEND_DIR, 'app')
+API_ROUTES_DIR = os.path.join(FRONTEND_APP_DIR, 'api')
+# Regras de reescrita usadas pelos comandos fix-* (digiurban_tools/rules)
+RULES_DIR = os.path.join(REPO_ROOT, 'digiurban_tools', 'rules')
+
+# Cache de parse, manifesto, benchmarks e perfis (fora do controle de versão)
+CACHE_DIR = os.environ.get('DIGIURBAN_TOOLS_CACHE', os.path.join(REPO_ROOT, '.digiurban-cache'))
@@ -0,0 +1,300 @@
+"""
+Índice de blocos do schema.prisma
+
+Percorre o schema uma vez e registra cada bloco de nível superior
+(model, enum, type, view, generator, datasource) com:
+
+- offsets do bloco (da palavra-chave até a '}' que o fecha)
+- offsets para remoção: comentários colados acima do bloco e as linhas
+  em branco que o seguem
+- linhas de início e fim
+
+Strings e comentários são ignorados na contagem de chaves, então
+@default("{}") ou um '}' em comentário não fecham o bloco. Os offsets são
+posições no texto decodificado (str), como no seed_lexer.
+
+Nos models (e types/views) cada campo também é registrado, e na mesma
+passada é montado o grafo de referências: nome do tipo -> campos de
+outros blocos declarados com esse tipo (relações, listas de
+back-reference e campos enum). dangling() responde em O(grau) quais
+campos ficariam apontando para blocos removidos.
+
+remove() reconstrói o arquivo sem qualquer número de blocos e campos em
+uma única passada, fatiando o texto entre os trechos removidos.
+"""
+
+import bisect
+import os
+import re
+from dataclasses import dataclass, field
+
+from digiurban_tools import profiling
+from digiurban_tools.seed_lexer import _line_starts
+
+
+class PrismaSchemaError(ValueError):
+    """Bloco não fechado ou string não terminada no schema"""
+
+
+BLOCK_KINDS = ('model', 'enum', 'type', 'view', 'generator', 'datasource')
+
+_HEADER_RE = re.compile(r'(%s)[ \t]+(\w+)[ \t]*\{' % '|'.join(BLOCK_KINDS))
+
+# Dentro de um bloco só interessam chaves, strings e comentários
+_BODY_RE = re.compile(r'"(?:[^"\\\n]|\\.)*"|//[^\n]*|/\*.*?\*/|[{}"]', re.S)
+
+# Campo de model: nome, tipo, [] e ? (linhas de @@atributos e comentários não casam)
+_FIELD_RE = re.compile(r'^[ \t]+(\w+)[ \t]+(\w+)(\[\])?(\?)?[^\n]*\n?', re.M)
+_RELATION_NAME_RE = re.compile(r'@relation\(\s*(?:name:\s*)?"([^"]*)"')
+
+# Blocos que têm campos
+_FIELD_BLOCKS = ('model', 'type', 'view')
+
+# Comentário de seção (// ====...), que não pertence ao bloco logo abaixo
+_BANNER_RE = re.compile(r'//\s*[=\-#*]{3,}')
+
+
+@dataclass(slots=True)
+class SchemaField:
+    """Campo de um model: `nome Tipo[]? @atributos`"""
+    block: str
+    name: str
+    type: str
+    is_list: bool
+    optional: bool
+    relation: str | None
+    start: int
+    end: int
+    remove_start: int
+    line: int
+
+
+@dataclass(slots=True)
+class SchemaBlock:
+    kind: str
+    name: str
+    start: int
+    end: int
+    remove_start: int
+    remove_end: int
+    line: int
+    end_line: int
+    fields: list = field(default_factory=list)
+
+
+class SchemaIndex:
+    """Blocos do schema por tipo e nome"""
+
+    def __init__(self, text, blocks, line_starts, references):
+        self.text = text
+        self.blocks = blocks
+        self._by_key = {(block.kind, block.name): block for block in blocks}
+        self._line_starts = line_starts
+        self._references = references
+
+    def block(self, name, kind='model'):
+        return self._by_key.get((kind, name))
+
+    def model(self, name):
+        return self._by_key.get(('model', name))
+
+    def enum(self, name):
+        return self._by_key.get(('enum', name))
+
+    def names(self, kind='model'):
+        return [block.name for block in self.blocks if block.kind == kind]
+
+    def block_text(self, block):
+        return self.text[block.start:block.end]
+
+    def line_of(self, offset):
+        if self._line_starts is None:
+            self._line_starts = _line_starts(self.text)
+        return bisect.bisect_right(self._line_starts, offset)
+
+    def referencing(self, name):
+        """Campos de outros blocos cujo tipo é `name`"""
+        return [f for f in self._references.get(name, ()) if f.block != name]
+
+    def dangling(self, names):
+        """Campos que ficariam órfãos se os blocos `names` fossem removidos"""
+        names = set(names)
+        return [f for name in names for f in self.referencing(name) if f.block not in names]
+
+    def remove(self, blocks, fields=()):
+        """Texto do schema sem os blocos e campos informados (uma passada)"""
+        text = self.text
+        spans = sorted({(block.remove_start, block.remove_end) for block in blocks}
+                       | {(f.remove_start, f.end) for f in fields})
+        parts = []
+        pos = 0
+        for start, end in spans:
+            if start < pos:
+                # Campo dentro de um bloco também removido
+                pos = max(pos, end)
+                continue
+            parts.append(text[pos:start])
+            # Campo removido entre duas linhas em branco: não deixa linha em branco dupla
+            if text.endswith('\n\n', 0, start) and text.startswith('\n', end):
+                end += 1
+            pos = end
+        parts.append(text[pos:])
+        return ''.join(parts)
+
+
+def _block_end(text, pos, line_of):
+    """Posição após a '}' que fecha o bloco aberto antes de pos"""
+    depth = 1
+    search = _BODY_RE.search
+    while True:
+        m = search(text, pos)
+        if m is None:
+            break
+        token = m.group()
+        pos = m.end()
+        if token == '{':
+            depth += 1
+        elif token == '}':
+            depth -= 1
+            if depth == 0:
+                return pos
+        elif token == '"':
+            raise PrismaSchemaError(f'String nao fechada na linha {line_of(m.start())}')
+    raise PrismaSchemaError(f'Bloco aberto na linha {line_of(pos)} nao foi fechado')
+
+
+def _references(blocks):
+    references = {}
+    for block in blocks:
+        for f in block.fields:
+            references.setdefault(f.type, []).append(f)
+    return references
+
+
+def _parse_fields(text, block, body_start, body_end, line_starts, line_of):
+    for m in _FIELD_RE.finditer(text, body_start, body_end):
+        start = m.start()
+        line = line_of(start)
+        # Comentário acima do campo só sai junto se campo e comentário formam
+        # um grupo isolado (ex.: "// Relacionamentos" seguido de vários campos fica)
+        after = m.end()
+        next_end = text.find('\n', after, body_end)
+        next_line = text[after:body_end if next_end == -1 else next_end].strip()
+        remove_start = start
+        if not next_line:
+            remove_start = _attached_comment_start(text, line_starts, line)
+
+        relation = None
+        if '@relation' in m.group():
+            found = _RELATION_NAME_RE.search(m.group())
+            relation = found.group(1) if found else ''
+        block.fields.append(SchemaField(
+            block=block.name,
+            name=m.group(1),
+            type=m.group(2),
+            is_list=m.group(3) is not None,
+            optional=m.group(4) is not None,
+            relation=relation,
+            start=start,
+            end=m.end(),
+            remove_start=remove_start,
+            line=line,
+        ))
+
+
+def _attached_comment_start(text, line_starts, line):
+    """Início dos comentários colados acima da linha `line` (1-based), sem banners"""
+    start = line_starts[line - 1]
+    current = line - 1
+    while current > 0:
+        prev_start = line_starts[current - 1]
+        stripped = text[prev_start:line_starts[current]].strip()
+        if not stripped.startswith('//') or _BANNER_RE.match(stripped):
+            break
+        start = prev_start
+        current -= 1
+    return start
+
+
+def _build(text):
+    line_starts = _line_starts(text)
+
+    def line_of(offset):
+        return bisect.bisect_right(line_starts, offset)
+
+    blocks = []
+    n = len(text)
+    pos = 0
+    header = _HEADER_RE.match
+    while pos < n:
+        # Só o início de cada linha de nível superior pode abrir um bloco
+        line_end = text.find('\n', pos)
+        if line_end == -1:
+            line_end = n
+        if text.startswith('/*', pos):
+            close = text.find('*/', pos + 2)
+            if close == -1:
+                raise PrismaSchemaError(f'Comentario aberto na linha {line_of(pos)} nao foi fechado')
+            pos = close + 2
+            continue
+        m = header(text, pos)
+        if m is None:
+            pos = line_end + 1
+            continue
+
+        end = _block_end(text, m.end(), line_of)
+        line = line_of(pos)
+
+        # O trecho removido vai até o fim da linha da '}' e as linhas em branco seguintes
+        remove_end = text.find('\n', end)
+        remove_end = n if remove_end == -1 else remove_end + 1
+        while remove_end < n:
+            next_end = text.find('\n', remove_end)
+            next_end = n if next_end == -1 else next_end + 1
+            if text[remove_end:next_end].strip():
+                break
+            remove_end = next_end
+
+        block = SchemaBlock(
+            kind=m.group(1),
+            name=m.group(2),
+            start=pos,
+            end=end,
+            remove_start=_attached_comment_start(text, line_starts, line),
+            remove_end=remove_end,
+            line=line,
+            end_line=line_of(end - 1),
+        )
+        if block.kind in _FIELD_BLOCKS:
+            _parse_fields(text, block, m.end(), end - 1, line_starts, line_of)
+        blocks.append(block)
+        pos = remove_end
+
+    return SchemaIndex(text, blocks, line_starts, _references(blocks))
+
+
+def build_schema_index(text):
+    with profiling.phase('parse'):
+        index = _build(text)
+    profiling.count('schema_blocks', len(index.blocks))
+    return index
+
+
+_file_indexes = {}
+
+
+def index_schema(filepath):
+    """Lê e indexa o schema, reaproveitando o índice enquanto o arquivo não mudar"""
+    stat = os.stat(filepath)
+    key = os.path.abspath(filepath)
+    cached = _file_indexes.get(key)
+    if cached and cached[0] == (stat.st_size, stat.st_mtime_ns):
+        return cached[1]
+
+    with profiling.phase('read'), open(filepath, 'r', encoding='utf-8') as f:
+        content = f.read()
+    profiling.count('bytes_read', len(content))
+
+    index = build_schema_index(content)
+    _file_indexes[key] = ((stat.st_size, stat.st_mtime_ns), index)
+    return index
@@ -0,0 +1,184 @@
+"""
+Instrumentação opcional dos scripts (--profile)
+
+Com --profile (ou DIGIURBAN_PROFILE=1) cada script acumula:
+
+- fases nomeadas (read, parse, diff, write, ...): tempo total e chamadas
+- contadores (bytes lidos, serviços parseados, arquivos regravados, ...)
+
+e, ao terminar, imprime um resumo no stderr (o stdout dos scripts não
+muda) e grava um JSON em CACHE_DIR/profile-<script>.json, ou no caminho
+passado em --profile / DIGIURBAN_PROFILE. --profile-cprofile ARQ (ou
+DIGIURBAN_PROFILE_CPROFILE) grava também um dump do cProfile para
+`python -m pstats ARQ`.
+
+Desativado, phase() e count() não fazem nada além de testar uma global.
+"""
+
+import atexit
+import contextlib
+import json
+import os
+import sys
+import time
+from datetime import datetime, timezone
+
+from digiurban_tools.arguments import add_profile_arguments  # noqa: F401 (reexportado)
+from digiurban_tools.paths import CACHE_DIR
+
+PROFILE_VERSION = 1
+
+_active = None
+
+
+class Profile:
+    def __init__(self, script):
+        self.script = script
+        self.phases = {}
+        self.counters = {}
+        self.started = time.perf_counter()
+        self.started_at = datetime.now(timezone.utc).isoformat(timespec='seconds')
+
+    def add_phase(self, name, seconds, calls=1):
+        entry = self.phases.setdefault(name, [0.0, 0])
+        entry[0] += seconds
+        entry[1] += calls
+
+    def add_count(self, name, amount):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def snapshot(self):
+        """Fases e contadores acumulados (para somar os de processos worker)"""
+        return {'phases': dict(self.phases), 'counters': dict(self.counters)}
+
+    def merge(self, snapshot):
+        for name, (seconds, calls) in snapshot['phases'].items():
+            self.add_phase(name, seconds, calls)
+        for name, amount in snapshot['counters'].items():
+            self.add_count(name, amount)
+
+    def reset(self):
+        self.phases = {}
+        self.counters = {}
+
+    def summary(self):
+        return {
+            'version': PROFILE_VERSION,
+            'script': self.script,
+            'argv': sys.argv[1:],
+            'started_at': self.started_at,
+            'wall_s': round(time.perf_counter() - self.started, 6),
+            'phases': {
+                name: {'seconds': round(seconds, 6), 'calls': calls}
+                for name, (seconds, calls) in sorted(self.phases.items(), key=lambda item: -item[1][0])
+            },
+            'counters': dict(sorted(self.counters.items())),
+        }
+
+
+def enabled():
+    return _active is not None
+
+
+@contextlib.contextmanager
+def phase(name):
+    """Cronometra um trecho (fases aninhadas contam nas duas)"""
+    if _active is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _active.add_phase(name, time.perf_counter() - start)
+
+
+def count(name, amount=1):
+    if _active is not None:
+        _active.add_count(name, amount)
+
+
+def _script_name():
+    name = os.path.basename(sys.argv[0] or 'python')
+    return name[:-len('.py')] if name.endswith('.py') else name
+
+
+def apply_profile_arguments(args, script=None):
+    """Ativa a instrumentação conforme os argumentos ou as variáveis de ambiente"""
+    summary_path = getattr(args, 'profile', None)
+    pstats_path = getattr(args, 'profile_cprofile', None)
+
+    env = os.environ.get('DIGIURBAN_PROFILE', '')
+    if summary_path is None and env not in ('', '0'):
+        summary_path = '' if env == '1' else env
+    if pstats_path is None:
+        pstats_path = os.environ.get('DIGIURBAN_PROFILE_CPROFILE') or None
+
+    if summary_path is None and pstats_path is None:
+        return
+    start(summary_path or None, pstats_path, script)
+
+
+def start(summary_path=None, pstats_path=None, script=None):
+    """Ativa a instrumentação; o resumo é gravado na saída do processo"""
+    global _active
+    if _active is not None:
+        return _active
+
+    script = script or _script_name()
+    _active = Profile(script)
+    summary_path = summary_path or os.path.join(CACHE_DIR, f'profile-{script}.json')
+
+    profiler = None
+    if pstats_path:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+    atexit.register(_finish, summary_path, profiler, pstats_path)
+    return _active
+
+
+def start_worker(enabled_in_parent):
+    """Em processos worker: acumula sem gravar nada (o pai soma os snapshots)"""
+    global _active
+    _active = Profile(_script_name()) if enabled_in_parent else None
+
+
+def take_snapshot():
+    """Snapshot do worker desde o último take_snapshot(), ou None se desativado"""
+    if _active is None:
+        return None
+    snapshot = _active.snapshot()
+    _active.reset()
+    return snapshot
+
+
+def merge_snapshot(snapshot):
+    if _active is not None and snapshot:
+        _active.merge(snapshot)
+
+
+def _finish(summary_path, profiler, pstats_path):
+    if profiler is not None:
+        profiler.disable()
+        os.makedirs(os.path.dirname(os.path.abspath(pstats_path)), exist_ok=True)
+        profiler.dump_stats(pstats_path)
+
+    summary = _active.summary()
+    os.makedirs(os.path.dirname(os.path.abspath(summary_path)), exist_ok=True)
+    tmp_path = f'{summary_path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+    os.replace(tmp_path, summary_path)
+
+    err = sys.stderr
+    err.write(f"\n[profile] {summary['script']}: {summary['wall_s']:.3f}s\n")
+    for name, entry in summary['phases'].items():
+        err.write(f"[profile]   {name:20} {entry['seconds']:9.3f}s  {entry['calls']:6}x\n")
+    for name, amount in summary['counters'].items():
+        err.write(f"[profile]   {name:20} {amount:>10}\n")
+    err.write(f"[profile] resumo: {summary_path}\n")
+    if pstats_path:
+        err.write(f"[profile] cProfile: {pstats_path}\n")
@@ -0,0 +1,53 @@
+"""
+Saída dos relatórios em texto, NDJSON ou CSV (--format)
+
+Os comandos de análise geram os registros (dicts com 'type') em um
+gerador, na ordem em que são produzidos. Em ndjson e csv cada registro é
+escrito assim que chega, sem acumular nada, e o stdout fica só com os
+dados (pronto para `jq` ou `COPY ... FROM STDIN WITH (FORMAT csv, HEADER)`);
+avisos e erros vão para o stderr. Em text o próprio comando consome o
+mesmo gerador e imprime o relatório de sempre.
+"""
+
+import csv
+import json
+import os
+import sys
+
+from digiurban_tools.arguments import add_format_argument  # noqa: F401 (reexportado)
+
+
+def message_stream(fmt):
+    """Onde imprimir avisos: stdout no texto, stderr nos formatos de dados"""
+    return sys.stdout if fmt == 'text' else sys.stderr
+
+
+def _write(records, fmt, columns, out):
+    count = 0
+    if fmt == 'ndjson':
+        for record in records:
+            out.write(json.dumps(record, ensure_ascii=False) + '\n')
+            count += 1
+    elif fmt == 'csv':
+        writer = csv.DictWriter(out, fieldnames=columns, extrasaction='ignore', lineterminator='\n')
+        writer.writeheader()
+        for record in records:
+            writer.writerow(record)
+            count += 1
+    else:
+        raise ValueError(f'formato desconhecido: {fmt}')
+    out.flush()
+    return count
+
+
+def write_records(records, fmt, columns, out=None):
+    """Escreve os registros em ndjson ou csv (colunas fixas); retorna quantos"""
+    out = out or sys.stdout
+    try:
+        return _write(records, fmt, columns, out)
+    except BrokenPipeError:
+        # O leitor fechou o pipe (ex.: `| head`): para de gerar, sem traceback.
+        # O stdout vai para /dev/null para o flush da saída do interpretador não falhar.
+        if out is sys.stdout:
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return None
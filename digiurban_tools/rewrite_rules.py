@@ -0,0 +1,275 @@
+"""
+Regras declarativas de reescrita (JSON ou YAML) aplicadas em uma passada
+
+Formato do arquivo de regras:
+
+    {
+      "rules": [
+        {
+          "id": "backend-url-env",
+          "files": "api/super-admin/**/route.ts",
+          "replace": "process\\.env\\.NEXT_PUBLIC_BACKEND_URL",
+          "with": "process.env.NEXT_PUBLIC_API_URL"
+        },
+        {
+          "id": "dynamic-export",
+          "files": ["route.ts", "**/route.ts"],
+          "insert": "\\nexport const dynamic = 'force-dynamic';\\n",
+          "at": "after-last-import",
+          "if_contains": ["request.cookies"],
+          "unless_contains": ["export const dynamic"]
+        }
+      ]
+    }
+
+- replace/with: regex (sintaxe do módulo re) e substituição, com \\1 e
+  \\g<nome> como em re.sub; "ignore_case": true liga re.IGNORECASE. Dentro
+  do padrão use (?P=nome) em vez de \\1, já que na regex combinada os
+  grupos numerados de cada regra mudam de número
+- insert/at: texto inserido em "after-last-import" (depois da última
+  instrução import, ou no início se não houver), "start" ou "end"
+- description: texto livre, ignorado
+- files: glob(s) do caminho relativo à raiz percorrida (padrão: todos)
+- if_contains / unless_contains: a regra só vale para arquivos que contêm
+  todos os textos de if_contains e nenhum de unless_contains (testados no
+  conteúdo original)
+
+Todas as regras de substituição (e o marcador de import, se alguma
+inserção usa after-last-import) são compiladas em uma única regex com
+um grupo por regra, então cada arquivo é percorrido uma vez. Por isso as
+regras não se encadeiam: uma regra não vê o resultado de outra e, quando
+duas casam na mesma posição, vale a que vem primeiro no arquivo.
+
+YAML exige PyYAML; JSON usa só a biblioteca padrão.
+"""
+
+import fnmatch
+import hashlib
+import json
+import re
+from dataclasses import dataclass, field
+
+from digiurban_tools.codemod import Codemod
+
+try:
+    import yaml
+except ImportError:  # opcional: só necessário para arquivos .yaml/.yml
+    yaml = None
+
+
+class RewriteRuleError(ValueError):
+    """Arquivo de regras inválido"""
+
+
+ANCHORS = ('after-last-import', 'start', 'end')
+
+# Instrução import completa (inclusive multilinha): import ... from '...'; ou import '...';
+_IMPORT_RE = re.compile(r"""import\s(?:[^'"`;]*?\sfrom\s*)?['"][^'"\n]*['"][^\n]*(?:\n|$)""")
+_IMPORT_MARK = '_import'
+
+
+@dataclass
+class RewriteRule:
+    id: str
+    files: tuple = ()
+    replace: re.Pattern | None = None
+    replacement: str = ''
+    insert: str = ''
+    at: str = ''
+    if_contains: tuple = ()
+    unless_contains: tuple = ()
+    # O padrão tem grupos ou a substituição usa \1 / \g<..>: expandir pela regex da regra
+    expand: bool = False
+
+    def matches_path(self, relpath):
+        return not self.files or any(fnmatch.fnmatchcase(relpath, pattern) for pattern in self.files)
+
+    def applies(self, content):
+        return (all(text in content for text in self.if_contains)
+                and not any(text in content for text in self.unless_contains))
+
+
+@dataclass
+class RewriteResult:
+    content: str
+    hits: dict = field(default_factory=dict)
+
+
+def _as_tuple(value, rule_id, key):
+    if value is None:
+        return ()
+    if isinstance(value, str):
+        return (value,)
+    if isinstance(value, list) and all(isinstance(item, str) for item in value):
+        return tuple(value)
+    raise RewriteRuleError(f"regra {rule_id}: '{key}' deve ser texto ou lista de textos")
+
+
+def _parse_rule(raw, position):
+    if not isinstance(raw, dict):
+        raise RewriteRuleError(f'regra #{position}: esperado um objeto')
+    rule_id = raw.get('id') or f'regra-{position}'
+    known = {'id', 'description', 'files', 'replace', 'with', 'ignore_case', 'insert', 'at', 'if_contains', 'unless_contains'}
+    unknown = sorted(set(raw) - known)
+    if unknown:
+        raise RewriteRuleError(f"regra {rule_id}: chaves desconhecidas: {', '.join(unknown)}")
+
+    rule = RewriteRule(
+        id=rule_id,
+        files=_as_tuple(raw.get('files'), rule_id, 'files'),
+        if_contains=_as_tuple(raw.get('if_contains'), rule_id, 'if_contains'),
+        unless_contains=_as_tuple(raw.get('unless_contains'), rule_id, 'unless_contains'),
+    )
+
+    if ('replace' in raw) == ('insert' in raw):
+        raise RewriteRuleError(f"regra {rule_id}: use 'replace' + 'with' ou 'insert' + 'at'")
+
+    if 'replace' in raw:
+        if 'with' not in raw:
+            raise RewriteRuleError(f"regra {rule_id}: 'replace' sem 'with'")
+        try:
+            rule.replace = re.compile(raw['replace'], re.IGNORECASE if raw.get('ignore_case') else 0)
+        except re.error as exc:
+            raise RewriteRuleError(f'regra {rule_id}: regex invalida: {exc}') from None
+        if rule.replace.groups and re.search(r'\\[1-9]', raw['replace']):
+            raise RewriteRuleError(f"regra {rule_id}: use (?P<nome>...) e (?P=nome) em vez de \\1 no padrao")
+        rule.replacement = raw['with']
+        rule.expand = rule.replace.groups > 0 or '\\' in rule.replacement
+    else:
+        rule.insert = raw['insert']
+        rule.at = raw.get('at', 'after-last-import')
+        if rule.at not in ANCHORS:
+            raise RewriteRuleError(f"regra {rule_id}: 'at' deve ser um de {', '.join(ANCHORS)}")
+    return rule
+
+
+class RuleSet:
+    """Regras compiladas em uma única regex combinada"""
+
+    def __init__(self, rules, signature=''):
+        self.rules = rules
+        self.signature = signature
+        self.replacements = [rule for rule in rules if rule.replace is not None]
+        self.insertions = [rule for rule in rules if rule.replace is None]
+
+        ids = [rule.id for rule in rules]
+        duplicated = sorted({rule_id for rule_id in ids if ids.count(rule_id) > 1})
+        if duplicated:
+            raise RewriteRuleError(f"ids de regra repetidos: {', '.join(duplicated)}")
+
+        # Um grupo nomeado por regra; o marcador de import (largura zero) vem
+        # primeiro para não impedir uma regra de casar no início da linha
+        alternatives = []
+        if any(rule.at == 'after-last-import' for rule in self.insertions):
+            alternatives.append(rf'(?P<{_IMPORT_MARK}>(?m:^)(?=import\s))')
+        self._by_group = {}
+        for i, rule in enumerate(self.replacements):
+            group = f'_r{i}'
+            self._by_group[group] = rule
+            flags = '(?i:' if rule.replace.flags & re.IGNORECASE else '(?:'
+            alternatives.append(f'(?P<{group}>{flags}{rule.replace.pattern}))')
+        try:
+            self._combined = re.compile('|'.join(alternatives)) if alternatives else None
+        except re.error as exc:
+            raise RewriteRuleError(f'regras incompativeis na regex combinada: {exc}') from None
+
+    def matches_path(self, relpath):
+        return any(rule.matches_path(relpath) for rule in self.rules)
+
+    def as_codemod(self, name):
+        def transform(content, relpath):
+            result = self.apply(content, relpath)
+            return result.content, result.hits
+        return Codemod(name, transform, self.matches_path, signature=self.signature)
+
+    def apply(self, content, relpath):
+        """RewriteResult com o conteúdo reescrito e os acertos por regra"""
+        active = {rule.id for rule in self.rules if rule.matches_path(relpath) and rule.applies(content)}
+        if not active:
+            return RewriteResult(content)
+
+        hits = {}
+        edits = []
+        last_import_end = None
+        if self._combined is not None:
+            by_group = self._by_group
+            for m in self._combined.finditer(content):
+                group = m.lastgroup
+                if group == _IMPORT_MARK:
+                    statement = _IMPORT_RE.match(content, m.start())
+                    if statement:
+                        last_import_end = statement.end()
+                    continue
+                rule = by_group[group]
+                if rule.id not in active:
+                    continue
+                if rule.expand:
+                    new_text = rule.replace.match(content, m.start()).expand(rule.replacement)
+                else:
+                    new_text = rule.replacement
+                if new_text != m.group():
+                    edits.append((m.start(), m.end(), new_text))
+                    hits[rule.id] = hits.get(rule.id, 0) + 1
+
+        for rule in self.insertions:
+            if rule.id not in active:
+                continue
+            if rule.at == 'start':
+                offset = 0
+            elif rule.at == 'end':
+                offset = len(content)
+            else:
+                offset = last_import_end or 0
+            text = rule.insert
+            if '\r\n' in content:
+                # Mantém o fim de linha do arquivo
+                text = text.replace('\r\n', '\n').replace('\n', '\r\n')
+            edits.append((offset, offset, text))
+            hits[rule.id] = hits.get(rule.id, 0) + 1
+
+        if not edits:
+            return RewriteResult(content)
+
+        # Montagem linear; inserção dentro de um trecho substituído vai para o fim dele
+        edits.sort(key=lambda edit: (edit[0], edit[1]))
+        parts = []
+        pos = 0
+        for start, end, text in edits:
+            start = max(start, pos)
+            end = max(end, start)
+            parts.append(content[pos:start])
+            parts.append(text)
+            pos = end
+        parts.append(content[pos:])
+        return RewriteResult(''.join(parts), hits)
+
+
+def parse_rules(data, signature=''):
+    if isinstance(data, list):
+        data = {'rules': data}
+    if not isinstance(data, dict) or not isinstance(data.get('rules'), list):
+        raise RewriteRuleError("esperado um objeto com a lista 'rules'")
+    return RuleSet([_parse_rule(raw, i) for i, raw in enumerate(data['rules'], 1)], signature)
+
+
+def load_rules(filepath):
+    """RuleSet de um arquivo .json, .yaml ou .yml"""
+    with open(filepath, 'rb') as f:
+        raw = f.read()
+    text = raw.decode('utf-8')
+    if filepath.endswith(('.yaml', '.yml')):
+        if yaml is None:
+            raise RewriteRuleError(f'{filepath}: regras em YAML exigem PyYAML (pip install pyyaml)')
+        try:
+            data = yaml.safe_load(text)
+        except yaml.YAMLError as exc:
+            raise RewriteRuleError(f'{filepath}: YAML invalido: {exc}') from None
+    else:
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError as exc:
+            raise RewriteRuleError(f'{filepath}: JSON invalido: {exc}') from None
+    try:
+        return parse_rules(data, signature=hashlib.sha1(raw).hexdigest())
+    except RewriteRuleError as exc:
+        raise RewriteRuleError(f'{filepath}: {exc}') from None
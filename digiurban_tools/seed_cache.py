@@ -0,0 +1,170 @@
+"""
+Cache em disco dos índices de seed (seções e serviços já parseados)
+
+Cada arquivo de seed tem uma entrada binária (marshal) em CACHE_DIR com
+tamanho, mtime e sha1 do conteúdo. Se tamanho e mtime batem, o índice é
+carregado direto; se só o mtime mudou, o sha1 confirma que o conteúdo é o
+mesmo antes de reaproveitar. Qualquer outra diferença re-parseia o arquivo.
+
+Desativação: --no-cache nos scripts ou DIGIURBAN_NO_CACHE=1.
+Invalidação explícita: --clear-cache, clear_cache() ou invalidate(path).
+
+Além do índice, a entrada guarda valores derivados (load_derived), como
+as definições completas dos serviços usadas pelo catálogo compilado.
+"""
+
+import hashlib
+import marshal
+import os
+
+from digiurban_tools import profiling
+from digiurban_tools.arguments import add_cache_arguments  # noqa: F401 (reexportado)
+from digiurban_tools.paths import CACHE_DIR
+from digiurban_tools.seed_lexer import SeedIndex, build_index, remember
+
+# Sobe sempre que o formato de SeedIndex.to_dict() ou da entrada mudar
+CACHE_VERSION = 2
+
+_enabled = os.environ.get('DIGIURBAN_NO_CACHE', '') in ('', '0')
+
+
+def set_enabled(enabled):
+    global _enabled
+    _enabled = enabled
+
+
+def is_enabled():
+    return _enabled
+
+
+def apply_cache_arguments(args):
+    if args.clear_cache:
+        removed = clear_cache()
+        print(f"Cache limpo: {removed} entradas removidas")
+    if args.no_cache:
+        set_enabled(False)
+
+
+def _entry_path(filepath, cache_dir):
+    key = hashlib.sha1(os.path.abspath(filepath).encode('utf-8')).hexdigest()
+    return os.path.join(cache_dir, key + '.idx')
+
+
+def _read_entry(entry_path):
+    try:
+        with open(entry_path, 'rb') as f:
+            entry = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(entry, dict) or entry.get('version') != CACHE_VERSION:
+        return None
+    return entry
+
+
+def _write_entry(entry_path, entry):
+    os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+    tmp_path = f'{entry_path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        marshal.dump(entry, f)
+    os.replace(tmp_path, entry_path)
+
+
+def _load(filepath, use_cache, cache_dir):
+    """(índice, entrada do cache ou None, caminho da entrada)"""
+    if use_cache is None:
+        use_cache = _enabled
+    cache_dir = cache_dir or CACHE_DIR
+
+    with profiling.phase('read'), open(filepath, 'rb') as f:
+        raw = f.read()
+    profiling.count('bytes_read', len(raw))
+    text = raw.decode('utf-8')
+
+    if not use_cache:
+        return build_index(text), None, None
+
+    stat = os.stat(filepath)
+    entry_path = _entry_path(filepath, cache_dir)
+    entry = _read_entry(entry_path)
+
+    if entry is not None and entry['size'] == len(raw):
+        if entry['mtime_ns'] == stat.st_mtime_ns:
+            profiling.count('cache_hits')
+            return remember(SeedIndex.from_dict(text, entry['index'])), entry, entry_path
+
+        digest = hashlib.sha1(raw).hexdigest()
+        if entry['sha1'] == digest:
+            # Arquivo tocado mas sem alteração: só atualiza o mtime
+            entry['mtime_ns'] = stat.st_mtime_ns
+            _write_entry(entry_path, entry)
+            profiling.count('cache_hits')
+            return remember(SeedIndex.from_dict(text, entry['index'])), entry, entry_path
+    else:
+        digest = hashlib.sha1(raw).hexdigest()
+
+    profiling.count('cache_misses')
+    index = build_index(text)
+    entry = {
+        'version': CACHE_VERSION,
+        'path': os.path.abspath(filepath),
+        'size': len(raw),
+        'mtime_ns': stat.st_mtime_ns,
+        'sha1': digest,
+        'index': index.to_dict(),
+        'derived': {},
+    }
+    _write_entry(entry_path, entry)
+    return index, entry, entry_path
+
+
+def load_index(filepath, use_cache=None, cache_dir=None):
+    """
+    Índice de um arquivo de seed, usando o cache em disco quando possível.
+    O índice também fica registrado em memória para build_index(texto).
+    """
+    return _load(filepath, use_cache, cache_dir)[0]
+
+
+def load_derived(filepath, name, compute, version=1, use_cache=None, cache_dir=None):
+    """
+    Valor calculado a partir do índice de um arquivo (ex.: definições dos
+    serviços), guardado na mesma entrada do cache. compute(index) deve
+    retornar um valor serializável por marshal; `version` invalida valores
+    calculados por uma versão anterior de compute.
+    """
+    index, entry, entry_path = _load(filepath, use_cache, cache_dir)
+    if entry is None:
+        return compute(index)
+
+    cached = entry['derived'].get(name)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    value = compute(index)
+    entry['derived'][name] = (version, value)
+    _write_entry(entry_path, entry)
+    return value
+
+
+def invalidate(filepath, cache_dir=None):
+    """Remove a entrada de um arquivo. Retorna True se havia entrada."""
+    try:
+        os.remove(_entry_path(filepath, cache_dir or CACHE_DIR))
+        return True
+    except FileNotFoundError:
+        return False
+
+
+def clear_cache(cache_dir=None):
+    """Remove todas as entradas do cache. Retorna quantas foram removidas."""
+    cache_dir = cache_dir or CACHE_DIR
+    if not os.path.isdir(cache_dir):
+        return 0
+
+    removed = 0
+    with os.scandir(cache_dir) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.name.endswith('.idx'):
+                os.remove(entry.path)
+                removed += 1
+    return removed
@@ -0,0 +1,434 @@
+"""
+Lexer de passada única para os arquivos de seed em TypeScript
+
+Tokeniza o arquivo uma vez (ignorando strings, comentários, template
+literals e regex literais) e monta um índice com:
+
+- seção (nome da const) -> offsets de início e fim
+- cada objeto de serviço da seção -> offsets, linha, name e departmentCode
+
+Os offsets são posições no texto decodificado (str), prontos para fatiar
+o conteúdo lido com encoding utf-8.
+"""
+
+import bisect
+import os
+import re
+from dataclasses import dataclass, field
+
+from digiurban_tools import profiling
+
+
+class SeedLexError(ValueError):
+    """Erro de tokenização (string, comentário ou template não fechado)"""
+
+
+# Ordem importa: comentários antes de '/', strings antes de pontuação
+_TOKEN_RE = re.compile(r"""
+    (?P<ws>\s+)
+  | (?P<comment>//[^\n]*|/\*.*?\*/)
+  | (?P<string>'(?:[^'\\\n]|\\.)*'|"(?:[^"\\\n]|\\.)*")
+  | (?P<number>(?:0[xXbBoO][0-9a-fA-F_]+|\d[\d_]*(?:\.\d*)?(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?)n?)
+  | (?P<ident>[A-Za-z_$\u00c0-\uffff][\w$]*)
+  | (?P<template>`)
+  | (?P<slash>/)
+  | (?P<punct>\.\.\.|=>|[{}\[\]();,:=.?!<>+\-*%&|^~@#])
+  | (?P<unterminated>['"])
+""", re.S | re.X)
+
+_REGEX_RE = re.compile(r"/(?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[A-Za-z]*")
+
+_TEMPLATE_CHUNK_RE = re.compile(r"(?:[^`\\$]|\\.|\$(?!\{))*", re.S)
+
+# Depois destes tokens uma '/' inicia um regex literal, não uma divisão
+_REGEX_AFTER_PUNCT = set('(,=:[!&|?{};+-*%<>~^') | {'=>', '...'}
+_REGEX_AFTER_IDENT = {
+    'return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'new',
+    'delete', 'void', 'throw', 'instanceof', 'yield', 'await',
+}
+
+_OPENERS = {'{': '}', '[': ']', '(': ')'}
+
+_ESCAPE_RE = re.compile(r"\\(u\{[0-9a-fA-F]+\}|u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|\n|.)", re.S)
+_SIMPLE_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0', '\n': ''}
+
+
+def _unescape(match):
+    seq = match.group(1)
+    if seq.startswith('u{'):
+        return chr(int(seq[2:-1], 16))
+    if seq[0] in 'ux' and len(seq) > 1:
+        return chr(int(seq[1:], 16))
+    return _SIMPLE_ESCAPES.get(seq, seq)
+
+
+def unquote(raw):
+    """Converte o texto de um literal string ('...' ou "...") no seu valor"""
+    body = raw[1:-1]
+    if '\\' not in body:
+        return body
+    return _ESCAPE_RE.sub(_unescape, body)
+
+
+def _regex_allowed(text, prev):
+    if prev is None:
+        return True
+    kind, start, end = prev
+    if kind == 'punct':
+        return text[start:end] in _REGEX_AFTER_PUNCT
+    if kind == 'ident':
+        return text[start:end] in _REGEX_AFTER_IDENT
+    return False
+
+
+def _scan(text, pos, tokens):
+    """
+    Percorre o texto a partir de pos. Com tokens=None está dentro de uma
+    expressão ${...} de template: nada é emitido e a função retorna a posição
+    após a '}' que fecha a expressão.
+    """
+    nested = tokens is None
+    depth = 0
+    prev = None
+    n = len(text)
+    match = _TOKEN_RE.match
+
+    while pos < n:
+        m = match(text, pos)
+        if m is None:
+            if text.startswith('/*', pos):
+                raise SeedLexError(f'Comentario nao fechado na posicao {pos}')
+            raise SeedLexError(f'Caractere inesperado {text[pos]!r} na posicao {pos}')
+
+        kind = m.lastgroup
+        end = m.end()
+
+        if kind == 'ws' or kind == 'comment':
+            pos = end
+            continue
+        if kind == 'unterminated':
+            raise SeedLexError(f'String nao fechada na posicao {pos}')
+        if kind == 'template':
+            end = _scan_template(text, pos)
+        elif kind == 'slash':
+            kind = 'punct'
+            if _regex_allowed(text, prev):
+                rm = _REGEX_RE.match(text, pos)
+                if rm:
+                    kind = 'regex'
+                    end = rm.end()
+
+        if nested:
+            if kind == 'punct':
+                c = text[pos]
+                if c == '{':
+                    depth += 1
+                elif c == '}':
+                    if depth == 0:
+                        return end
+                    depth -= 1
+        else:
+            tokens.append((kind, pos, end))
+
+        prev = (kind, pos, end)
+        pos = end
+
+    if nested:
+        raise SeedLexError('Expressao ${...} de template nao fechada')
+    return pos
+
+
+def _scan_template(text, pos):
+    """Retorna a posição após o ` que fecha o template iniciado em pos"""
+    i = pos + 1
+    n = len(text)
+    while i < n:
+        i = _TEMPLATE_CHUNK_RE.match(text, i).end()
+        if i >= n:
+            break
+        if text[i] == '`':
+            return i + 1
+        # '${' abre uma expressão que pode conter strings e templates aninhados
+        i = _scan(text, i + 2, None)
+    raise SeedLexError(f'Template literal nao fechado na posicao {pos}')
+
+
+def tokenize(text):
+    """Lista de tokens (kind, start, end), sem espaços e comentários"""
+    tokens = []
+    _scan(text, 0, tokens)
+    return tokens
+
+
+@dataclass(slots=True)
+class ServiceSpan:
+    """Objeto de serviço dentro de um array ServiceDefinition[]"""
+    section: str
+    name: str | None
+    department_code: str | None
+    start: int
+    end: int
+    line: int
+
+
+@dataclass(slots=True)
+class SectionSpan:
+    """Declaração `const NOME: ServiceDefinition[] = [ ... ];`"""
+    name: str
+    start: int
+    end: int
+    open_bracket: int
+    close_bracket: int
+    line: int
+    exported: bool = False
+    services: list = field(default_factory=list)
+
+
+class SeedIndex:
+    """Índice de seções e serviços de um arquivo de seed"""
+
+    def __init__(self, text, sections):
+        self.text = text
+        self.sections = sections
+        self._line_starts = None
+
+    def section(self, name):
+        return self.sections.get(name)
+
+    def section_text(self, name):
+        section = self.sections.get(name)
+        if section is None:
+            return None
+        return self.text[section.start:section.end]
+
+    def services(self, section=None):
+        """Serviços de uma seção, ou de todas as seções na ordem do arquivo"""
+        if section is not None:
+            found = self.sections.get(section)
+            return list(found.services) if found else []
+        return [s for sec in self.sections.values() for s in sec.services]
+
+    def service_names(self, section=None):
+        return [s.name for s in self.services(section) if s.name is not None]
+
+    def service_text(self, service):
+        return self.text[service.start:service.end]
+
+    def line_of(self, offset):
+        if self._line_starts is None:
+            self._line_starts = _line_starts(self.text)
+        return bisect.bisect_right(self._line_starts, offset)
+
+    def to_dict(self):
+        """Forma serializável do índice (sem o texto)"""
+        return {
+            'sections': [
+                {
+                    'name': sec.name,
+                    'start': sec.start,
+                    'end': sec.end,
+                    'open_bracket': sec.open_bracket,
+                    'close_bracket': sec.close_bracket,
+                    'line': sec.line,
+                    'exported': sec.exported,
+                    'services': [
+                        (s.name, s.department_code, s.start, s.end, s.line)
+                        for s in sec.services
+                    ],
+                }
+                for sec in self.sections.values()
+            ]
+        }
+
+    @classmethod
+    def from_dict(cls, text, data):
+        sections = {}
+        for raw in data['sections']:
+            section = SectionSpan(
+                name=raw['name'],
+                start=raw['start'],
+                end=raw['end'],
+                open_bracket=raw['open_bracket'],
+                close_bracket=raw['close_bracket'],
+                line=raw['line'],
+                exported=raw['exported'],
+            )
+            section.services = [
+                ServiceSpan(raw['name'], name, code, start, end, line)
+                for name, code, start, end, line in raw['services']
+            ]
+            sections[section.name] = section
+        return cls(text, sections)
+
+
+def _line_starts(text):
+    starts = [0]
+    find = text.find
+    pos = find('\n')
+    while pos != -1:
+        starts.append(pos + 1)
+        pos = find('\n', pos + 1)
+    return starts
+
+
+def _match_brackets(text, tokens):
+    """Mapa índice do token de abertura -> índice do token de fechamento"""
+    pairs = {}
+    stack = []
+    for i, (kind, start, _end) in enumerate(tokens):
+        if kind != 'punct':
+            continue
+        c = text[start]
+        if c in _OPENERS:
+            stack.append(i)
+        elif c in '}])':
+            if not stack or _OPENERS[text[tokens[stack[-1]][1]]] != c:
+                line = text.count('\n', 0, start) + 1
+                raise SeedLexError(f"'{c}' sem abertura correspondente na linha {line}")
+            pairs[stack.pop()] = i
+    if stack:
+        line = text.count('\n', 0, tokens[stack[-1]][1]) + 1
+        raise SeedLexError(f'Bloco aberto na linha {line} nao foi fechado')
+    return pairs
+
+
+def _is(text, token, kind, value):
+    return token[0] == kind and text[token[1]:token[2]] == value
+
+
+def _top_level_strings(text, tokens, pairs, first, last, keys):
+    """Valores string das chaves `keys` no nível superior de um objeto"""
+    found = {}
+    i = first
+    while i < last:
+        kind, start, end = tokens[i]
+        if i in pairs:
+            i = pairs[i] + 1
+            continue
+        if kind in ('ident', 'string') and i + 2 < last and _is(text, tokens[i + 1], 'punct', ':'):
+            key = text[start:end] if kind == 'ident' else unquote(text[start:end])
+            value = tokens[i + 2]
+            if key in keys and key not in found and value[0] == 'string':
+                found[key] = unquote(text[value[1]:value[2]])
+        i += 1
+    return found
+
+
+def _build(text):
+    tokens = tokenize(text)
+    pairs = _match_brackets(text, tokens)
+    line_starts = _line_starts(text)
+
+    def line_of(offset):
+        return bisect.bisect_right(line_starts, offset)
+
+    sections = {}
+    n = len(tokens)
+    i = 0
+    while i < n:
+        # const NOME : ServiceDefinition [ ] = [
+        if (
+            i + 7 < n
+            and _is(text, tokens[i], 'ident', 'const')
+            and tokens[i + 1][0] == 'ident'
+            and _is(text, tokens[i + 2], 'punct', ':')
+            and _is(text, tokens[i + 3], 'ident', 'ServiceDefinition')
+            and _is(text, tokens[i + 4], 'punct', '[')
+            and _is(text, tokens[i + 5], 'punct', ']')
+            and _is(text, tokens[i + 6], 'punct', '=')
+            and _is(text, tokens[i + 7], 'punct', '[')
+        ):
+            name = text[tokens[i + 1][1]:tokens[i + 1][2]]
+            open_idx = i + 7
+            close_idx = pairs[open_idx]
+            end = tokens[close_idx][2]
+            if close_idx + 1 < n and _is(text, tokens[close_idx + 1], 'punct', ';'):
+                end = tokens[close_idx + 1][2]
+
+            start = tokens[i][1]
+            section = SectionSpan(
+                name=name,
+                start=start,
+                end=end,
+                open_bracket=tokens[open_idx][1],
+                close_bracket=tokens[close_idx][1],
+                line=line_of(start),
+                exported=i > 0 and _is(text, tokens[i - 1], 'ident', 'export'),
+            )
+
+            j = open_idx + 1
+            while j < close_idx:
+                if _is(text, tokens[j], 'punct', '{'):
+                    obj_end = pairs[j]
+                    values = _top_level_strings(text, tokens, pairs, j + 1, obj_end, ('name', 'departmentCode'))
+                    obj_start = tokens[j][1]
+                    section.services.append(ServiceSpan(
+                        section=name,
+                        name=values.get('name'),
+                        department_code=values.get('departmentCode'),
+                        start=obj_start,
+                        end=tokens[obj_end][2],
+                        line=line_of(obj_start),
+                    ))
+                    j = obj_end + 1
+                elif j in pairs:
+                    j = pairs[j] + 1
+                else:
+                    j += 1
+
+            sections[name] = section
+            i = close_idx + 1
+            continue
+        i += 1
+
+    index = SeedIndex(text, sections)
+    index._line_starts = line_starts
+    return index
+
+
+# Índices já montados, por conteúdo (str guarda o próprio hash, então a
+# consulta com o mesmo objeto de texto é O(1))
+_MAX_INDEXES = 64
+_indexes_by_text = {}
+
+
+def remember(index):
+    """Registra um índice pronto (ex.: carregado do cache em disco)"""
+    if index.text not in _indexes_by_text and len(_indexes_by_text) >= _MAX_INDEXES:
+        _indexes_by_text.pop(next(iter(_indexes_by_text)))
+    _indexes_by_text[index.text] = index
+    return index
+
+
+def build_index(text):
+    """
+    Índice de um conteúdo já lido. Chamadas repetidas com o mesmo texto
+    reaproveitam o índice, então os scripts podem consultar várias seções
+    sem re-tokenizar o arquivo.
+    """
+    index = _indexes_by_text.get(text)
+    if index is None:
+        with profiling.phase('parse'):
+            index = remember(_build(text))
+        profiling.count('services_parsed', len(index.services()))
+    return index
+
+
+_file_indexes = {}
+
+
+def index_file(filepath):
+    """Lê e indexa um arquivo, reaproveitando o índice enquanto ele não mudar"""
+    stat = os.stat(filepath)
+    key = os.path.abspath(filepath)
+    cached = _file_indexes.get(key)
+    if cached and cached[0] == (stat.st_size, stat.st_mtime_ns):
+        return cached[1]
+
+    with profiling.phase('read'), open(filepath, 'r', encoding='utf-8') as f:
+        content = f.read()
+    profiling.count('bytes_read', len(content))
+
+    index = build_index(content)
+    _file_indexes[key] = ((stat.st_size, stat.st_mtime_ns), index)
+    return index
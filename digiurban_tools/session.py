@@ -0,0 +1,56 @@
+"""
+Sessão compartilhada entre subcomandos do digiurban-tools
+
+Guarda em memória o índice de cada arquivo já lido (fonte consolidada e
+seeds modulares). Em uma execução encadeada como `merge dedupe analyze`
+cada arquivo é lido e parseado uma única vez; o que um subcomando grava
+pelo writer() da sessão já entra no índice a partir do conteúdo novo,
+sem reler o disco.
+"""
+
+import os
+
+from digiurban_tools.output import OutputWriter
+from digiurban_tools.seed_cache import load_index
+from digiurban_tools.seed_lexer import build_index
+
+
+class Session:
+    def __init__(self, source_file, seeds_dir, jobs=1):
+        self.source_file = source_file
+        self.seeds_dir = seeds_dir
+        self.jobs = jobs
+        self._indexes = {}
+
+    def index(self, filepath):
+        """Índice de um arquivo (None se não existir), lido uma vez por sessão"""
+        key = os.path.abspath(filepath)
+        if key not in self._indexes:
+            try:
+                self._indexes[key] = load_index(filepath)
+            except FileNotFoundError:
+                return None
+        return self._indexes[key]
+
+    def source(self):
+        return self.index(self.source_file)
+
+    def seed_path(self, department):
+        return os.path.join(self.seeds_dir, department.file)
+
+    def seed(self, department):
+        return self.index(self.seed_path(department))
+
+    def invalidate(self, filepath):
+        """Descarta o índice de um arquivo alterado fora da sessão (ex.: por um worker)"""
+        self._indexes.pop(os.path.abspath(filepath), None)
+
+    def writer(self):
+        """OutputWriter que atualiza os índices da sessão no flush"""
+        return OutputWriter(on_write=self._written)
+
+    def _written(self, filepath, content):
+        if filepath.endswith('.seed.ts'):
+            self._indexes[os.path.abspath(filepath)] = build_index(content)
+        else:
+            self.invalidate(filepath)
@@ -0,0 +1,233 @@
+"""
+Gerador de SQL set-based para carregar o catálogo em services_simplified
+
+Substitui o laço findFirst + update/create do seedServices por:
+
+1. tabela temporária de staging carregada via COPY (CSV ou texto) ou,
+   com chunk_size, por INSERT ... VALUES em lotes;
+2. INSERT ... SELECT com JOIN em departments pelo code e
+   ON CONFLICT ("name", "departmentId") DO UPDATE.
+
+O ON CONFLICT usa o índice único de @@unique([name, departmentId]) do
+model ServiceSimplified (migration
+20261018130000_add_service_name_department_unique): aplique as migrations
+antes de rodar o script.
+
+Linhas ativas cujo contentFingerprint já é o do catálogo não são
+atualizadas (WHERE do DO UPDATE).
+
+Semântica igual à do seedServices: campos opcionais ausentes no catálogo
+(formSchema, linkedCitizensConfig, requiredDocuments, category, icon,
+color) não sobrescrevem o valor atual, requiredDocuments é gravado como
+JSON.stringify do array, contentFingerprint recebe o fingerprint de
+conteúdo (digiurban_tools.fingerprint) e, se o mesmo (name,
+departmentCode) aparecer duas vezes, a última ocorrência vence.
+"""
+
+import json
+
+from digiurban_tools.fingerprint import service_fingerprint
+
+TABLE = '"services_simplified"'
+STAGE = 'service_catalog_stage'
+
+# (coluna de staging, tipo, função que extrai o valor da definição)
+STAGE_COLUMNS = [
+    ('seq', 'integer', None),
+    ('name', 'text', lambda d: d.get('name')),
+    ('department_code', 'text', lambda d: d.get('departmentCode')),
+    ('description', 'text', lambda d: d.get('description')),
+    ('service_type', 'text', lambda d: d.get('serviceType')),
+    ('module_type', 'text', lambda d: d.get('moduleType')),
+    ('form_schema', 'jsonb', lambda d: _json_or_none(d.get('formSchema'))),
+    ('linked_citizens_config', 'jsonb', lambda d: _json_or_none(d.get('linkedCitizensConfig'))),
+    ('requires_documents', 'boolean', lambda d: d.get('requiresDocuments')),
+    # seedServices grava JSON.stringify(requiredDocuments): um valor JSON do tipo string
+    ('required_documents', 'jsonb', lambda d: _json_or_none(_compact(d['requiredDocuments'])) if d.get('requiredDocuments') else None),
+    ('estimated_days', 'integer', lambda d: d.get('estimatedDays')),
+    ('priority', 'integer', lambda d: d.get('priority')),
+    ('category', 'text', lambda d: d.get('category') or None),
+    ('icon', 'text', lambda d: d.get('icon') or None),
+    ('color', 'text', lambda d: d.get('color') or None),
+    ('content_fingerprint', 'text', service_fingerprint),
+]
+
+# Colunas que o seedServices só atualiza quando o catálogo tem valor
+_KEEP_WHEN_NULL = {'formSchema', 'linkedCitizensConfig', 'requiredDocuments', 'category', 'icon', 'color'}
+
+# coluna de destino -> expressão sobre s (staging) e d (departments)
+_TARGET = [
+    ('id', 'gen_random_uuid()::text'),
+    ('name', 's.name'),
+    ('description', 's.description'),
+    ('departmentId', 'd.id'),
+    ('serviceType', 's.service_type::"ServiceType"'),
+    ('moduleType', 's.module_type'),
+    ('formSchema', 's.form_schema'),
+    ('linkedCitizensConfig', 's.linked_citizens_config'),
+    ('isActive', 'true'),
+    ('requiresDocuments', 's.requires_documents'),
+    ('requiredDocuments', 's.required_documents'),
+    ('estimatedDays', 's.estimated_days'),
+    ('priority', 's.priority'),
+    ('category', 's.category'),
+    ('icon', 's.icon'),
+    ('color', 's.color'),
+    ('contentFingerprint', 's.content_fingerprint'),
+    ('createdAt', 'now()'),
+    ('updatedAt', 'now()'),
+]
+
+
+def _compact(value):
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def _json_or_none(value):
+    return None if value is None else _compact(value)
+
+
+def stage_rows(services):
+    """Linhas da tabela de staging, na ordem de STAGE_COLUMNS"""
+    for seq, definition in enumerate(services, 1):
+        yield [seq] + [extract(definition) for _name, _type, extract in STAGE_COLUMNS[1:]]
+
+
+def _text(value):
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    return str(value)
+
+
+def csv_line(row):
+    """Linha CSV do COPY: NULL sem aspas, demais valores sempre entre aspas"""
+    return ','.join(
+        '' if value is None else '"' + _text(value).replace('"', '""') + '"'
+        for value in row
+    ) + '\n'
+
+
+_TEXT_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+
+
+def text_line(row):
+    """Linha no formato text (TSV) do COPY: \\N para NULL"""
+    return '\t'.join(
+        '\\N' if value is None else _text(value).translate(_TEXT_ESCAPES)
+        for value in row
+    ) + '\n'
+
+
+def sql_literal(value, column_type):
+    if value is None:
+        return 'NULL'
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, int):
+        return str(value)
+    literal = "'" + str(value).replace("'", "''") + "'"
+    return f'{literal}::jsonb' if column_type == 'jsonb' else literal
+
+
+def _stage_table_sql():
+    columns = ',\n'.join(f'  {name} {column_type}' for name, column_type, _extract in STAGE_COLUMNS)
+    return f'CREATE TEMP TABLE {STAGE} (\n{columns}\n) ON COMMIT DROP;'
+
+
+def _upsert_sql(seq_range=None):
+    targets = ', '.join(f'"{name}"' for name, _expr in _TARGET)
+    values = ',\n    '.join(expr for _name, expr in _TARGET)
+    updates = []
+    for name, expr in _TARGET:
+        if name in ('id', 'name', 'departmentId', 'createdAt'):
+            continue
+        if name in _KEEP_WHEN_NULL:
+            updates.append(f'"{name}" = COALESCE(EXCLUDED."{name}", t."{name}")')
+        else:
+            updates.append(f'"{name}" = EXCLUDED."{name}"')
+    where = ''
+    if seq_range is not None:
+        where = f'\nWHERE s.seq BETWEEN {seq_range[0]} AND {seq_range[1]}'
+    return (
+        f'INSERT INTO {TABLE} AS t ({targets})\n'
+        f'SELECT\n    {values}\n'
+        f'FROM (\n'
+        f'  SELECT DISTINCT ON (name, department_code) *\n'
+        f'  FROM {STAGE}\n'
+        f'  ORDER BY name, department_code, seq DESC\n'
+        f') s\n'
+        f'JOIN "departments" d ON d.code = s.department_code{where}\n'
+        f'ON CONFLICT ("name", "departmentId") DO UPDATE SET\n  '
+        + ',\n  '.join(updates)
+        # Linha com o mesmo fingerprint e ativa: nada a gravar (sem tupla nova nem WAL)
+        + '\nWHERE t."contentFingerprint" IS DISTINCT FROM EXCLUDED."contentFingerprint" OR NOT t."isActive"'
+        + ';'
+    )
+
+
+def _missing_departments_sql():
+    return (
+        '-- Serviços ignorados por departamento inexistente (seedServices só avisava)\n'
+        f'SELECT s.department_code, count(*) AS servicos_ignorados\n'
+        f'FROM {STAGE} s\n'
+        f'LEFT JOIN "departments" d ON d.code = s.department_code\n'
+        f'WHERE d.id IS NULL\n'
+        f'GROUP BY s.department_code\n'
+        f'ORDER BY s.department_code;'
+    )
+
+
+def generate_sql(services, copy_format='csv', copy_file=None, chunk_size=None):
+    """
+    Gera o script SQL (psql) completo.
+
+    copy_format: 'csv' ou 'text' para o COPY do staging
+    copy_file:   caminho de um arquivo já gerado (usa \\copy em vez de dados inline)
+    chunk_size:  sem COPY; INSERT ... VALUES e upsert em lotes de N serviços
+    """
+    rows = list(stage_rows(services))
+    column_names = ', '.join(name for name, _type, _extract in STAGE_COLUMNS)
+    out = [
+        f'-- Upsert set-based do catálogo de serviços ({len(rows)} serviços)',
+        '-- Executar com: psql -v ON_ERROR_STOP=1 -f <arquivo>',
+        '-- Requer o @@unique([name, departmentId]) do schema.prisma (prisma migrate deploy)',
+        '\\set ON_ERROR_STOP on',
+        '',
+    ]
+
+    out += ['BEGIN;', '', _stage_table_sql(), '']
+
+    if chunk_size:
+        types = [column_type for _name, column_type, _extract in STAGE_COLUMNS]
+        ranges = []
+        for first in range(0, len(rows), chunk_size):
+            chunk = rows[first:first + chunk_size]
+            values = ',\n'.join(
+                '  (' + ', '.join(sql_literal(v, t) for v, t in zip(row, types)) + ')'
+                for row in chunk
+            )
+            out += [f'INSERT INTO {STAGE} ({column_names}) VALUES\n{values};', '']
+            ranges.append((chunk[0][0], chunk[-1][0]))
+        upserts = [_upsert_sql(r) for r in ranges]
+    else:
+        options = 'FORMAT csv' if copy_format == 'csv' else 'FORMAT text'
+        if copy_file:
+            out += [f"\\copy {STAGE} ({column_names}) FROM '{copy_file}' WITH ({options})", '']
+        else:
+            line = csv_line if copy_format == 'csv' else text_line
+            out.append(f'COPY {STAGE} ({column_names}) FROM STDIN WITH ({options});')
+            out.append(''.join(line(row) for row in rows) + '\\.')
+            out.append('')
+        upserts = [_upsert_sql()]
+
+    for statement in upserts:
+        out += [statement, '']
+
+    out += [_missing_departments_sql(), '', 'COMMIT;', '']
+    return '\n'.join(out)
+
+
+def generate_copy_data(services, copy_format='csv'):
+    """Conteúdo do arquivo de dados para \\copy (sem cabeçalho)"""
+    line = csv_line if copy_format == 'csv' else text_line
+    return ''.join(line(row) for row in stage_rows(services))
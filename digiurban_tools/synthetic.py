@@ -0,0 +1,152 @@
+"""
+Geração de seeds sintéticos para benchmarks
+
+Produz serviços com o mesmo formato de health.seed.ts (formSchema com
+citizenFields e fields, labels acentuados, patterns com escapes, options
+em linha) em qualquer quantidade, de forma determinística pela semente.
+
+- source_text():  arquivo consolidado no formato de
+                  services-simplified-complete.ts (const XXX_SERVICES)
+- seed_text():    seed modular de um departamento (export const ...)
+"""
+
+import random
+
+from digiurban_tools.departments import DEPARTMENTS
+
+CITIZEN_FIELDS = [
+    'citizen_name', 'citizen_cpf', 'citizen_rg', 'citizen_birthdate',
+    'citizen_email', 'citizen_phone', 'citizen_phonesecondary', 'citizen_zipcode',
+    'citizen_address', 'citizen_addressnumber', 'citizen_addresscomplement',
+    'citizen_neighborhood', 'citizen_mothername', 'citizen_maritalstatus',
+    'citizen_occupation', 'citizen_familyincome',
+]
+
+_ACTIONS = ['Solicitação de', 'Cadastro de', 'Agendamento de', 'Inscrição em',
+            'Renovação de', 'Emissão de', 'Vistoria de', 'Atendimento de']
+_SUBJECTS = ['Licença', 'Programa Municipal', 'Consulta', 'Benefício', 'Autorização',
+             'Alvará', 'Oficina', 'Manutenção', 'Poda de Árvore', 'Transporte',
+             'Evento', 'Certidão', 'Reforma', 'Vacinação', 'Matrícula']
+_QUALIFIERS = ['Especial', 'Comunitária', 'Rural', 'Urbana', 'Emergencial',
+               'Preventiva', 'Escolar', 'Ambiental', 'Cultural', 'Esportiva']
+_CATEGORIES = ['Atendimento', 'Cadastro', 'Licenciamento', 'Programas', 'Eventos', 'Infraestrutura']
+_ICONS = ['Activity', 'FileText', 'Calendar', 'Home', 'Leaf', 'Shield', 'Truck', 'Users']
+_COLORS = ['#10b981', '#3b82f6', '#f59e0b', '#ef4444', '#8b5cf6', '#06b6d4']
+
+# (id, label, tipo, extras)
+_FIELD_POOL = [
+    ('cartaoSUS', 'Cartão SUS (CNS)', 'text', {'pattern': '^\\d{15}$', 'minLength': 15, 'maxLength': 15}),
+    ('horaAtendimento', 'Hora do Atendimento', 'text', {'pattern': '^([01]\\d|2[0-3]):([0-5]\\d)$'}),
+    ('cepImovel', 'CEP do Imóvel', 'text', {'pattern': '^\\d{5}-?\\d{3}$', 'maxLength': 9}),
+    ('cpfResponsavel', 'CPF do Responsável', 'text', {'pattern': '^\\d{3}\\.?\\d{3}\\.?\\d{3}-?\\d{2}$'}),
+    ('placaVeiculo', 'Placa do Veículo', 'text', {'pattern': '^[A-Z]{3}-?\\d[A-Z0-9]\\d{2}$'}),
+    ('pontoReferencia', 'Ponto de Referência (opcional)', 'text', {'maxLength': 200}),
+    ('descricao', 'Descrição da Solicitação', 'textarea', {'minLength': 10, 'maxLength': 2000}),
+    ('observacoes', 'Observações', 'textarea', {'maxLength': 1000}),
+    ('dataPreferencial', 'Data Preferencial', 'date', {}),
+    ('quantidade', 'Quantidade', 'number', {'min': 1, 'max': 999}),
+    ('areaHectares', 'Área (hectares)', 'number', {'min': 0}),
+    ('unidade', 'Unidade de Atendimento', 'select', {'enumSource': 'MS_UNIDADES_SAUDE'}),
+    ('turno', 'Turno', 'select', {'options': ['Manhã', 'Tarde', 'Noite']}),
+    ('tipoImovel', 'Tipo de Imóvel', 'select', {'options': ['Residencial', 'Comercial', 'Rural', "Terreno 'baldio'"]}),
+    ('possuiDeficiencia', 'Possui Deficiência?', 'checkbox', {}),
+    ('comprovante', 'Comprovante de Residência', 'file', {}),
+]
+
+
+def _ts_string(value):
+    return "'" + value.replace('\\', '\\\\').replace("'", "\\'") + "'"
+
+
+def _is_scalar(value):
+    return value is None or isinstance(value, (bool, int, float, str))
+
+
+def to_ts(value, indent=0):
+    """Literal TS no estilo dos seeds (aspas simples, 2 espaços, arrays de escalares em linha)"""
+    pad = '  ' * indent
+    inner = '  ' * (indent + 1)
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, str):
+        return _ts_string(value)
+    if isinstance(value, list):
+        if not value:
+            return '[]'
+        if all(_is_scalar(v) for v in value) and len(value) <= 10:
+            return '[' + ', '.join(to_ts(v) for v in value) + ']'
+        return '[\n' + ',\n'.join(inner + to_ts(v, indent + 1) for v in value) + '\n' + pad + ']'
+    items = ',\n'.join(f'{inner}{key}: {to_ts(v, indent + 1)}' for key, v in value.items())
+    return '{\n' + items + '\n' + pad + '}'
+
+
+def service_definition(department, number, rng):
+    """Definição (dict) de um serviço sintético"""
+    name = f"{rng.choice(_ACTIONS)} {rng.choice(_SUBJECTS)} {rng.choice(_QUALIFIERS)} nº {number}"
+    fields = []
+    for field_id, label, field_type, extras in rng.sample(_FIELD_POOL, rng.randint(3, 9)):
+        field = {'id': field_id, 'label': label, 'type': field_type}
+        field.update(extras)
+        field['required'] = rng.random() < 0.5
+        fields.append(field)
+
+    definition = {
+        'name': name,
+        'description': f"{name} junto à Secretaria de {department.name}",
+        'departmentCode': department.code,
+        'serviceType': 'COM_DADOS' if rng.random() < 0.8 else 'SEM_DADOS',
+        'moduleType': f"{department.code}_SVC_{number}" if rng.random() < 0.5 else None,
+        'requiresDocuments': rng.random() < 0.4,
+        'estimatedDays': rng.choice([1, 3, 5, 10, 15, 30, None]),
+        'priority': rng.randint(1, 5),
+        'category': rng.choice(_CATEGORIES),
+        'icon': rng.choice(_ICONS),
+        'color': rng.choice(_COLORS),
+        'formSchema': {
+            'citizenFields': CITIZEN_FIELDS[:rng.randint(4, len(CITIZEN_FIELDS))],
+            'fields': fields,
+        },
+    }
+    if definition['requiresDocuments']:
+        definition['requiredDocuments'] = ['RG', 'CPF', 'Comprovante de residência']
+    return definition
+
+
+def department_services(department, count, seed=0):
+    """Textos TS dos `count` serviços de um departamento (indentados para o array)"""
+    rng = random.Random(f'{seed}:{department.code}')
+    return ['  ' + to_ts(service_definition(department, n, rng), 1) for n in range(1, count + 1)]
+
+
+def _array(declaration, services):
+    body = ',\n'.join(services)
+    return f"{declaration}: ServiceDefinition[] = [\n{body}\n];\n"
+
+
+def source_text(sections):
+    """Arquivo consolidado com uma const XXX_SERVICES por (departamento, serviços)"""
+    parts = [
+        '/**\n * SERVIÇOS SIMPLIFICADOS - CATÁLOGO SINTÉTICO (benchmark)\n */\n\n'
+        "import { ServiceDefinition } from './services/types';\n"
+    ]
+    for department, services in sections:
+        parts.append('\n' + _array(f'const {department.sections[0]}', services))
+    return ''.join(parts)
+
+
+def seed_text(department, services):
+    """Seed modular (mesmo cabeçalho do extract-services.py)"""
+    header = (
+        f"/**\n * SEED DE SERVIÇOS - SECRETARIA DE {department.name.upper()}\n"
+        f" * Total: {len(services)} serviços\n */\n\n"
+        "import { ServiceDefinition } from './types';\n\n"
+    )
+    return header + _array(f'export const {department.export}', services)
+
+
+def select_departments(count):
+    return DEPARTMENTS[:count]
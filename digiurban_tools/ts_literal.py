@@ -0,0 +1,160 @@
+"""
+Avaliador de literais TypeScript (objetos, arrays, strings, números)
+
+Converte o texto de um objeto de serviço no dict Python equivalente. Só
+aceita literais: spreads, chamadas, templates com ${...} e referências a
+constantes fora de `constants` (ex.: os fragmentos de shared-fragments.ts)
+geram LiteralError com a linha do problema.
+"""
+
+import copy
+
+from digiurban_tools.seed_lexer import SeedLexError, tokenize, unquote
+
+UNDEFINED = object()
+
+_KEYWORDS = {'true': True, 'false': False, 'null': None, 'undefined': UNDEFINED}
+
+
+class LiteralError(SeedLexError):
+    """Construção que não é um literal puro"""
+
+
+class _Parser:
+    def __init__(self, code, first_line, constants):
+        self.code = code
+        self.tokens = tokenize(code)
+        self.pos = 0
+        self.first_line = first_line
+        self.constants = constants or {}
+
+    def _line(self, offset):
+        return self.first_line + self.code.count('\n', 0, offset)
+
+    def _error(self, message, token=None):
+        if token is None:
+            token = self.tokens[self.pos] if self.pos < len(self.tokens) else self.tokens[-1]
+        raise LiteralError(f'{message} (linha {self._line(token[1])})')
+
+    def _text(self, token):
+        return self.code[token[1]:token[2]]
+
+    def _peek(self):
+        if self.pos >= len(self.tokens):
+            self._error('fim inesperado do literal')
+        return self.tokens[self.pos]
+
+    def _expect(self, value):
+        token = self._peek()
+        if self._text(token) != value:
+            self._error(f"esperado '{value}', encontrado '{self._text(token)}'")
+        self.pos += 1
+
+    def _accept(self, value):
+        if self.pos < len(self.tokens) and self._text(self.tokens[self.pos]) == value:
+            self.pos += 1
+            return True
+        return False
+
+    def value(self):
+        token = self._peek()
+        kind = token[0]
+        text = self._text(token)
+
+        if text == '{':
+            result = self._object()
+        elif text == '[':
+            result = self._array()
+        elif kind == 'string':
+            self.pos += 1
+            result = unquote(text)
+        elif kind == 'template':
+            if '${' in text:
+                self._error('template literal com ${...} nao suportado', token)
+            self.pos += 1
+            result = unquote(text)
+        elif kind == 'number':
+            self.pos += 1
+            result = _number(text)
+        elif text == '-' and self.pos + 1 < len(self.tokens) and self.tokens[self.pos + 1][0] == 'number':
+            self.pos += 2
+            result = -_number(self._text(self.tokens[self.pos - 1]))
+        elif kind == 'ident' and text in _KEYWORDS:
+            self.pos += 1
+            result = _KEYWORDS[text]
+        elif kind == 'ident' and text in self.constants:
+            self.pos += 1
+            # Cópia: quem usa o dict pode alterá-lo sem afetar outros serviços
+            result = copy.deepcopy(self.constants[text])
+        elif kind == 'ident':
+            self._error(f"referencia '{text}' nao e um literal", token)
+        else:
+            self._error(f"token inesperado '{text}'", token)
+
+        # `as const` / `as Tipo` não alteram o valor
+        while self.pos < len(self.tokens) and self._text(self.tokens[self.pos]) == 'as':
+            self.pos += 2
+            while self._accept('['):
+                self._expect(']')
+        return result
+
+    def _object(self):
+        self._expect('{')
+        result = {}
+        while not self._accept('}'):
+            token = self._peek()
+            kind, text = token[0], self._text(token)
+            if text == '...':
+                self._error('spread em objeto nao suportado', token)
+            if kind == 'ident':
+                key = text
+            elif kind == 'string':
+                key = unquote(text)
+            elif kind == 'number':
+                key = text
+            else:
+                self._error(f"chave invalida '{text}'", token)
+            self.pos += 1
+            if self._text(self._peek()) != ':':
+                self._error(f"propriedade '{key}' sem valor (shorthand nao suportado)", token)
+            self.pos += 1
+            value = self.value()
+            if value is not UNDEFINED:
+                result[key] = value
+            if not self._accept(','):
+                self._expect('}')
+                break
+        return result
+
+    def _array(self):
+        self._expect('[')
+        result = []
+        while not self._accept(']'):
+            if self._text(self._peek()) == '...':
+                self._error('spread em array nao suportado')
+            value = self.value()
+            result.append(None if value is UNDEFINED else value)
+            if not self._accept(','):
+                self._expect(']')
+                break
+        return result
+
+
+def _number(text):
+    text = text.replace('_', '').rstrip('n')
+    if text[:2].lower() in ('0x', '0b', '0o'):
+        return int(text, 0)
+    if any(c in text for c in '.eE'):
+        return float(text)
+    return int(text)
+
+
+def evaluate(code, first_line=1, constants=None):
+    """Valor Python do literal em code (um único objeto/array/valor)"""
+    parser = _Parser(code, first_line, constants)
+    if not parser.tokens:
+        raise LiteralError('literal vazio')
+    result = parser.value()
+    if parser.pos != len(parser.tokens):
+        parser._error('conteudo extra depois do literal')
+    return result
@@ -0,0 +1,47 @@
+"""
+Polling de arquivos só por stat, sem serviços externos de file watching
+
+StatPoller guarda (tamanho, mtime_ns) de cada caminho e changed() devolve
+os que mudaram desde a última chamada (inclusive criados e removidos).
+Com uma dúzia de arquivos cada rodada custa alguns microssegundos, então
+dá para consultar a cada 50 ms sem carga perceptível.
+"""
+
+import os
+import time
+
+
+def _stat(path):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+class StatPoller:
+    def __init__(self, paths):
+        self.paths = list(paths)
+        self._stats = {path: _stat(path) for path in self.paths}
+
+    def changed(self):
+        changed = []
+        for path in self.paths:
+            current = _stat(path)
+            if current != self._stats[path]:
+                self._stats[path] = current
+                changed.append(path)
+        return changed
+
+
+def watch(paths, on_change, interval=0.05):
+    """Chama on_change(caminhos alterados) a cada mudança, até Ctrl+C"""
+    poller = StatPoller(paths)
+    try:
+        while True:
+            changed = poller.changed()
+            if changed:
+                on_change(changed)
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+"""
+Gera o script SQL de upsert em lote do catálogo de serviços
+
+Mantido por compatibilidade; equivale a `python -m digiurban_tools upsert-sql`.
+"""
+
+import sys
+
+from digiurban_tools.cli import main
+
+if __name__ == '__main__':
+    sys.exit(main(['upsert-sql'] + sys.argv[1:]))